@@ -5,11 +5,11 @@ A module implementing UI command processing.
 # built-in
 import asyncio
 from collections import UserDict
-from contextlib import ExitStack, contextmanager
+from contextlib import AbstractContextManager, ExitStack, contextmanager
 import logging
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Iterator, Optional, cast
+from typing import Any, Iterator, NamedTuple, Optional, cast
 
 # third-party
 from vcorelib import DEFAULT_ENCODING
@@ -29,6 +29,17 @@ from runtimepy.channel.environment.command.processor import (
     EnvironmentMap,
 )
 from runtimepy.channel.environment.command.result import CommandResult
+from runtimepy.channel.environment.reader import EventLogReader
+from runtimepy.channel.event import EventStream
+from runtimepy.channel.event.block import (
+    DEFAULT_BLOCK_EVENTS,
+    EventBlockWriter,
+)
+from runtimepy.channel.event.index import (
+    DEFAULT_INDEX_EVENTS,
+    DEFAULT_INDEX_PERIOD_S,
+    EventIndexWriter,
+)
 from runtimepy.channel.registry import ParsedEvent
 from runtimepy.mapping import DEFAULT_PATTERN
 
@@ -42,8 +53,33 @@ __all__ = [
     "clear_env",
     "register_env",
     "GlobalEnvironment",
+    "EventOutput",
 ]
 EVENT_OUT = "event_stream.bin"
+EVENT_INDEX_SUFFIX = ".index"
+
+
+def event_index_path(path: str) -> str:
+    """Get the time-index (sidecar) path for an event-stream path."""
+    return path + EVENT_INDEX_SUFFIX
+
+
+class EventOutput(NamedTuple):
+    """Options for event-telemetry file output."""
+
+    # Write a time-index sidecar file (uncompressed output only).
+    time_index: bool = True
+    index_events: int = DEFAULT_INDEX_EVENTS
+    index_period_s: float = DEFAULT_INDEX_PERIOD_S
+
+    # Write events as compressed ('zlib' or 'lzma') blocks.
+    compression: Optional[str] = None
+    block_events: int = DEFAULT_BLOCK_EVENTS
+
+    @property
+    def indexed(self) -> bool:
+        """Determine if output should be indexed."""
+        return self.time_index and not self.compression
 
 
 class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
@@ -58,6 +94,7 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
         super().__init__()
         LoggerMixin.__init__(self)
         self.root: Optional[Path] = root
+        self.meta: JsonObject = {}
 
     @staticmethod
     def from_root(root: Path) -> "GlobalEnvironment":
@@ -69,6 +106,7 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
         data = ARBITER.decode(
             GlobalEnvironment.meta_path(root), require_success=True
         ).data
+        result.meta = data
 
         # Log path and duration.
         duration_ns = cast(int, data["end_ns"]) - cast(int, data["start_ns"])
@@ -105,14 +143,50 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
         pattern: str = DEFAULT_PATTERN,
         path: str = EVENT_OUT,
         exact: bool = False,
+        output: EventOutput = None,
     ) -> Iterator[list[str]]:
-        """Enable event streaming to a file for an environment by name."""
+        """
+        Enable event streaming to a file for an environment by name
+        (optionally with a time-index sidecar file, or as compressed blocks).
+        """
+
+        if output is None:
+            output = EventOutput()
+
+        out = self.export(env)
+        channels = self[env].env.channels
+
+        with ExitStack() as stack:
+            path_fd = stack.enter_context(out.joinpath(path).open("wb"))
+
+            stream: EventStream = path_fd
+            if output.compression:
+                stream = EventBlockWriter(
+                    path_fd,
+                    byte_order=channels.event_header.byte_order,
+                    compression=output.compression,
+                    events=output.block_events,
+                )
 
-        with self.export(env).joinpath(path).open("wb") as path_fd:
-            with self[env].env.channels.registered(
-                path_fd, pattern=pattern, exact=exact
-            ) as chans:
-                yield chans
+                # Write the final (partial) block after de-registering.
+                stack.callback(stream.write_block)
+
+            writer = None
+            if output.indexed:
+                writer = EventIndexWriter(
+                    stack.enter_context(
+                        out.joinpath(event_index_path(path)).open("wb")
+                    ),
+                    byte_order=channels.event_header.byte_order,
+                    events=output.index_events,
+                    period_s=output.index_period_s,
+                )
+
+            yield stack.enter_context(
+                channels.registered(
+                    stream, pattern=pattern, exact=exact, index=writer
+                )
+            )
 
     def read_event_stream(
         self, env: str, path: str = EVENT_OUT
@@ -120,7 +194,29 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
         """Reade events from a specific environment."""
 
         with self.valid_root.joinpath(env, path).open("rb") as path_fd:
-            yield from self[env].env.parse_event_stream(path_fd)
+            if self.meta.get("event_compression"):
+                yield from self[env].env.parse_event_blocks(path_fd)
+            else:
+                yield from self[env].env.parse_event_stream(path_fd)
+
+    def event_log(
+        self, env: str, path: str = EVENT_OUT
+    ) -> AbstractContextManager[EventLogReader]:
+        """
+        Get a columnar (per-channel) reader for a specific environment (using
+        a time index if one was recorded).
+        """
+
+        assert not self.meta.get(
+            "event_compression"
+        ), "Compressed events can only be streamed!"
+
+        root = self.valid_root.joinpath(env)
+        return EventLogReader.open(
+            self[env].env,
+            root.joinpath(path),
+            index=root.joinpath(event_index_path(path)),
+        )
 
     def export(self, env: str) -> Path:
         """Export an environment to a sub-directory of the root directory."""
@@ -174,9 +270,13 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
         channel_exact: bool = False,
         event_path: str = EVENT_OUT,
         text_log: bool = True,
+        output: EventOutput = None,
     ) -> Iterator[list[tuple[str, list[str]]]]:
         """Register file-output streams for environments based on a pattern."""
 
+        if output is None:
+            output = EventOutput()
+
         metadata: JsonObject = {
             "root": str(self.valid_root),
             "env_pattern": env_pattern,
@@ -184,6 +284,10 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
             "channel_pattern": channel_pattern,
             "channel_exact": channel_exact,
             "event_path": event_path,
+            "event_index": (
+                event_index_path(event_path) if output.indexed else None
+            ),
+            "event_compression": output.compression,
             "text_log": text_log,
         }
 
@@ -200,6 +304,7 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
                         pattern=channel_pattern,
                         path=event_path,
                         exact=channel_exact,
+                        output=output,
                     )
                 )
                 name_channels.append((name, chans))
@@ -242,6 +347,18 @@ class GlobalEnvironment(UserDict[str, ChannelCommandProcessor], LoggerMixin):
             self[name] = env
             self.logger.debug("Registered channel environment '%s'.", name)
 
+    @property
+    def fingerprint(self) -> tuple[tuple[str, int, bool], ...]:
+        """
+        Get a value that changes when environments are registered, cleared
+        or finalized (e.g. for invalidating rendered content).
+        """
+
+        return tuple(
+            (name, id(cmd.env), cmd.env.finalized)
+            for name, cmd in self.items()
+        )
+
 
 GLOBAL = GlobalEnvironment()
 ENVIRONMENTS = GLOBAL
@@ -0,0 +1,282 @@
+"""
+A module implementing a columnar reader for recorded channel events.
+"""
+
+# built-in
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import Struct
+from typing import Any, Iterator, NamedTuple, Optional, Union
+
+# third-party
+from vcorelib.io import BinaryMessage
+
+# internal
+from runtimepy.channel.environment.telemetry import (
+    TelemetryChannelEnvironment,
+)
+from runtimepy.channel.event.header import IdType
+from runtimepy.channel.event.index import EventIndexEntry, read_event_index
+from runtimepy.channel.registry import ParsedEvent
+from runtimepy.primitives.types import AnyPrimitiveType
+from runtimepy.primitives.types.base import PythonPrimitive
+
+EventData = Union[BinaryMessage, mmap]
+
+# Candidate array type codes for integer values (by size and signedness).
+INTEGER_CODES = "bBhHiIlLqQ"
+
+
+def array_code(kind: AnyPrimitiveType) -> str:
+    """Get an array type code suitable for storing a primitive type."""
+
+    if kind.is_float:
+        return "d" if kind.size > 4 else "f"
+
+    signed = kind.signed and not kind.is_boolean
+    for code in INTEGER_CODES:
+        if array(code).itemsize == kind.size and code.islower() == signed:
+            return code
+
+    raise ValueError(f"No array type for '{kind}'!")
+
+
+class ChannelEvents(NamedTuple):
+    """Columnar timestamps and values for a single channel."""
+
+    timestamps: array[int]
+    values: array[Any]
+
+    def __len__(self) -> int:
+        """Get the number of events."""
+        return len(self.timestamps)
+
+
+class EventLogReader:
+    """
+    A class for reading per-channel events from recorded event telemetry.
+    Record offsets are indexed by channel in a single pass (on first use) so
+    that individual channels can be loaded without decoding any others.
+
+    An optional time index (checkpoints written while recording) allows
+    seeking to a point in time without scanning from the beginning. Seeking
+    assumes that events were recorded in (non-decreasing) time order.
+    """
+
+    def __init__(
+        self,
+        env: TelemetryChannelEnvironment,
+        data: EventData,
+        checkpoints: list[EventIndexEntry] = None,
+    ) -> None:
+        """Initialize this instance."""
+
+        self.env = env
+        self.data = data
+
+        header = env.channels.event_header
+        self.byte_order = header.byte_order
+        self.header = Struct(self.byte_order.fmt + IdType.kind.format + "Q")
+
+        # Per-channel names and value codecs.
+        self.resolved: dict[int, tuple[str, Struct]] = {}
+
+        # Per-channel timestamps and value offsets.
+        self.timestamps: dict[int, array[int]] = {}
+        self.offsets: dict[int, array[int]] = {}
+
+        # The offset of the first incomplete record (if any), once indexed.
+        self.end: Optional[int] = None
+
+        self.checkpoints = checkpoints or []
+        self.checkpoint_times = [x.timestamp_ns for x in self.checkpoints]
+
+    def _resolve(self, ident: int) -> tuple[str, Struct]:
+        """Get the name and value codec for a channel identifier."""
+
+        result = self.resolved.get(ident)
+        if result is None:
+            name = self.env.channels.names.name(ident)
+            assert name is not None, ident
+
+            result = (
+                name,
+                Struct(self.byte_order.fmt + self.env.event_kind(name).format),
+            )
+            self.resolved[ident] = result
+
+        return result
+
+    def _records(self, offset: int) -> Iterator[tuple[int, int, int, Struct]]:
+        """
+        Iterate over complete records (identifier, timestamp, value offset
+        and value codec) starting at an offset.
+        """
+
+        data = self.data
+        data_len = len(data)
+        header = self.header
+
+        while offset + header.size <= data_len:
+            ident, timestamp_ns = header.unpack_from(data, offset)
+
+            codec = self._resolve(ident)[1]
+            value_offset = offset + header.size
+            offset = value_offset + codec.size
+            if offset > data_len:
+                break
+
+            yield ident, timestamp_ns, value_offset, codec
+
+    def index(self) -> int:
+        """Index all records (if necessary) and return the end offset."""
+
+        if self.end is None:
+            end = 0
+            for ident, timestamp_ns, value_offset, codec in self._records(0):
+                if ident not in self.timestamps:
+                    self.timestamps[ident] = array("Q")
+                    self.offsets[ident] = array("Q")
+
+                self.timestamps[ident].append(timestamp_ns)
+                self.offsets[ident].append(value_offset)
+                end = value_offset + codec.size
+
+            self.end = end
+
+        return self.end
+
+    @property
+    def names(self) -> list[str]:
+        """Get the names of channels with recorded events."""
+
+        self.index()
+        return [self._resolve(x)[0] for x in self.timestamps]
+
+    def channel(
+        self, name: str, start_ns: int = None, end_ns: int = None
+    ) -> ChannelEvents:
+        """
+        Get timestamps and values for a channel, optionally only within a
+        (closed) time window. Timestamps are assumed to be non-decreasing for
+        any individual channel.
+        """
+
+        self.index()
+
+        kind = self.env.event_kind(name)
+        result = ChannelEvents(array("Q"), array(array_code(kind)))
+
+        ident = self.env.channels.names.identifier(name)
+        if ident is not None and ident in self.timestamps:
+            timestamps = self.timestamps[ident]
+
+            start = (
+                0 if start_ns is None else bisect_left(timestamps, start_ns)
+            )
+            end = (
+                len(timestamps)
+                if end_ns is None
+                else bisect_right(timestamps, end_ns)
+            )
+
+            codec = self._resolve(ident)[1]
+            data = self.data
+            result.timestamps.extend(timestamps[start:end])
+            result.values.extend(
+                codec.unpack_from(data, x)[0]
+                for x in self.offsets[ident][start:end]
+            )
+
+        return result
+
+    def state_at(self, timestamp_ns: int) -> dict[str, PythonPrimitive]:
+        """
+        Reconstruct the last-known value of every channel (with recorded
+        events) at a point in time.
+        """
+
+        values: dict[int, PythonPrimitive] = {}
+        offset = 0
+
+        # Start from the latest checkpoint at (or before) the requested time.
+        idx = bisect_right(self.checkpoint_times, timestamp_ns)
+        if idx:
+            checkpoint = self.checkpoints[idx - 1]
+            values.update(checkpoint.values)
+            offset = checkpoint.offset
+
+        data = self.data
+        for ident, event_ns, value_offset, codec in self._records(offset):
+            if event_ns > timestamp_ns:
+                break
+            values[ident] = codec.unpack_from(data, value_offset)[0]
+
+        return {self._resolve(x)[0]: y for x, y in values.items()}
+
+    def replay(
+        self, start_ns: int = None, end_ns: int = None
+    ) -> Iterator[ParsedEvent]:
+        """Iterate over all events within a (closed) time window."""
+
+        offset = 0
+
+        # Start from the latest checkpoint before the requested time.
+        if start_ns is not None:
+            idx = bisect_left(self.checkpoint_times, start_ns)
+            if idx:
+                offset = self.checkpoints[idx - 1].offset
+
+        data = self.data
+        for ident, event_ns, value_offset, codec in self._records(offset):
+            if end_ns is not None and event_ns > end_ns:
+                break
+
+            if start_ns is None or event_ns >= start_ns:
+                yield ParsedEvent(
+                    self._resolve(ident)[0],
+                    event_ns,
+                    codec.unpack_from(data, value_offset)[0],
+                )
+
+    @staticmethod
+    def read_index(
+        env: TelemetryChannelEnvironment, data: bytes
+    ) -> list[EventIndexEntry]:
+        """Parse time-index checkpoints for an environment's event stream."""
+
+        def kind(ident: int) -> AnyPrimitiveType:
+            """Get the primitive type for a channel identifier."""
+
+            name = env.channels.names.name(ident)
+            assert name is not None, ident
+            return env.event_kind(name)
+
+        return read_event_index(
+            data, kind, byte_order=env.channels.event_header.byte_order
+        )
+
+    @staticmethod
+    @contextmanager
+    def open(
+        env: TelemetryChannelEnvironment, path: Path, index: Path = None
+    ) -> Iterator["EventLogReader"]:
+        """
+        Memory-map an event file (and load an optional time index) and create
+        a reader for it.
+        """
+
+        checkpoints = None
+        if index is not None and index.is_file():
+            checkpoints = EventLogReader.read_index(env, index.read_bytes())
+
+        with path.open("rb") as path_fd:
+            # Empty files can't be memory mapped.
+            if path.stat().st_size == 0:
+                yield EventLogReader(env, bytes(), checkpoints=checkpoints)
+            else:
+                with mmap(path_fd.fileno(), 0, access=ACCESS_READ) as data:
+                    yield EventLogReader(env, data, checkpoints=checkpoints)
@@ -4,7 +4,8 @@ A module implementing channel-environment telemetry registration.
 
 # built-in
 from contextlib import ExitStack, contextmanager
-from typing import BinaryIO, Iterator, Optional, cast
+from struct import Struct
+from typing import Any, BinaryIO, Iterator, cast
 
 # third-party
 from vcorelib.names import name_search
@@ -13,10 +14,17 @@ from vcorelib.names import name_search
 from runtimepy.channel.environment.base import (
     BaseChannelEnvironment as _BaseChannelEnvironment,
 )
-from runtimepy.channel.event import PrimitiveEvent
+from runtimepy.channel.event import EventStream, PrimitiveEvent
+from runtimepy.channel.event.block import read_event_blocks
+from runtimepy.channel.event.header import event_header_codec
+from runtimepy.channel.event.index import EventIndexWriter
+from runtimepy.channel.event.ring import EventRing, event_value_codec
+from runtimepy.channel.event.shared import SharedValues
 from runtimepy.channel.registry import ParsedEvent
 from runtimepy.mapping import DEFAULT_PATTERN
 from runtimepy.metrics.channel import ChannelMetrics
+from runtimepy.primitives import Primitive
+from runtimepy.primitives.types import AnyPrimitiveType
 
 
 class TelemetryChannelEnvironment(_BaseChannelEnvironment):
@@ -27,11 +35,12 @@ class TelemetryChannelEnvironment(_BaseChannelEnvironment):
     @contextmanager
     def registered(
         self,
-        stream: BinaryIO,
+        stream: EventStream,
         pattern: str = DEFAULT_PATTERN,
         exact: bool = False,
         flush: bool = False,
         channel: ChannelMetrics = None,
+        index: EventIndexWriter = None,
     ) -> Iterator[list[str]]:
         """
         Register a stream as a managed context. Returns a list of all channels
@@ -57,7 +66,11 @@ class TelemetryChannelEnvironment(_BaseChannelEnvironment):
             for event in events:
                 stack.enter_context(
                     event.registered(
-                        stream, flush=flush, channel=channel, force=True
+                        stream,
+                        flush=flush,
+                        channel=channel,
+                        force=True,
+                        index=index,
                     )
                 )
 
@@ -69,11 +82,159 @@ class TelemetryChannelEnvironment(_BaseChannelEnvironment):
                     exact=exact,
                     flush=flush,
                     channel=channel,
+                    index=index,
                 )
             )
 
             yield names
 
+    def event_kind(self, name: str) -> AnyPrimitiveType:
+        """Get the primitive type of events for a channel or bit-field."""
+
+        if self.fields.has_field(name):
+            return self.fields[name].raw.kind
+        return self.channels[name].type
+
+    def _ring_sources(
+        self, pattern: str = DEFAULT_PATTERN, exact: bool = False
+    ) -> Iterator[tuple[str, int, Primitive[Any]]]:
+        """Get names, identifiers and primitives for ring-buffer events."""
+
+        for fields in self.fields.fields:
+            for name in name_search(fields.fields, pattern, exact=exact):
+                ident = self.channels.names.identifier(name)
+                assert ident is not None, name
+                yield name, ident, fields.fields[name].raw
+
+        for name, chan in self.channels.search(pattern, exact=exact):
+            yield name, chan.id, chan.raw
+
+    @contextmanager
+    def registered_ring(
+        self,
+        ring: EventRing,
+        pattern: str = DEFAULT_PATTERN,
+        exact: bool = False,
+    ) -> Iterator[list[str]]:
+        """
+        Register a ring buffer as an event sink as a managed context. Returns
+        a list of all channels registered.
+        """
+
+        names: list[str] = []
+
+        with ExitStack() as stack:
+            for name, ident, raw in self._ring_sources(pattern, exact=exact):
+                codec = event_value_codec(raw.kind)
+
+                def callback(
+                    _: Any,
+                    new: Any,
+                    ident: int = ident,
+                    raw: Primitive[Any] = raw,
+                    codec: Struct = codec,
+                ) -> None:
+                    """Emit a change event to the ring."""
+                    ring.append(ident, raw.last_updated_ns, codec, new)
+
+                # Emit the current value immediately.
+                ring.append(ident, raw.last_updated_ns, codec, raw.value)
+
+                stack.enter_context(raw.callback(callback))
+                names.append(name)
+
+            yield names
+
+    def parse_event_ring(
+        self, ring: EventRing, limit: int = None
+    ) -> Iterator[ParsedEvent]:
+        """Consume (up to a limit of) events from a ring buffer."""
+
+        batch = ring.consume(limit=limit)
+
+        # Resolve names and value codecs once per identifier.
+        resolved: dict[int, tuple[str, Struct]] = {}
+
+        for idx, (ident, timestamp_ns) in enumerate(
+            zip(batch.identifiers, batch.timestamps)
+        ):
+            item = resolved.get(ident)
+            if item is None:
+                name = self.channels.names.name(ident)
+                assert name is not None, ident
+                item = name, event_value_codec(self.event_kind(name))
+                resolved[ident] = item
+
+            yield ParsedEvent(item[0], timestamp_ns, batch.value(idx, item[1]))
+
+    def _shared_sources(self) -> list[tuple[str, int, Primitive[Any]]]:
+        """
+        Get names, identifiers and primitives for shared-memory values (bit
+        fields that share an underlying primitive share a value).
+        """
+
+        firsts = {next(iter(x.fields)) for x in self.fields.fields if x.fields}
+
+        return sorted(
+            (
+                x
+                for x in self._ring_sources()
+                if x[0] in firsts or not self.fields.has_field(x[0])
+            ),
+            key=lambda x: x[1],
+        )
+
+    @contextmanager
+    def shared_values(self, name: str = None) -> Iterator[SharedValues]:
+        """
+        Create (or attach to an existing, if a name is provided) shared-memory
+        segment for this environment's values as a managed context.
+        """
+
+        sources = self._shared_sources()
+        shared = SharedValues(
+            [x[0] for x in sources], [x[2].kind.format for x in sources], name
+        )
+        try:
+            yield shared
+        finally:
+            shared.close()
+
+    @contextmanager
+    def registered_shared(self, shared: SharedValues) -> Iterator[list[str]]:
+        """
+        Register shared-memory value storage (as its writer) as a managed
+        context. Returns a list of all channels registered.
+        """
+
+        sources = self._shared_sources()
+        assert [x[0] for x in sources] == shared.names
+
+        with ExitStack() as stack:
+            for index, (_, _, raw) in enumerate(sources):
+
+                def callback(_: Any, new: Any, index: int = index) -> None:
+                    """Write the new value to shared memory."""
+                    shared.write(index, new)
+
+                # Write the current value immediately.
+                shared.write(index, raw.value)
+
+                stack.enter_context(raw.callback(callback))
+
+            yield shared.names
+
+    def ingest_shared(self, shared: SharedValues) -> int:
+        """
+        Update values that changed in shared memory. Returns the number of
+        values updated.
+        """
+
+        updates = shared.updates()
+        for name, value in updates:
+            self.ingest(ParsedEvent(name, 0, value))
+        return len(updates)
+
     def ingest(self, point: ParsedEvent) -> None:
         """
         Update internal state based on an event. Note that the event timestamp
@@ -85,91 +246,80 @@ class TelemetryChannelEnvironment(_BaseChannelEnvironment):
         else:
             self.set(point.name, point.value)
 
-    def _parse_channel_event(self, name: str) -> Optional[ParsedEvent]:
-        """Attempt to parse a channel event from the fifo."""
-
-        result = None
-        channels = self.channels
-
-        kind = channels[name].type
-        data = channels.event_fifo.pop(kind.size)
-        if data is not None:
-            result = ParsedEvent(
-                name,
-                cast(int, channels.event_header["timestamp"]),
-                kind.decode(
-                    data,
-                    byte_order=channels.event_header.byte_order,
-                ),
-            )
-
-        return result
-
-    def _parse_field_event(self, name: str) -> Optional[ParsedEvent]:
-        """Attempt to parse a bit-field event from the fifo."""
+    def parse_event_blocks(self, stream: BinaryIO) -> Iterator[ParsedEvent]:
+        """Parse individual events from a stream of compressed blocks."""
 
-        result = None
+        byte_order = self.channels.event_header.byte_order
 
-        field = self.fields[name]
+        # Resolve names and value codecs once per identifier.
+        resolved: dict[int, tuple[str, Struct]] = {}
 
-        kind = field.raw.kind
-        data = self.channels.event_fifo.pop(kind.size)
-        if data is not None:
-            result = ParsedEvent(
-                name,
-                cast(int, self.channels.event_header["timestamp"]),
-                kind.decode(
-                    data,
-                    byte_order=self.channels.event_header.byte_order,
-                ),
-            )
+        for block in read_event_blocks(stream, byte_order=byte_order):
+            offset = 0
+            for ident, timestamp_ns in zip(
+                block.identifiers, block.timestamps
+            ):
+                item = resolved.get(ident)
+                if item is None:
+                    name = self.channels.names.name(ident)
+                    assert name is not None, ident
+                    item = name, Struct(
+                        byte_order.fmt + self.event_kind(name).format
+                    )
+                    resolved[ident] = item
 
-        return result
+                yield ParsedEvent(
+                    item[0],
+                    timestamp_ns,
+                    item[1].unpack_from(block.values, offset)[0],
+                )
+                offset += item[1].size
 
-    def parse_event_stream(self, stream: BinaryIO) -> Iterator[ParsedEvent]:
-        """Parse individual events from a stream."""
+    def parse_event_data(self, data: bytes) -> Iterator[ParsedEvent]:
+        """
+        Parse individual events from stream data. Trailing partial events are
+        retained and completed by subsequent calls.
+        """
 
-        channels = self.channels
+        fifo = self.channels.event_fifo
+        byte_order = self.channels.event_header.byte_order
+        header = event_header_codec(byte_order)
 
-        # Ingest stream.
-        channels.event_fifo.ingest(stream.read())
+        # Parse retained data and new data from a single buffer.
+        if fifo.size:
+            data = cast(bytes, fifo.pop(fifo.size)) + data
 
-        ident = -1
-        name = ""
+        # Resolve names and value codecs once per identifier.
+        resolved: dict[int, tuple[str, Struct]] = {}
 
-        keep_going = True
-        while keep_going:
-            keep_going = False
+        size = len(data)
+        offset = 0
 
-            # Read header.
-            if not channels.header_ready:
-                read_size = channels.event_header.size
-                data = channels.event_fifo.pop(read_size)
-                if data is not None:
-                    channels.event_header.update(data)
+        # Retain unparsed data even if parsing stops early (or fails).
+        try:
+            while size - offset >= header.size:
+                ident, timestamp_ns = header.unpack_from(data, offset)
 
-                    # Update local variables.
-                    ident = cast(int, channels.event_header["identifier"])
-                    name = channels.names.name(ident)  # type: ignore
+                item = resolved.get(ident)
+                if item is None:
+                    name = self.channels.names.name(ident)
                     assert name is not None, ident
+                    item = name, Struct(
+                        byte_order.fmt + self.event_kind(name).format
+                    )
+                    resolved[ident] = item
 
-                    # Update state.
-                    channels.header_ready = True
-                    keep_going = True
-            else:
-                event = None
-
-                # Handle bit-field.
-                if self.fields.has_field(name):
-                    event = self._parse_field_event(name)
+                end = offset + header.size + item[1].size
+                if end > size:
+                    break
 
-                # Handle channel.
-                elif name in channels.items:
-                    event = self._parse_channel_event(name)
+                value = item[1].unpack_from(data, offset + header.size)[0]
+                offset = end
 
-                if event is not None:
-                    yield event
+                yield ParsedEvent(item[0], timestamp_ns, value)
+        finally:
+            fifo.ingest(data[offset:])
 
-                    # Update state.
-                    channels.header_ready = False
-                    keep_going = True
+    def parse_event_stream(self, stream: BinaryIO) -> Iterator[ParsedEvent]:
+        """Parse individual events from a stream."""
+        yield from self.parse_event_data(stream.read())
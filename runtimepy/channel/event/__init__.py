@@ -4,16 +4,21 @@ A module implementing a channel-event protocol.
 
 # built-in
 from contextlib import contextmanager
-from typing import BinaryIO, Iterator
+from typing import BinaryIO, Iterator, Union
 
 # third-party
 from vcorelib.math import to_nanos
 
 # internal
+from runtimepy.channel.event.block import EventBlockWriter
 from runtimepy.channel.event.header import PrimitiveEventHeader
+from runtimepy.channel.event.index import EventIndexWriter
 from runtimepy.metrics.channel import ChannelMetrics
 from runtimepy.primitives import AnyPrimitive
 
+# Events are written either as raw records or to a compressed block writer.
+EventStream = Union[BinaryIO, EventBlockWriter]
+
 
 class PrimitiveEvent:
     """A class implementing a simple channel-even interface."""
@@ -26,6 +31,7 @@ class PrimitiveEvent:
         """Initialize this instance."""
 
         self.primitive = primitive
+        self.identifier = identifier
         self.header = PrimitiveEventHeader.instance()
         PrimitiveEventHeader.init_header(self.header, identifier)
         self.prev_ns: int = 0
@@ -41,10 +47,11 @@ class PrimitiveEvent:
     @contextmanager
     def registered(
         self,
-        stream: BinaryIO,
+        stream: EventStream,
         flush: bool = False,
         channel: ChannelMetrics = None,
         force: bool = False,
+        index: EventIndexWriter = None,
     ) -> Iterator[None]:
         """Register a stream as a managed context."""
 
@@ -52,12 +59,14 @@ class PrimitiveEvent:
 
         def callback(_, __) -> None:
             """Emit a change event to the stream."""
-            self._poll(stream, flush=flush, channel=channel, force=force)
+            self._poll(
+                stream, flush=flush, channel=channel, force=force, index=index
+            )
 
         # Poll immediately.
         self.prev_ns = 0
 
-        self._poll(stream, flush=flush, channel=channel)
+        self._poll(stream, flush=flush, channel=channel, index=index)
 
         raw = self.primitive
         ident = raw.register_callback(callback)
@@ -69,10 +78,11 @@ class PrimitiveEvent:
 
     def _poll(
         self,
-        stream: BinaryIO,
+        stream: EventStream,
         flush: bool = False,
         channel: ChannelMetrics = None,
         force: bool = False,
+        index: EventIndexWriter = None,
     ) -> int:
         """
         Poll this event so that if the underlying channel has changed since the
@@ -89,12 +99,18 @@ class PrimitiveEvent:
             self.prev_ns = curr_ns
             self.header["timestamp"] = curr_ns
 
-            # Write header then value.
-            array = self.header
-            written += array.to_stream(stream)
-            written += raw.to_stream(stream, byte_order=array.byte_order)
-            if flush:
-                stream.flush()
+            if isinstance(stream, EventBlockWriter):
+                written += stream.event(self.identifier, curr_ns, raw)
+            else:
+                # Write header then value.
+                array = self.header
+                written += array.to_stream(stream)
+                written += raw.to_stream(stream, byte_order=array.byte_order)
+                if flush:
+                    stream.flush()
+
+            if index is not None:
+                index.event(self.identifier, raw, curr_ns, written)
 
         if channel is not None:
             channel.increment(written)
@@ -0,0 +1,204 @@
+"""
+A module implementing a compressed, block-based channel-event format.
+"""
+
+# built-in
+from array import array
+from itertools import accumulate
+import lzma
+from struct import Struct
+from typing import Any, BinaryIO, Callable, Iterator, NamedTuple
+import zlib
+
+# internal
+from runtimepy.channel.event.header import IdType
+from runtimepy.primitives import Primitive
+from runtimepy.primitives.byte_order import DEFAULT_BYTE_ORDER, ByteOrder
+
+DEFAULT_BLOCK_EVENTS = 4096
+DEFAULT_COMPRESSION = "zlib"
+
+# Compression methods (by name) and their block identifiers.
+COMPRESSION: dict[str, int] = {"zlib": 1, "lzma": 2}
+
+COMPRESS: dict[int, Callable[[bytes], bytes]] = {
+    1: zlib.compress,
+    2: lzma.compress,
+}
+DECOMPRESS: dict[int, Callable[[bytes], bytes]] = {
+    1: zlib.decompress,
+    2: lzma.decompress,
+}
+
+
+def block_header(byte_order: ByteOrder) -> Struct:
+    """
+    Get the codec for block headers (compression method, number of events,
+    compressed payload size and the timestamp of the first event).
+    """
+    return Struct(byte_order.fmt + "BIIQ")
+
+
+def column_codec(byte_order: ByteOrder, count: int, kind: str) -> Struct:
+    """Get a codec for a column of fixed-size elements."""
+    return Struct(f"{byte_order.fmt}{count}{kind}")
+
+
+def shuffle(data: bytes, size: int) -> bytes:
+    """
+    Group the bytes of fixed-size elements by position (e.g. all
+    most-significant bytes first) so that they compress better.
+    """
+    return b"".join(data[idx::size] for idx in range(size))
+
+
+def unshuffle(data: bytes, size: int) -> bytes:
+    """Reverse a byte shuffle."""
+
+    count = len(data) // size
+    result = bytearray(len(data))
+    for idx in range(size):
+        result[idx::size] = data[idx * count : (idx + 1) * count]
+    return bytes(result)
+
+
+class EventBlock(NamedTuple):
+    """A decoded (decompressed) block of events."""
+
+    identifiers: tuple[int, ...]
+    timestamps: list[int]
+
+    # Encoded values (sizes depend on each event's channel type).
+    values: bytes
+
+    def __len__(self) -> int:
+        """Get the number of events in this block."""
+        return len(self.identifiers)
+
+
+class EventBlockWriter:
+    """
+    A class for writing channel events as compressed blocks. Each block's
+    payload is columnar: identifiers, (byte-shuffled) timestamp deltas from
+    the previous event and then encoded values.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        byte_order: ByteOrder = DEFAULT_BYTE_ORDER,
+        compression: str = DEFAULT_COMPRESSION,
+        events: int = DEFAULT_BLOCK_EVENTS,
+    ) -> None:
+        """Initialize this instance."""
+
+        assert events > 0, events
+
+        self.stream = stream
+        self.byte_order = byte_order
+        self.header = block_header(byte_order)
+        self.method = COMPRESSION[compression]
+        self.max_events = events
+
+        # Event records would otherwise include a full header.
+        self.event_header_size = IdType.kind.size + 8
+
+        self.codecs: dict[int, Struct] = {}
+
+        self.identifiers = array(IdType.kind.format)
+        self.deltas = array("q")
+        self.values = bytearray()
+        self.base_ns = 0
+        self.prev_ns = 0
+
+    def event(
+        self, identifier: int, timestamp_ns: int, primitive: Primitive[Any]
+    ) -> int:
+        """
+        Add an event to the current block (writing the block if it's full).
+        Returns the equivalent uncompressed record size.
+        """
+
+        codec = self.codecs.get(identifier)
+        if codec is None:
+            codec = Struct(self.byte_order.fmt + primitive.kind.format)
+            self.codecs[identifier] = codec
+
+        if not self.identifiers:
+            self.base_ns = timestamp_ns
+            self.prev_ns = timestamp_ns
+
+        self.identifiers.append(identifier)
+        self.deltas.append(timestamp_ns - self.prev_ns)
+        self.prev_ns = timestamp_ns
+        self.values += codec.pack(primitive.value)
+
+        if len(self.identifiers) >= self.max_events:
+            self.write_block()
+
+        return self.event_header_size + codec.size
+
+    def write_block(self) -> int:
+        """Write any pending events as a block and return the bytes written."""
+
+        count = len(self.identifiers)
+        if not count:
+            return 0
+
+        payload = COMPRESS[self.method](
+            column_codec(self.byte_order, count, IdType.kind.format).pack(
+                *self.identifiers
+            )
+            + shuffle(
+                column_codec(self.byte_order, count, "q").pack(*self.deltas),
+                self.deltas.itemsize,
+            )
+            + self.values
+        )
+
+        written = self.stream.write(
+            self.header.pack(self.method, count, len(payload), self.base_ns)
+            + payload
+        )
+
+        self.identifiers = array(IdType.kind.format)
+        self.deltas = array("q")
+        self.values = bytearray()
+
+        return written
+
+
+def read_event_blocks(
+    stream: BinaryIO, byte_order: ByteOrder = DEFAULT_BYTE_ORDER
+) -> Iterator[EventBlock]:
+    """Read blocks from a stream (stopping at the first incomplete one)."""
+
+    header = block_header(byte_order)
+
+    while True:
+        data = stream.read(header.size)
+        if len(data) < header.size:
+            break
+
+        method, count, length, base_ns = header.unpack(data)
+        payload = stream.read(length)
+        if len(payload) < length:
+            break
+
+        raw = DECOMPRESS[method](payload)
+
+        ids = column_codec(byte_order, count, IdType.kind.format)
+        deltas = column_codec(byte_order, count, "q")
+
+        end = ids.size + deltas.size
+
+        yield EventBlock(
+            ids.unpack_from(raw),
+            list(
+                accumulate(
+                    deltas.unpack(unshuffle(raw[ids.size : end], 8)),
+                    initial=base_ns,
+                )
+            )[1:],
+            raw[end:],
+        )
@@ -2,14 +2,23 @@
 A module implementing interfaces related to channel-protocol headers.
 """
 
+# built-in
+from struct import Struct
+
 # internal
 from runtimepy.codec.protocol import Protocol, ProtocolFactory
 from runtimepy.primitives import Uint16
+from runtimepy.primitives.byte_order import ByteOrder
 
 IdType = Uint16
 ID_SINGLE = IdType()
 
 
+def event_header_codec(byte_order: ByteOrder) -> Struct:
+    """Get a codec for channel-event headers (identifier and timestamp)."""
+    return Struct(byte_order.fmt + IdType.kind.format + "Q")
+
+
 class PrimitiveEventHeader(ProtocolFactory):
     """A protocol for implementing channel events."""
 
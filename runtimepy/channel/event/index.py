@@ -0,0 +1,166 @@
+"""
+A module implementing a time-index sidecar for channel-event streams.
+"""
+
+# built-in
+from struct import Struct
+from typing import Any, BinaryIO, Callable, NamedTuple, Optional
+
+# third-party
+from vcorelib.math import to_nanos
+
+# internal
+from runtimepy.channel.event.header import IdType
+from runtimepy.primitives import Primitive
+from runtimepy.primitives.byte_order import DEFAULT_BYTE_ORDER, ByteOrder
+from runtimepy.primitives.types import AnyPrimitiveType
+from runtimepy.primitives.types.base import PythonPrimitive
+
+DEFAULT_INDEX_EVENTS = 4096
+DEFAULT_INDEX_PERIOD_S = 1.0
+
+
+def index_entry_header(byte_order: ByteOrder) -> Struct:
+    """
+    Get the codec for index-entry headers (event-stream byte offset,
+    timestamp and the number of channel values that follow).
+    """
+    return Struct(byte_order.fmt + "QQ" + IdType.kind.format)
+
+
+def index_value_codec(kind: AnyPrimitiveType, byte_order: ByteOrder) -> Struct:
+    """Get the codec for an individual (identifier, value) snapshot pair."""
+    return Struct(byte_order.fmt + IdType.kind.format + kind.format)
+
+
+class EventIndexEntry(NamedTuple):
+    """An event-stream checkpoint."""
+
+    # The event-stream offset (a record boundary) that this entry refers to.
+    offset: int
+
+    # The timestamp of the last event before this offset.
+    timestamp_ns: int
+
+    # Channel values (by identifier) after every event before this offset.
+    values: dict[int, PythonPrimitive]
+
+
+class EventIndexWriter:
+    """
+    A class for writing periodic checkpoints (offset, timestamp and a
+    snapshot of each channel's last value) for an event stream.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        byte_order: ByteOrder = DEFAULT_BYTE_ORDER,
+        events: int = DEFAULT_INDEX_EVENTS,
+        period_s: float = DEFAULT_INDEX_PERIOD_S,
+    ) -> None:
+        """Initialize this instance."""
+
+        assert events > 0, events
+
+        self.stream = stream
+        self.byte_order = byte_order
+        self.header = index_entry_header(byte_order)
+
+        self.max_events = events
+        self.period_ns = to_nanos(period_s)
+
+        # Codecs and the last value written to the stream (which may differ
+        # from a primitive's current value, e.g. for rate-limited channels).
+        self.sources: dict[int, Struct] = {}
+        self.values: dict[int, PythonPrimitive] = {}
+        self.offset = 0
+        self.events = 0
+        self.prev_ns: Optional[int] = None
+
+    def event(
+        self,
+        identifier: int,
+        primitive: Primitive[Any],
+        timestamp_ns: int,
+        size: int,
+    ) -> None:
+        """Account for an event written to the stream."""
+
+        if identifier not in self.sources:
+            self.sources[identifier] = index_value_codec(
+                primitive.kind, self.byte_order
+            )
+        self.values[identifier] = primitive.value
+
+        self.offset += size
+        self.events += 1
+
+        if self.prev_ns is None:
+            self.prev_ns = timestamp_ns
+
+        if (
+            self.events >= self.max_events
+            or timestamp_ns - self.prev_ns >= self.period_ns
+        ):
+            self.write(timestamp_ns)
+
+    def write(self, timestamp_ns: int) -> None:
+        """Write an index entry for the current stream offset."""
+
+        parts = [
+            self.header.pack(self.offset, timestamp_ns, len(self.sources))
+        ]
+        values = self.values
+        parts.extend(
+            codec.pack(ident, values[ident])
+            for ident, codec in self.sources.items()
+        )
+        self.stream.write(b"".join(parts))
+
+        self.events = 0
+        self.prev_ns = timestamp_ns
+
+
+def read_event_index(
+    data: bytes,
+    kind: Callable[[int], AnyPrimitiveType],
+    byte_order: ByteOrder = DEFAULT_BYTE_ORDER,
+) -> list[EventIndexEntry]:
+    """
+    Parse index entries (stopping at the first incomplete one). The provided
+    callable resolves channel identifiers to primitive types.
+    """
+
+    result: list[EventIndexEntry] = []
+
+    header = index_entry_header(byte_order)
+    codecs: dict[int, Struct] = {}
+    id_size = IdType.kind.size
+
+    offset = 0
+    data_len = len(data)
+    while offset + header.size <= data_len:
+        stream_offset, timestamp_ns, count = header.unpack_from(data, offset)
+        offset += header.size
+
+        values: dict[int, PythonPrimitive] = {}
+        for _ in range(count):
+            if offset + id_size > data_len:
+                return result
+
+            ident = IdType.decode(data[offset : offset + id_size], byte_order)
+            codec = codecs.get(ident)
+            if codec is None:
+                codec = index_value_codec(kind(ident), byte_order)
+                codecs[ident] = codec
+
+            if offset + codec.size > data_len:
+                return result
+
+            values[ident] = codec.unpack_from(data, offset)[1]
+            offset += codec.size
+
+        result.append(EventIndexEntry(stream_offset, timestamp_ns, values))
+
+    return result
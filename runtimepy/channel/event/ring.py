@@ -0,0 +1,125 @@
+"""
+A module implementing a fixed-record ring buffer for channel events.
+"""
+
+# built-in
+from array import array
+from struct import Struct
+from typing import NamedTuple
+
+# internal
+from runtimepy.channel.event.header import IdType
+from runtimepy.primitives.types import AnyPrimitiveType
+from runtimepy.primitives.types.base import PythonPrimitive
+
+# Every event value occupies a fixed-size slot (large enough for any
+# primitive type).
+EVENT_VALUE_SIZE = 8
+DEFAULT_EVENT_CAPACITY = 2**16
+
+
+def event_value_codec(kind: AnyPrimitiveType) -> Struct:
+    """Get a codec for storing values of a primitive type in a ring."""
+
+    assert kind.size <= EVENT_VALUE_SIZE, kind
+    return Struct("=" + kind.format)
+
+
+class EventBatch(NamedTuple):
+    """
+    Columnar events consumed from a ring buffer. The identifier and timestamp
+    columns support the buffer protocol (e.g. 'numpy.frombuffer' can view
+    them without copying).
+    """
+
+    identifiers: array[int]
+    timestamps: array[int]
+
+    # Fixed-size (EVENT_VALUE_SIZE) raw value slots, one per event.
+    values: bytes
+
+    def __len__(self) -> int:
+        """Get the number of events in this batch."""
+        return len(self.identifiers)
+
+    def value(self, index: int, codec: Struct) -> PythonPrimitive:
+        """Decode the value of an individual event."""
+
+        result: PythonPrimitive = codec.unpack_from(
+            self.values, index * EVENT_VALUE_SIZE
+        )[0]
+        return result
+
+
+class EventRing:
+    """
+    A fixed-capacity, preallocated ring buffer of channel events (a single
+    writer and a single reader). When the buffer is full, the oldest events
+    are overwritten (and counted as dropped).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_EVENT_CAPACITY) -> None:
+        """Initialize this instance."""
+
+        assert capacity > 0, capacity
+        self.capacity = capacity
+
+        kind = IdType.kind
+        self.identifiers = array(kind.format, bytes(capacity * kind.size))
+        self.timestamps = array("Q", bytes(capacity * 8))
+        self.values = bytearray(capacity * EVENT_VALUE_SIZE)
+
+        # Monotonic write and read counters.
+        self.written = 0
+        self.consumed = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Get the number of events available to read."""
+        return self.written - self.consumed
+
+    def append(
+        self,
+        identifier: int,
+        timestamp_ns: int,
+        codec: Struct,
+        value: PythonPrimitive,
+    ) -> None:
+        """Write an event to the ring."""
+
+        slot = self.written % self.capacity
+        self.identifiers[slot] = identifier
+        self.timestamps[slot] = timestamp_ns
+        codec.pack_into(self.values, slot * EVENT_VALUE_SIZE, value)
+        self.written += 1
+
+        # Drop the oldest event if the reader has fallen behind.
+        if self.written - self.consumed > self.capacity:
+            self.consumed += 1
+            self.dropped += 1
+
+    def consume(self, limit: int = None) -> EventBatch:
+        """Read (up to a limit of) the oldest pending events."""
+
+        count = self.pending
+        if limit is not None:
+            count = min(count, limit)
+
+        start = self.consumed % self.capacity
+        end = start + count
+
+        # Handle the read wrapping around the end of the buffer.
+        overflow = max(end - self.capacity, 0)
+        end -= overflow
+
+        identifiers = self.identifiers[start:end]
+        timestamps = self.timestamps[start:end]
+        values = self.values[start * EVENT_VALUE_SIZE : end * EVENT_VALUE_SIZE]
+        if overflow:
+            identifiers += self.identifiers[:overflow]
+            timestamps += self.timestamps[:overflow]
+            values += self.values[: overflow * EVENT_VALUE_SIZE]
+
+        self.consumed += count
+        return EventBatch(identifiers, timestamps, bytes(values))
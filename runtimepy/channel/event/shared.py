@@ -0,0 +1,148 @@
+"""
+A module implementing shared-memory storage of channel values.
+"""
+
+# built-in
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from typing import Optional
+from zlib import crc32
+
+# internal
+from runtimepy.primitives.types.base import PythonPrimitive
+
+# A sequence number (odd while a write is in progress) and a layout checksum.
+SHARED_HEADER = Struct("=QI")
+SEQUENCE = Struct("=Q")
+
+# Give up on reading a consistent snapshot after this many attempts.
+DEFAULT_READ_ATTEMPTS = 64
+
+
+def layout_checksum(names: list[str], formats: list[str]) -> int:
+    """Compute a checksum of a value layout."""
+
+    return crc32(
+        "\n".join(f"{x}:{y}" for x, y in zip(names, formats)).encode()
+    )
+
+
+class SharedValues:
+    """
+    Channel values stored in a shared-memory segment (a single writer and any
+    number of readers). Values are updated in place and guarded by a sequence
+    lock, so readers only observe consistent snapshots.
+    """
+
+    def __init__(
+        self, names: list[str], formats: list[str], name: str = None
+    ) -> None:
+        """
+        Initialize this instance. A new segment is created if a name isn't
+        provided, otherwise an existing segment is attached to.
+        """
+
+        assert len(names) == len(formats), (names, formats)
+
+        self.names = names
+        self.codecs = [Struct("=" + x) for x in formats]
+        self.snapshot = Struct("=" + "".join(formats))
+        self.checksum = layout_checksum(names, formats)
+
+        self.offsets = []
+        offset = SHARED_HEADER.size
+        for codec in self.codecs:
+            self.offsets.append(offset)
+            offset += codec.size
+
+        self.owner = name is None
+        self.memory = SharedMemory(
+            name=name, create=self.owner, size=offset, track=self.owner
+        )
+        assert self.memory.buf is not None
+        self.buf: memoryview = self.memory.buf
+
+        self.sequence = 0
+        self.read_sequence = -1
+        self.previous: Optional[tuple[PythonPrimitive, ...]] = None
+
+        if self.owner:
+            SHARED_HEADER.pack_into(self.buf, 0, 0, self.checksum)
+        else:
+            sequence, checksum = SHARED_HEADER.unpack_from(self.buf)
+            if checksum != self.checksum:
+                self.close()
+            assert checksum == self.checksum, "Shared value layout mismatch!"
+            self.sequence = sequence
+
+    @property
+    def name(self) -> str:
+        """Get the name of the underlying shared-memory segment."""
+        return self.memory.name
+
+    def close(self) -> None:
+        """Release the segment (removing it if this instance created it)."""
+
+        self.buf.release()
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+
+    def write(self, index: int, value: PythonPrimitive) -> None:
+        """Update a value."""
+
+        buf = self.buf
+
+        self.sequence += 1
+        SEQUENCE.pack_into(buf, 0, self.sequence)
+        self.codecs[index].pack_into(buf, self.offsets[index], value)
+        self.sequence += 1
+        SEQUENCE.pack_into(buf, 0, self.sequence)
+
+    @property
+    def changed(self) -> bool:
+        """Determine if values were written since the last read."""
+        return bool(SEQUENCE.unpack_from(self.buf)[0] != self.read_sequence)
+
+    def read(
+        self, attempts: int = DEFAULT_READ_ATTEMPTS
+    ) -> Optional[tuple[PythonPrimitive, ...]]:
+        """
+        Read a consistent snapshot of all values. Returns None if the writer
+        didn't stop writing for long enough.
+        """
+
+        buf = self.buf
+
+        for _ in range(attempts):
+            before = SEQUENCE.unpack_from(buf)[0]
+            if before % 2 == 0:
+                values = self.snapshot.unpack_from(buf, SHARED_HEADER.size)
+                if SEQUENCE.unpack_from(buf)[0] == before:
+                    self.read_sequence = before
+                    return values
+
+        return None
+
+    def updates(self) -> list[tuple[str, PythonPrimitive]]:
+        """Get names and values that changed since the last call."""
+
+        result: list[tuple[str, PythonPrimitive]] = []
+
+        if self.changed:
+            values = self.read()
+            if values is not None:
+                previous = self.previous
+                if previous is None:
+                    result = list(zip(self.names, values))
+                else:
+                    result = [
+                        (name, value)
+                        for name, value, prev in zip(
+                            self.names, values, previous
+                        )
+                        if value != prev
+                    ]
+                self.previous = values
+
+        return result
@@ -5,7 +5,7 @@ A module implementing a channel registry.
 # built-in
 from contextlib import ExitStack, contextmanager
 from typing import Any as _Any
-from typing import BinaryIO, Iterable, Iterator, NamedTuple
+from typing import Iterable, Iterator, NamedTuple
 from typing import Optional as _Optional
 from typing import Union
 
@@ -16,7 +16,9 @@ from vcorelib.io.types import JsonObject as _JsonObject
 # internal
 from runtimepy.channel import AnyChannel as _AnyChannel
 from runtimepy.channel import Channel as _Channel
+from runtimepy.channel.event import EventStream
 from runtimepy.channel.event.header import PrimitiveEventHeader
+from runtimepy.channel.event.index import EventIndexWriter
 from runtimepy.codec.protocol import Protocol
 from runtimepy.mapping import DEFAULT_PATTERN
 from runtimepy.metrics.channel import ChannelMetrics
@@ -68,7 +70,6 @@ class ChannelRegistry(_Registry[_Channel[_Any]]):
 
     event_header: Protocol
     event_fifo: ByteFifo
-    header_ready: bool
 
     @property
     def kind(self) -> type[_Channel[_Any]]:
@@ -80,7 +81,6 @@ class ChannelRegistry(_Registry[_Channel[_Any]]):
 
         super().init(data)
         self.event_header = PrimitiveEventHeader.instance()
-        self.header_ready = False
         self.event_fifo = ByteFifo()
 
     def channel(
@@ -140,11 +140,12 @@ class ChannelRegistry(_Registry[_Channel[_Any]]):
     @contextmanager
     def registered(
         self,
-        stream: BinaryIO,
+        stream: EventStream,
         pattern: str = DEFAULT_PATTERN,
         exact: bool = False,
         flush: bool = False,
         channel: ChannelMetrics = None,
+        index: EventIndexWriter = None,
     ) -> Iterator[list[str]]:
         """
         Register a stream as a managed context. Returns a list of all channels
@@ -155,7 +156,9 @@ class ChannelRegistry(_Registry[_Channel[_Any]]):
             names = []
             for name, chan in self.search(pattern, exact=exact):
                 stack.enter_context(
-                    chan.event.registered(stream, flush=flush, channel=channel)
+                    chan.event.registered(
+                        stream, flush=flush, channel=channel, index=index
+                    )
                 )
                 names.append(name)
 
@@ -4,13 +4,21 @@ A module implementing signal source structs.
 
 # built-in
 from abc import abstractmethod
+from array import array
+from math import sin, tau
 from typing import Any, Generic, cast
 
+# third-party
+from vcorelib.math import default_time_ns
+
 # internal
 from runtimepy.control.env import amplitude
 from runtimepy.net.arbiter.info import RuntimeStruct
 from runtimepy.primitives import Double, T
 
+# Time between samples (for time-based sources).
+DEFAULT_DT_S = 0.01
+
 
 class PrimitiveSource(RuntimeStruct, Generic[T]):
     """A simple output-source struct."""
@@ -22,6 +30,13 @@ class PrimitiveSource(RuntimeStruct, Generic[T]):
 
     length: int
 
+    # Generated values for every output (sample-major) and the index of the
+    # first sample in the next block.
+    block: array[float]
+    horizon: int
+    cursor: int
+    sample: int
+
     def init_source(self) -> None:
         """Initialize this value source."""
 
@@ -29,6 +44,19 @@ class PrimitiveSource(RuntimeStruct, Generic[T]):
     def source(self, index: int) -> float | int | bool:
         """Provide the next value."""
 
+    def source_block(self, block: array[float]) -> None:
+        """
+        Fill a block with the next values for every output (sample-major,
+        starting at sample 'self.sample'). Sources should override this to
+        generate all values at once.
+        """
+
+        length = self.length
+        for offset in range(0, len(block), length):
+            block[offset : offset + length] = array(
+                "d", map(self.source, range(length))
+            )
+
     def init_env(self) -> None:
         """Initialize this double-source environment."""
 
@@ -49,20 +77,123 @@ class PrimitiveSource(RuntimeStruct, Generic[T]):
                 amplitude(self.env, Double, name=f"{idx}.amplitude")
             )
 
-        self.init_source()
         self.length = len(self.outputs)
 
+        # Generate this many samples (for every output) at a time.
+        self.horizon = max(cast(int, self.config.get("horizon", 1)), 1)
+        self.block = array("d", bytes(8 * self.length * self.horizon))
+        self.cursor = self.horizon
+        self.sample = 0
+
+        self.init_source()
+
     def poll(self) -> None:
         """Update the outputs."""
 
-        for idx in range(self.length):
+        length = self.length
+
+        if self.cursor >= self.horizon:
+            self.source_block(self.block)
+            self.sample += self.horizon
+            self.cursor = 0
+
+        start = self.cursor * length
+        self.cursor += 1
+
+        # Update all outputs with the same timestamp.
+        now = default_time_ns()
+        for output, amp, value in zip(
+            self.outputs, self.amplitudes, self.block[start : start + length]
+        ):
             # Difficult to avoid cast.
-            self.outputs[idx].value = cast(
-                Any, self.amplitudes[idx].value * self.source(idx)
-            )
+            output.set_value(cast(Any, amp.value * value), timestamp_ns=now)
 
 
 class DoubleSource(PrimitiveSource[Double]):  # pylint:disable=abstract-method
     """A simple double output source."""
 
     kind = Double
+
+
+class SineBankSource(DoubleSource):
+    """
+    A bank of sinusoids (output 'n' is harmonic 'n + 1' of a base frequency).
+    """
+
+    omegas: list[float]
+
+    def init_source(self) -> None:
+        """Initialize this value source."""
+
+        dt_s = cast(float, self.config.get("dt_s", DEFAULT_DT_S))
+        base_hz = cast(float, self.config.get("base_hz", 1.0))
+
+        # Phase advanced per sample.
+        self.omegas = [
+            tau * base_hz * (idx + 1) * dt_s for idx in range(self.length)
+        ]
+
+    def source(self, index: int) -> float:
+        """Provide the next value."""
+        return sin(self.omegas[index] * self.sample)
+
+    def source_block(self, block: array[float]) -> None:
+        """Fill a block with the next values for every output."""
+
+        omegas = self.omegas
+        length = self.length
+
+        sample = self.sample
+        for offset in range(0, len(block), length):
+            block[offset : offset + length] = array(
+                "d", [sin(x * sample) for x in omegas]
+            )
+            sample += 1
+
+
+class ChirpSource(DoubleSource):
+    """
+    A repeating linear-frequency sweep (outputs are evenly offset in phase).
+    """
+
+    dt_s: float
+    start_hz: float
+    rate_hz_s: float
+    sweep_samples: int
+    offsets: list[float]
+
+    def init_source(self) -> None:
+        """Initialize this value source."""
+
+        self.dt_s = cast(float, self.config.get("dt_s", DEFAULT_DT_S))
+        self.start_hz = cast(float, self.config.get("start_hz", 0.1))
+        stop_hz = cast(float, self.config.get("stop_hz", 10.0))
+        sweep_s = cast(float, self.config.get("sweep_s", 10.0))
+
+        self.rate_hz_s = (stop_hz - self.start_hz) / sweep_s
+        self.sweep_samples = max(round(sweep_s / self.dt_s), 1)
+        self.offsets = [tau * idx / self.length for idx in range(self.length)]
+
+    def phase(self, sample: int) -> float:
+        """Get the sweep's phase angle at a sample."""
+
+        time_s = (sample % self.sweep_samples) * self.dt_s
+        return tau * time_s * (self.start_hz + self.rate_hz_s * time_s / 2.0)
+
+    def source(self, index: int) -> float:
+        """Provide the next value."""
+        return sin(self.phase(self.sample) + self.offsets[index])
+
+    def source_block(self, block: array[float]) -> None:
+        """Fill a block with the next values for every output."""
+
+        offsets = self.offsets
+        length = self.length
+
+        sample = self.sample
+        for offset in range(0, len(block), length):
+            phase = self.phase(sample)
+            block[offset : offset + length] = array(
+                "d", [sin(phase + x) for x in offsets]
+            )
+            sample += 1
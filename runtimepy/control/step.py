@@ -4,7 +4,8 @@ controlled clock).
 """
 
 # built-in
-from typing import cast
+import asyncio
+from typing import Callable, cast
 
 # third-party
 from vcorelib.math import (
@@ -15,6 +16,7 @@ from vcorelib.math import (
     metrics_time_ns,
     restore_time_source,
     set_simulated_source,
+    to_nanos,
 )
 
 # internal
@@ -25,6 +27,9 @@ from runtimepy.net.manager import ConnectionManager
 from runtimepy.net.server.websocket import RuntimepyWebsocketConnection
 from runtimepy.primitives import Bool, Double, Uint32
 
+# Yield to the event loop this often (in steps) when free running.
+DEFAULT_YIELD_STEPS = 1000
+
 DONT_POLL_SET = {
     "ToggleStepper",
     "UiState",
@@ -61,10 +66,12 @@ class ToggleStepper(RuntimeStruct):
     counts: Uint32
     count_rate: Double
     count_rate_tracker: RateTracker
+    speedup: Double
 
     to_poll: set[RuntimeStruct]
 
     timer: SimulatedTime
+    step_dt_ns: int
 
     def _poll_time(self) -> None:
         """Update current time."""
@@ -95,7 +102,9 @@ class ToggleStepper(RuntimeStruct):
 
         self.to_poll = set()
 
-        self.timer = SimulatedTime(cast(int, self.config.get("step_dt_ns", 1)))
+        self.step_dt_ns = cast(int, self.config.get("step_dt_ns", 1))
+        self.timer = SimulatedTime(self.step_dt_ns)
+        self.speedup = Double(time_source=metrics_time_ns)
 
         def do_step(_: bool, __: bool) -> None:
             """Poll every step edge."""
@@ -126,6 +135,11 @@ class ToggleStepper(RuntimeStruct):
             self.count_rate,
             description="Counts per second (based on realtime clock).",
         )
+        self.env.channel(
+            "speedup",
+            self.speedup,
+            description="Simulated time elapsed per realtime (free running).",
+        )
 
         self.env.channel(
             "simulate_time",
@@ -173,9 +187,66 @@ class ToggleStepper(RuntimeStruct):
 
         self.timer.step()
 
+    def poll_many(self, count: int) -> None:
+        """
+        Poll all other entities 'count' times, only updating bookkeeping
+        channels (time and counts) once.
+        """
+
+        polls = [x.poll for x in self.to_poll]
+        step = self.timer.step
+
+        for _ in range(count):
+            for poll in polls:
+                poll()
+            step()
+
+        self._poll_time()
+
+        # pylint: disable=no-member
+        self.counts.value += count
+        # pylint: enable=no-member
+
+    async def free_run(
+        self,
+        duration_s: float,
+        yield_steps: int = DEFAULT_YIELD_STEPS,
+        keep_running: Callable[[], bool] = None,
+    ) -> float:
+        """
+        Step as fast as possible for a duration of simulated time (yielding to
+        the event loop every 'yield_steps' steps, and stopping early if
+        'keep_running' returns False). Returns the simulated-time speedup
+        relative to realtime.
+        """
+
+        assert yield_steps >= 1, yield_steps
+
+        self.simulate_time.value = True
+
+        remaining = to_nanos(duration_s) // self.step_dt_ns
+        steps = 0
+
+        start = metrics_time_ns()
+        while remaining > 0 and (keep_running is None or keep_running()):
+            count = min(remaining, yield_steps)
+            self.poll_many(count)
+            remaining -= count
+            steps += count
+            await asyncio.sleep(0)
+        elapsed_ns = max(metrics_time_ns() - start, 1)
+
+        self.count_rate.value = steps / from_nanos(elapsed_ns)
+        self.speedup.value = (steps * self.step_dt_ns) / elapsed_ns
+
+        return self.speedup.value
+
 
 class ToggleStepperTask(ArbiterTask):
-    """A task for automatically stepping a toggle-stepper clock."""
+    """
+    A task for automatically stepping a toggle-stepper clock (or free running
+    steppers for a duration of simulated time, if configured).
+    """
 
     steppers: list[ToggleStepper]
 
@@ -191,8 +262,36 @@ class ToggleStepperTask(ArbiterTask):
     async def dispatch(self) -> bool:
         """Dispatch an iteration of this task."""
 
-        for stepper in self.steppers:
-            stepper.step.toggle()
+        free_run_s = cast(float, self.config.get("free_run_s", 0.0))
+
+        if free_run_s > 0.0:
+            yield_steps = cast(
+                int, self.config.get("yield_steps", DEFAULT_YIELD_STEPS)
+            )
+            for stepper in self.steppers:
+                # Stop early if this task is stopped (dispatches are shielded
+                # from cancellation).
+                speedup = await stepper.free_run(
+                    free_run_s,
+                    yield_steps=yield_steps,
+                    keep_running=lambda: bool(self._enabled),
+                )
+                if not self._enabled:
+                    break
+
+                self.logger.info(
+                    "Stepped '%s' %ss (%.1fx realtime).",
+                    stepper.name,
+                    free_run_s,
+                    speedup,
+                )
+
+            # Pause until the next run is requested.
+            self.paused.value = True
+
+        else:
+            for stepper in self.steppers:
+                stepper.step.toggle()
 
         return True
 
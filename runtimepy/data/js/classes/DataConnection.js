@@ -94,7 +94,7 @@ class DataConnection extends JsonConnection {
         offset += 8;
         break;
       case "bool":
-        value = view.getUint8(offset);
+        value = view.getUint8(offset) !== 0;
         offset += 1;
         break;
       }
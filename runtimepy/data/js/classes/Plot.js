@@ -58,7 +58,13 @@ class Plot {
     };
   }
 
-  handle_resize() { this.plotMessage(this.messageBase()); }
+  handle_resize() {
+    let msg = this.messageBase();
+    this.plotMessage(msg);
+
+    /* The server decimates points based on plot width. */
+    this.worker.send({kind : "plot", value : {"width" : msg["width"]}});
+  }
 
   handle_shown(is_shown) {
     if (is_shown) {
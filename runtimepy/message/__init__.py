@@ -4,7 +4,7 @@ A module implementing a message-stream processing interface.
 
 # built-in
 from io import BytesIO as _BytesIO
-from json import JSONEncoder, dumps, loads
+from struct import Struct as _Struct
 from typing import Any
 from typing import Iterator as _Iterator
 
@@ -12,22 +12,23 @@ from typing import Iterator as _Iterator
 from vcorelib.io import BinaryMessage, ByteFifo
 
 # internal
+from runtimepy.message.codec import (
+    DEFAULT_CODEC,
+    MessageCodec,
+    StrFallbackJSONEncoder,
+)
 from runtimepy.primitives import Uint32, UnsignedInt
 from runtimepy.primitives.byte_order import DEFAULT_BYTE_ORDER, ByteOrder
 
 JsonMessage = dict[str, Any]
 
 
-class StrFallbackJSONEncoder(JSONEncoder):
-    """Custom JSON encoder."""
-
-    def default(self, o):
-        """Use a string conversion if necessary."""
-
-        try:
-            return super().default(o)
-        except TypeError:
-            return str(o)
+__all__ = [
+    "JsonMessage",
+    "MessageCodec",
+    "MessageProcessor",
+    "StrFallbackJSONEncoder",
+]
 
 
 class MessageProcessor:
@@ -35,6 +36,9 @@ class MessageProcessor:
 
     message_length_kind: type[UnsignedInt] = Uint32
 
+    # Set this to select a different JSON implementation.
+    codec: MessageCodec = DEFAULT_CODEC
+
     def __init__(self, byte_order: ByteOrder = DEFAULT_BYTE_ORDER) -> None:
         """Initialize this instance."""
 
@@ -46,7 +50,17 @@ class MessageProcessor:
         self.message_length_in = self.message_length_kind()
         self.prefix_size = self.message_length_in.size
 
-        self.message_length_out = self.message_length_kind()
+        self.prefix = _Struct(
+            byte_order.fmt + self.message_length_kind.kind.format
+        )
+
+    def frame(self, data: BinaryMessage) -> bytes:
+        """Get a size-prefixed message."""
+        return self.prefix.pack(len(data)) + data
+
+    def frame_json(self, data: JsonMessage) -> bytes:
+        """Get a size-prefixed JSON message."""
+        return self.frame(self.codec.encode(data))
 
     def encode(self, stream: _BytesIO, data: BinaryMessage | str) -> None:
         """Encode a message to a stream."""
@@ -54,23 +68,17 @@ class MessageProcessor:
         if isinstance(data, str):
             data = data.encode()
 
-        self.message_length_out.value = len(data)
-        self.message_length_out.to_stream(stream, byte_order=self.byte_order)
-        stream.write(data)
+        stream.write(self.frame(data))
 
     def encode_json(self, stream: _BytesIO, data: JsonMessage) -> None:
         """Encode a message as JSON."""
-
-        self.encode(
-            stream,
-            dumps(data, cls=StrFallbackJSONEncoder, separators=(",", ":")),
-        )
+        stream.write(self.frame_json(data))
 
     def messages(self, data: bytes) -> _Iterator[JsonMessage]:
         """Iterate over incoming messages."""
 
         for message in self.process(data):
-            yield loads(message.decode())
+            yield self.codec.decode(message)
 
     def process(self, data: BinaryMessage) -> _Iterator[bytearray]:
         """Process an incoming message."""
@@ -0,0 +1,90 @@
+"""
+A module implementing JSON codecs for messages.
+"""
+
+# built-in
+from importlib import import_module
+from json import JSONEncoder, dumps, loads
+from typing import Any, Callable, NamedTuple, Optional
+
+# Encoded JSON that can be decoded.
+JsonData = bytes | bytearray | str
+
+
+class StrFallbackJSONEncoder(JSONEncoder):
+    """Custom JSON encoder."""
+
+    def default(self, o):
+        """Use a string conversion if necessary."""
+
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+class MessageCodec(NamedTuple):
+    """A JSON encoder (to bytes) and decoder."""
+
+    name: str
+    encode: Callable[[Any], bytes]
+    decode: Callable[[JsonData], Any]
+
+
+def stdlib_encode(data: Any) -> bytes:
+    """Encode data as JSON using the standard library."""
+
+    return dumps(
+        data, cls=StrFallbackJSONEncoder, separators=(",", ":")
+    ).encode()
+
+
+STDLIB_CODEC = MessageCodec("json", stdlib_encode, loads)
+CODECS: dict[str, MessageCodec] = {STDLIB_CODEC.name: STDLIB_CODEC}
+
+
+def orjson_codec() -> Optional[MessageCodec]:
+    """
+    Create a codec using 'orjson' (if it's installed). Output matches the
+    standard-library codec except that non-finite floats encode as null and
+    (non-integer, non-string) enumeration members encode as their values.
+    """
+
+    try:
+        orjson = import_module("orjson")
+    except ImportError:
+        return None
+
+    # Encode types that 'orjson' would otherwise handle natively with string
+    # conversions (like the standard-library codec).
+    options = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def encode(data: Any) -> bytes:
+        """Encode data as JSON."""
+
+        try:
+            result: bytes = orjson.dumps(data, default=str, option=options)
+            return result
+
+        # Handle anything 'orjson' doesn't (e.g. integers wider than 64 bits).
+        except TypeError:
+            return stdlib_encode(data)
+
+    return MessageCodec("orjson", encode, orjson.loads)
+
+
+def register_codec(codec: Optional[MessageCodec]) -> None:
+    """Register a message codec."""
+
+    if codec is not None:
+        CODECS[codec.name] = codec
+
+
+register_codec(orjson_codec())
+
+# Use the fastest available codec by default.
+DEFAULT_CODEC = CODECS.get("orjson", STDLIB_CODEC)
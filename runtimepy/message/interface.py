@@ -5,7 +5,6 @@ A module implementing a JSON messaging interface.
 # built-in
 import asyncio
 from copy import copy
-from io import BytesIO
 import logging
 from typing import Any, Optional, Union
 from uuid import uuid4
@@ -224,9 +223,7 @@ class JsonMessageInterface:
             data["__log_messages__"] = self._log_messages  # type: ignore
             self._log_messages = []
 
-        with BytesIO() as stream:
-            self.processor.encode_json(stream, data)
-            self.write(stream.getvalue(), addr=addr)
+        self.write(self.processor.frame_json(data), addr=addr)
 
     def handle_log_message(self, message: JsonMessage) -> None:
         """Handle a log message."""
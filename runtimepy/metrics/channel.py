@@ -60,11 +60,15 @@ class ChannelMetrics:
             time_ns=time_ns
         )
 
-    def increment(self, count: int, time_ns: int = None) -> None:
+    def increment(
+        self, count: int, time_ns: int = None, messages: int = 1
+    ) -> None:
         """Update tracking."""
 
-        self.messages.value += 1
-        self.message_rate.value = self._message_rate_tracker(time_ns=time_ns)
+        self.messages.value += messages
+        self.message_rate.value = self._message_rate_tracker(
+            time_ns=time_ns, value=float(messages)
+        )
 
         self.bytes.value += count
 
@@ -18,7 +18,6 @@ from vcorelib.math.keeper import TimeSource
 # internal
 from runtimepy.primitives import Double as _Double
 from runtimepy.primitives import Float as _Float
-from runtimepy.primitives import Uint16 as _Uint16
 from runtimepy.primitives import Uint32 as _Uint32
 
 
@@ -30,7 +29,10 @@ class PeriodicTaskMetrics(NamedTuple):
     average_s: _Float
     max_s: _Float
     min_s: _Float
-    overruns: _Uint16
+    overruns: _Uint32
+    lateness_p50_s: _Float
+    lateness_p99_s: _Float
+    queue_delay_s: _Float
 
     @staticmethod
     def create(
@@ -44,7 +46,10 @@ class PeriodicTaskMetrics(NamedTuple):
             _Float(time_source=time_source),
             _Float(time_source=time_source),
             _Float(time_source=time_source),
-            _Uint16(time_source=time_source),
+            _Uint32(time_source=time_source),
+            _Float(time_source=time_source),
+            _Float(time_source=time_source),
+            _Float(time_source=time_source),
         )
 
     @contextmanager
@@ -53,7 +58,6 @@ class PeriodicTaskMetrics(NamedTuple):
         rate: RateTracker,
         dispatch: MovingAverage,
         iter_time: _Double,
-        period_s: float,
     ) -> Iterator[None]:
         """Measure the time spent yielding and update data."""
 
@@ -69,5 +73,3 @@ class PeriodicTaskMetrics(NamedTuple):
         self.average_s.value = dispatch(iter_time.value)
         self.max_s.value = dispatch.max
         self.min_s.value = dispatch.min
-        if iter_time.value > period_s:
-            self.overruns.value += 1
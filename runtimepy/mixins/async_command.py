@@ -49,15 +49,24 @@ class AsyncCommandProcessingMixin(LoggerMixin):
 
         self.outgoing_commands.put_nowait((args, channel))
 
+    async def _process_command(self, params: ChannelCommandParams) -> None:
+        """Process an outgoing command request."""
+
+        if params[0].command == ChannelCommand.CUSTOM:
+            await self.command.handle_custom_command(*params)
+        else:
+            await self.handle_command(*params)
+
+        self.outgoing_commands.task_done()
+
     async def process_command_queue(self) -> None:
         """Process any outgoing command requests."""
 
         while not self.outgoing_commands.empty():
-            params = self.outgoing_commands.get_nowait()
+            await self._process_command(self.outgoing_commands.get_nowait())
 
-            if params[0].command == ChannelCommand.CUSTOM:
-                await self.command.handle_custom_command(*params)
-            else:
-                await self.handle_command(*params)
+    async def service_command_queue(self) -> None:
+        """Process outgoing command requests as they arrive."""
 
-            self.outgoing_commands.task_done()
+        while True:
+            await self._process_command(await self.outgoing_commands.get())
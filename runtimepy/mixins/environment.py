@@ -71,7 +71,27 @@ class ChannelEnvironmentMixin:
             self.env.channel(
                 "overruns",
                 metrics.overruns,
-                description="Dispatch time exceeding period counter.",
+                description="Missed dispatch deadline counter.",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "lateness_p50_s",
+                metrics.lateness_p50_s,
+                description="Median dispatch lateness (relative to deadline).",
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "lateness_p99_s",
+                metrics.lateness_p99_s,
+                description=(
+                    "99th-percentile dispatch lateness (relative to deadline)."
+                ),
+                min_period_s=METRICS_MIN_PERIOD_S,
+            )
+            self.env.channel(
+                "queue_delay_s",
+                metrics.queue_delay_s,
+                description="Time spent waiting for an executor worker.",
                 min_period_s=METRICS_MIN_PERIOD_S,
             )
 
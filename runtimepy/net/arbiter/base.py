@@ -29,6 +29,7 @@ from runtimepy.channel.environment.command import (
     global_commands,
     register_env,
 )
+from runtimepy.net.arbiter.executor import shutdown_executors
 from runtimepy.net.arbiter.housekeeping import housekeeping
 from runtimepy.net.arbiter.info import (
     AppInfo,
@@ -335,7 +336,8 @@ class BaseConnectionArbiter(_NamespaceMixin, _LoggerMixin, TuiMixin):
             # Wire runtime data to server JSON.
             self._setup_server_json(info)
 
-            # Start tasks.
+            # Start tasks (shutting down task executors after they stop).
+            stack.callback(shutdown_executors)
             await stack.enter_async_context(
                 self.task_manager.running(stop_sig=self.stop_sig)
             )
@@ -198,6 +198,8 @@ class ConfigConnectionArbiter(_ImportConnectionArbiter):
             ), f"Couldn't register a '{factory}' server!"
 
         # Register tasks.
+        if config.shared_task_timer:
+            self.task_manager.shared_timer = True
         for task in config.tasks:
             name = task["name"]
             factory = task["factory"]
@@ -205,7 +207,10 @@ class ConfigConnectionArbiter(_ImportConnectionArbiter):
                 factory,
                 name,
                 period_s=task["period_s"],
+                phase_s=task["phase_s"],
                 average_depth=task["average_depth"],
+                catch_up=task["catch_up"],
+                executor=task["executor"],
                 markdown=task.get("markdown"),
                 config=task.get("config"),
             ), f"Couldn't register task '{name}' ({factory})!"
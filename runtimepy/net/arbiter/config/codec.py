@@ -66,6 +66,7 @@ class ConnectionArbiterConfig(_RuntimepyDictCodec):
         self.clients: list[_Any] = data.get("clients", [])  # type: ignore
         self.servers: list[_Any] = data.get("servers", [])  # type: ignore
         self.tasks: list[_Any] = data.get("tasks", [])  # type: ignore
+        self.shared_task_timer = bool(data.get("shared_task_timer", False))
         self.structs: list[_Any] = data.get("structs", [])  # type: ignore
         self.processes: list[_Any] = data.get("processes", [])  # type: ignore
 
@@ -0,0 +1,93 @@
+"""
+A module implementing shared executors for running task work off of the
+event loop.
+"""
+
+# built-in
+import asyncio
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from enum import StrEnum
+from multiprocessing import get_context
+from time import monotonic
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TaskExecutor(StrEnum):
+    """Where synchronous task work runs."""
+
+    LOOP = "loop"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+EXECUTORS: dict[TaskExecutor, Executor] = {}
+
+
+def shared_executor(kind: TaskExecutor) -> Optional[Executor]:
+    """
+    Get (or create) a shared executor. Returns None for work that runs on the
+    event loop.
+    """
+
+    if kind is TaskExecutor.LOOP:
+        return None
+
+    executor = EXECUTORS.get(kind)
+    if executor is None:
+        if kind is TaskExecutor.THREAD:
+            executor = ThreadPoolExecutor(thread_name_prefix="task")
+        else:
+            # Don't fork a process that's running an event loop (and likely
+            # other threads).
+            executor = ProcessPoolExecutor(mp_context=get_context("spawn"))
+        EXECUTORS[kind] = executor
+
+    return executor
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Shut down any shared executors."""
+
+    for executor in EXECUTORS.values():
+        executor.shutdown(wait=wait, cancel_futures=True)
+    EXECUTORS.clear()
+
+
+def timed_call(func: Callable[..., T], *args: Any) -> tuple[float, T]:
+    """Call a function and also return the (monotonic) time it started."""
+    return monotonic(), func(*args)
+
+
+async def run_in_executor(
+    kind: TaskExecutor, func: Callable[..., T], *args: Any
+) -> tuple[float, T]:
+    """
+    Run a function on a shared executor (arguments must be picklable for
+    process executors). Returns the time spent waiting for a worker and the
+    function's result.
+    """
+
+    submitted = monotonic()
+
+    executor = shared_executor(kind)
+    if executor is None:
+        started, result = timed_call(func, *args)
+    else:
+        try:
+            started, result = await asyncio.get_running_loop().run_in_executor(
+                executor, timed_call, func, *args
+            )
+
+        # Create a new executor next time if this one can't be used.
+        except BrokenExecutor:
+            EXECUTORS.pop(kind, None)
+            raise
+
+    return max(started - submitted, 0.0), result
@@ -26,7 +26,12 @@ class TaskConnectionArbiter(_BaseConnectionArbiter):
         self._task_names: dict[Factory, list[str]] = {}
 
     def factory_task(
-        self, factory: str, name: str, period_s: float = None, **kwargs
+        self,
+        factory: str,
+        name: str,
+        period_s: float = None,
+        phase_s: float = 0.0,
+        **kwargs,
     ) -> bool:
         """
         Register a periodic task from one of the registered task factories.
@@ -38,6 +43,7 @@ class TaskConnectionArbiter(_BaseConnectionArbiter):
             result = self.task_manager.register(
                 self._task_factories[factory].kind(name, **kwargs),
                 period_s=period_s,
+                phase_s=phase_s,
             )
 
         return result
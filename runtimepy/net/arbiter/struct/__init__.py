@@ -4,7 +4,15 @@ A module implementing runtime struct interfaces.
 
 # built-in
 from io import BytesIO
-from typing import Generic, Iterator, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterator,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
 
 # third-party
 from vcorelib.io import BinaryMessage
@@ -19,6 +27,21 @@ from runtimepy.primitives import Uint16, Uint64
 from runtimepy.primitives.serializable.framer import SerializableFramer
 
 
+class StructBatch(NamedTuple):
+    """Columnar values decoded from an array of struct instances."""
+
+    timestamps: tuple[int, ...]
+
+    # One column of values per array primitive (the first column is the
+    # timestamp column).
+    columns: tuple[tuple[Any, ...], ...]
+
+    @property
+    def instances(self) -> int:
+        """Get the number of struct instances in this batch."""
+        return len(self.timestamps)
+
+
 class TimestampedStruct(RuntimeStruct):
     """A bast struct with a timestamp field."""
 
@@ -81,6 +104,38 @@ class TimestampedStruct(RuntimeStruct):
             for _ in range(data_len // size):
                 yield self.update_single(stream.read(size))
 
+    def process_batch(
+        self,
+        data: BinaryMessage,
+        replay: bool = False,
+        on_update: Callable[[int], None] = None,
+    ) -> StructBatch:
+        """
+        Decode an array message in a single pass and return columnar values.
+        Only the last instance is applied to this struct's primitives unless
+        'replay' is set (in which case every instance is applied, in order).
+        The optional callback is called with the timestamp of each applied
+        instance.
+        """
+
+        size = self.array.size
+
+        # Quick sanity check.
+        data_len = len(data)
+        assert data_len % size == 0, (data_len, size)
+
+        rows = list(self.array.iter_unpack(data))
+
+        if rows:
+            for row in rows if replay else rows[-1:]:
+                # The timestamp is always the first array element.
+                self.array.update_values(row, timestamp_ns=row[0])
+                if on_update is not None:
+                    on_update(row[0])
+
+        columns = tuple(zip(*rows))
+        return StructBatch(columns[0] if columns else (), columns)
+
     def poll(self) -> None:
         """Update this instance's timestamp."""
 
@@ -104,6 +159,12 @@ class UdpStructTransceiver(UdpConnection, Generic[T]):
     # Make these private + add 'assign' method?
     struct_rx: Optional[T] = None
 
+    # Set this to decode each received datagram in a single pass (see
+    # 'handle_batch'). Only the last instance is applied to the receive
+    # struct (and 'handle_update') unless replay is also set.
+    batch_rx: bool = False
+    batch_replay: bool = False
+
     def assign_tx(self, instance: T) -> None:
         """Assign a struct to this connection."""
 
@@ -125,7 +186,7 @@ class UdpStructTransceiver(UdpConnection, Generic[T]):
             result = None
             while result is None:
                 result = self.framer_tx.capture()
-            return result
+            return bytes(result)
 
         # This actually sends data over this connection.
         self.framer_tx.set_mtu(
@@ -190,6 +251,11 @@ class UdpStructTransceiver(UdpConnection, Generic[T]):
     ) -> None:
         """Handle individual struct updates."""
 
+    def handle_batch(
+        self, batch: StructBatch, instance: T, addr: tuple[str, int]
+    ) -> None:
+        """Handle a batch of struct updates (when 'batch_rx' is set)."""
+
     async def process_datagram(
         self, data: BinaryMessage, addr: tuple[str, int]
     ) -> bool:
@@ -197,7 +263,21 @@ class UdpStructTransceiver(UdpConnection, Generic[T]):
 
         # Should we handle the other branch?
         if self.struct_rx is not None:
-            for timestamp_ns in self.struct_rx.process_datagram(data):
-                self.handle_update(timestamp_ns, self.struct_rx, addr)
+            if self.batch_rx:
+                instance = self.struct_rx
+                self.handle_batch(
+                    instance.process_batch(
+                        data,
+                        replay=self.batch_replay,
+                        on_update=lambda ts: self.handle_update(
+                            ts, instance, addr
+                        ),
+                    ),
+                    instance,
+                    addr,
+                )
+            else:
+                for timestamp_ns in self.struct_rx.process_datagram(data):
+                    self.handle_update(timestamp_ns, self.struct_rx, addr)
 
         return True
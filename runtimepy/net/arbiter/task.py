@@ -3,13 +3,19 @@ A module implement a base class for arbiter periodic tasks.
 """
 
 # built-in
+from typing import Any as _Any
 from typing import Generic as _Generic
+from typing import Optional as _Optional
 from typing import TypeVar as _TypeVar
 
 # internal
+from runtimepy.net.arbiter.executor import TaskExecutor, run_in_executor
 from runtimepy.net.arbiter.info import AppInfo
 from runtimepy.task import PeriodicTask, PeriodicTaskManager
 
+# Channel values, by name.
+ChannelUpdates = dict[str, _Any]
+
 
 class ArbiterTask(PeriodicTask):
     """A base class for arbiter periodic tasks."""
@@ -17,6 +23,49 @@ class ArbiterTask(PeriodicTask):
     app: AppInfo
     auto_finalize = False
 
+    # Where 'dispatch_sync' runs (unless 'dispatch' is overridden).
+    executor = TaskExecutor.LOOP
+
+    def __init__(self, name: str, *args, executor: str = None, **kwargs):
+        """Initialize this task."""
+
+        super().__init__(name, *args, **kwargs)
+        self.executor = TaskExecutor(executor or type(self).executor)
+
+    def dispatch_inputs(self) -> dict[str, _Any]:
+        """
+        Get inputs for a synchronous dispatch (these must be picklable for the
+        'process' executor).
+        """
+        return {}
+
+    @classmethod
+    def dispatch_sync(
+        cls, inputs: dict[str, _Any]
+    ) -> _Optional[ChannelUpdates]:
+        """
+        Dispatch an iteration of this task synchronously (possibly off of the
+        event loop). Returns channel updates to apply (on the event loop) or
+        None to stop this task.
+        """
+
+        del inputs
+        return {}
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+
+        delay, updates = await run_in_executor(
+            self.executor, type(self).dispatch_sync, self.dispatch_inputs()
+        )
+        self.metrics.queue_delay_s.value = delay
+
+        if updates is not None:
+            for name, value in updates.items():
+                self.env.set(name, value)
+
+        return updates is not None
+
     async def init(self, app: AppInfo) -> None:
         """Initialize this task with application information."""
 
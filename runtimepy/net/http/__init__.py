@@ -10,7 +10,11 @@ from vcorelib.io import BinaryMessage, ByteFifo
 
 # internal
 from runtimepy.net.http.common import HeadersMixin
-from runtimepy.net.http.state import HeaderProcessingState, T
+from runtimepy.net.http.state import (
+    DEFAULT_MAX_HEADER_SIZE,
+    HeaderProcessingState,
+    T,
+)
 
 
 class HttpMessageProcessor:
@@ -19,19 +23,66 @@ class HttpMessageProcessor:
     stream.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_header_size: int = DEFAULT_MAX_HEADER_SIZE) -> None:
         """Initialize this instance."""
 
         # Header parsing.
         self.buffer = ByteFifo()
-        self.header = HeaderProcessingState.create()
+        self.header = HeaderProcessingState.create(max_size=max_header_size)
 
         self.current_header: Optional[HeadersMixin] = None
 
+        # Chunked-payload parsing (the size of the chunk being read, if its
+        # size line has been read).
+        self.chunks = bytearray()
+        self.chunk_size: Optional[int] = None
+
+    def _read_chunks(self) -> bool:
+        """
+        Read chunked-payload data and determine if the last chunk (and the
+        trailer section, which is discarded) has been read.
+        """
+
+        buffer = self.buffer
+
+        while True:
+            # Read a chunk-size line (ignoring any chunk extensions).
+            if self.chunk_size is None:
+                end = buffer.data.find(b"\r\n")
+                if end < 0:
+                    return False
+
+                line = buffer.pop(end + 2)
+                assert line is not None
+                self.chunk_size = int(line[:end].split(b";", 1)[0], 16)
+
+            # Read (and discard) trailer lines until an empty line.
+            if self.chunk_size == 0:
+                end = buffer.data.find(b"\r\n")
+                if end < 0:
+                    return False
+
+                buffer.pop(end + 2)
+                if end == 0:
+                    self.chunk_size = None
+                    return True
+
+            # Read chunk data (and its line ending).
+            else:
+                chunk = buffer.pop(self.chunk_size + 2)
+                if chunk is None:
+                    return False
+
+                self.chunks.extend(chunk[:-2])
+                self.chunk_size = None
+
     def ingest(
         self, data: BinaryMessage, kind: type[T]
     ) -> Iterator[tuple[T, Optional[bytearray]]]:
-        """Process a binary frame."""
+        """
+        Process a binary frame (raises 'HeaderSizeError' if a header section
+        exceeds the maximum size).
+        """
 
         self.buffer.ingest(data)
 
@@ -41,18 +92,29 @@ class HttpMessageProcessor:
             if self.current_header is None:
                 self.current_header = self.header.service(self.buffer, kind)
 
+                # Wait for more data if the header section isn't complete.
+                if self.current_header is None:
+                    break
+
             # Read payload data.
             if self.current_header is not None:
                 payload = None
 
-                # Determine if any data payload is expected, and if so if we
-                # have enough bytes to fully read it.
-                payload_len = self.current_header.content_length
-                can_read_payload = (
-                    payload_len == 0 or self.buffer.size >= payload_len
-                )
-                if can_read_payload:
-                    if payload_len > 0:
+                if self.current_header.chunked:
+                    can_read_payload = self._read_chunks()
+                    if can_read_payload:
+                        payload = self.chunks
+                        self.chunks = bytearray()
+                else:
+                    # Determine if any data payload is expected, and if so if
+                    # we have enough bytes to fully read it.
+                    payload_len = self.current_header.content_length
+                    can_read_payload = (
+                        payload_len == 0 or self.buffer.size >= payload_len
+                    )
+                    if can_read_payload and payload_len > 0:
                         payload = self.buffer.pop(payload_len)
+
+                if can_read_payload:
                     yield cast(T, self.current_header), payload
                     self.current_header = None
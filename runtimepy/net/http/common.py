@@ -14,6 +14,14 @@ from vcorelib.logging import LoggerType
 HTTPMethodlike = Union[str, http.HTTPMethod]
 HEADER_LINESEP = "\r\n"
 
+# The final chunk (and an empty trailer section) of a chunked payload.
+LAST_CHUNK = b"0\r\n\r\n"
+
+
+def encode_chunk(data: bytes) -> bytes:
+    """Encode data as a chunk (RFC 9112, section 7.1)."""
+    return f"{len(data):x}\r\n".encode() + data + b"\r\n"
+
 
 def normalize_method(data: HTTPMethodlike) -> http.HTTPMethod:
     """Normalize HTTP method data."""
@@ -52,6 +60,13 @@ class HeadersMixin(ABC):
         """Get a value for context length."""
         return int(self.get("content-length", "0"))  # type: ignore
 
+    @property
+    def chunked(self) -> bool:
+        """Determine if this message uses chunked transfer coding."""
+
+        value = self.get("transfer-encoding")
+        return value is not None and "chunked" in value.lower()
+
     def write_field_lines(self, stream: TextIO) -> None:
         """Write field lines to a stream."""
 
@@ -4,6 +4,7 @@ A module implementing an HTTP-header processing state interface.
 
 # built-in
 from dataclasses import dataclass
+import re
 from typing import Optional, TypeVar
 
 # third-party
@@ -15,18 +16,31 @@ from runtimepy.net.http.common import HeadersMixin
 
 T = TypeVar("T", bound=HeadersMixin)
 
+DEFAULT_MAX_HEADER_SIZE = 2**16
+
+# An empty line (any '\r\n' or bare '\n' sequence, twice in a row) signifies
+# the end of the header section.
+HEADER_END = re.compile(b"\r?\n\r?\n")
+
+
+class HeaderSizeError(ValueError):
+    """An error for header sections that exceed a maximum size."""
+
 
 @dataclass
 class HeaderProcessingState:
     """A container for header-related processing state."""
 
-    lines: list[str]
-    line: str
+    # Buffer offset to resume searching for the end of the header section.
+    scanned: int
+    max_size: int
 
     @staticmethod
-    def create() -> "HeaderProcessingState":
+    def create(
+        max_size: int = DEFAULT_MAX_HEADER_SIZE,
+    ) -> "HeaderProcessingState":
         """Create a default instance."""
-        return HeaderProcessingState([], "")
+        return HeaderProcessingState(0, max_size)
 
     def service(self, buffer: ByteFifo, kind: type[T]) -> Optional[T]:
         """
@@ -36,25 +50,35 @@ class HeaderProcessingState:
 
         result = None
 
-        while result is None and buffer.size:
-            curr_raw = buffer.pop(1)
-            if curr_raw is not None:
-                curr = curr_raw.decode(encoding=DEFAULT_ENCODING)
-
-                # Any '\r\n' sequence signifies the end of a header line.
-                if curr == "\n":
-                    if self.line:
-                        self.lines.append(self.line)
-                        self.line = ""
-
-                    # Two sequences in a row signifies the end of the header
-                    # section.
-                    else:
-                        result = kind()
-                        result.from_lines(self.lines)
-                        self.lines = []
-
-                elif curr != "\r":
-                    self.line += curr
+        # Back up in case part of the terminator was already scanned.
+        match = HEADER_END.search(buffer.data, max(self.scanned - 3, 0))
+
+        if match is None:
+            self.scanned = buffer.size
+            end = buffer.size
+        else:
+            self.scanned = 0
+            end = match.start()
+
+        if end > self.max_size:
+            raise HeaderSizeError(
+                f"Header section exceeds {self.max_size} bytes!"
+            )
+
+        if match is not None:
+            data = buffer.pop(match.end())
+            assert data is not None
+
+            result = kind()
+            result.from_lines(
+                [
+                    line
+                    for line in data[:end]
+                    .decode(encoding=DEFAULT_ENCODING)
+                    .replace("\r", "")
+                    .split("\n")
+                    if line
+                ]
+            )
 
         return result
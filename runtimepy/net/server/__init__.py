@@ -3,13 +3,21 @@ A module implementing a server interface for this package.
 """
 
 # built-in
+from collections.abc import Hashable
 import http
 from io import StringIO
 from json import loads
 import logging
 import mimetypes
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Optional, TextIO, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+    TextIO,
+    Union,
+)
 from urllib.parse import urlencode
 
 # third-party
@@ -25,9 +33,18 @@ from runtimepy.net.html import full_markdown_page
 from runtimepy.net.http.header import RequestHeader
 from runtimepy.net.http.request_target import PathMaybeQuery
 from runtimepy.net.http.response import AsyncFile, ResponseHeader
+from runtimepy.net.server.cache import (
+    DEFAULT_CHUNK_SIZE,
+    RenderCache,
+    StaticFileCache,
+)
 from runtimepy.net.server.html import HtmlApp, HtmlApps, get_html, html_handler
 from runtimepy.net.server.json import encode_json, json_handler
-from runtimepy.net.server.markdown import DIR_FILE, markdown_for_dir
+from runtimepy.net.server.markdown import (
+    DIR_FILE,
+    dir_state,
+    markdown_for_dir,
+)
 from runtimepy.net.server.mux import mux_app
 from runtimepy.net.tcp.http import HttpConnection, HttpResult
 from runtimepy.util import normalize_root, path_has_part, read_binary
@@ -65,6 +82,12 @@ class RuntimepyServerConnection(HttpConnection):
     class_paths: list[Pathlike] = [Path(), package_data_dir()]
     class_redirect_paths: dict[Path, Union[str, Path]] = {}
 
+    # Shared by all connections (many clients tend to request the same
+    # files at the same time).
+    file_cache = StaticFileCache()
+    render_cache = RenderCache()
+    chunk_size = DEFAULT_CHUNK_SIZE
+
     # Set these to control meta attributes.
     metadata: dict[str, Optional[str]] = {
         "title": HttpConnection.identity,
@@ -184,6 +207,28 @@ class RuntimepyServerConnection(HttpConnection):
             document.render(stream)
             return stream.getvalue().encode()
 
+    def render_key(
+        self, source: Hashable, query: Optional[str], **kwargs
+    ) -> Hashable:
+        """Get a render-cache key for rendering markdown from a source."""
+
+        return (
+            source,
+            query,
+            tuple(sorted(kwargs.items())),
+            tuple(sorted(type(self).metadata.items())),
+        )
+
+    def cached_render(
+        self, key: Hashable, response: ResponseHeader
+    ) -> Optional[bytes]:
+        """Get previously rendered content."""
+
+        result = self.render_cache.get(key)
+        if result is not None:
+            response["Content-Type"] = f"text/html; charset={DEFAULT_ENCODING}"
+        return result
+
     async def render_markdown_file(
         self,
         path: Path,
@@ -193,15 +238,100 @@ class RuntimepyServerConnection(HttpConnection):
     ) -> bytes:
         """Render a markdown file as HTML and return the result."""
 
-        return self.render_markdown(
-            (await read_binary(path)).decode(), response, query, **kwargs
+        stat = path.stat()
+        key = self.render_key(
+            (path, stat.st_mtime_ns, stat.st_size), query, **kwargs
+        )
+
+        result = self.cached_render(key, response)
+        if result is None:
+            result = self.render_cache.put(
+                key,
+                self.render_markdown(
+                    (await read_binary(path)).decode(),
+                    response,
+                    query,
+                    **kwargs,
+                ),
+            )
+
+        return result
+
+    def render_directories(
+        self,
+        directories: list[tuple[Path, Path]],
+        response: ResponseHeader,
+        query: Optional[str],
+    ) -> bytes:
+        """
+        Render directory listings as HTML and return the result. Listings are
+        re-rendered when directory entries (or their sizes and modification
+        times) change.
+        """
+
+        apps = tuple(self.apps)
+        key = self.render_key(
+            (
+                tuple(
+                    (path, base, dir_state(path)) for path, base in directories
+                ),
+                apps,
+            ),
+            query,
         )
 
+        result = self.cached_render(key, response)
+        if result is None:
+            result = self.render_cache.put(
+                key,
+                self.render_markdown(
+                    markdown_for_dir(directories, {"applications": apps}),
+                    response,
+                    query,
+                ),
+            )
+
+        return result
+
+    async def serve_file(
+        self,
+        path: Path,
+        response: ResponseHeader,
+        request: Optional[RequestHeader] = None,
+    ) -> HttpResult:
+        """Serve a file-system file (if it exists) via the file cache."""
+
+        entry = await self.file_cache.get(path)
+        if entry is None:
+            return None
+
+        self.logger.info("Serving '%s' (MIME: %s)", path, entry.mime)
+
+        # Clients should re-validate (using the entity tag).
+        response.static_resource("no-cache")
+
+        result: HttpResult = entry.respond(response, request)
+        if result is None:
+            result = AsyncFile(path, chunk_size=self.chunk_size)
+
+        return result
+
     async def try_file(
-        self, path: PathMaybeQuery, response: ResponseHeader
+        self,
+        path: PathMaybeQuery,
+        response: ResponseHeader,
+        request: Optional[RequestHeader] = None,
     ) -> HttpResult:
         """Try serving this path as a file directly from the file-system."""
 
+        # Check for a previously resolved file.
+        resolved = self.file_cache.resolve(self.paths, path[0])
+        if resolved is not None:
+            cached = await self.serve_file(resolved, response, request)
+            if cached is not None:
+                return cached
+            self.file_cache.forget(self.paths, path[0])
+
         result: HttpResult = None
 
         # Keep track of directories encountered.
@@ -231,40 +361,15 @@ class RuntimepyServerConnection(HttpConnection):
                     )
 
             # Handle files.
-            if candidate.is_file():
-                mime, encoding = mimetypes.guess_type(candidate, strict=False)
-
-                # Set MIME type if it can be determined.
-                if mime:
-                    # webhint suggestion
-                    if (
-                        mime.startswith("text")
-                        and DEFAULT_ENCODING not in mime
-                    ):
-                        mime += f"; charset={DEFAULT_ENCODING}"
-
-                    response["Content-Type"] = mime
-
-                # We don't handle this yet.
-                assert not encoding, (candidate, mime, encoding)
-
-                self.logger.info("Serving '%s' (MIME: %s)", candidate, mime)
-
-                response.static_resource()
-
-                # Return the file data.
-                result = AsyncFile(candidate)
+            result = await self.serve_file(candidate, response, request)
+            if result is not None:
+                self.file_cache.remember(self.paths, path[0], candidate)
                 break
 
-        # Handle a directory as a last resort.
-        if not result and directories:
-            result = self.render_markdown(
-                markdown_for_dir(
-                    directories, {"applications": self.apps.keys()}
-                ),
-                response,
-                path[1],
-            )
+        # Handle a directory as a last resort (an empty result may be a
+        # 'Not Modified' response).
+        if result is None and directories:
+            result = self.render_directories(directories, response, path[1])
 
         return result
 
@@ -361,7 +466,7 @@ class RuntimepyServerConnection(HttpConnection):
 
         request.log(self.logger, False, level=logging.INFO)
 
-        result = None
+        result: HttpResult = None
         populated = False
 
         with StringIO() as stream:
@@ -380,13 +485,16 @@ class RuntimepyServerConnection(HttpConnection):
                         response, request, request_data
                     )
 
-                # Try serving a file and handling redirects.
-                for handler in [self.try_redirect, self.try_file]:
-                    result = await handler(
-                        request.target.origin_form, response
+                # Try handling redirects and serving a file.
+                result = await self.try_redirect(
+                    request.target.origin_form, response
+                )
+                if result is None:
+                    result = await self.try_file(
+                        request.target.origin_form, response, request
                     )
-                    if result is not None:
-                        return result
+                if result is not None:
+                    return result
 
                 # Handle raw data queries.
                 if path_has_part(request.target.path):
@@ -3,6 +3,7 @@ A module implementing a simple application harnessing interface.
 """
 
 # built-in
+from collections.abc import Hashable
 from typing import Callable, Optional, TypeVar
 
 # third-party
@@ -10,6 +11,7 @@ from svgen.element.html import Html
 from vcorelib.logging import LoggerMixin
 
 # internal
+from runtimepy.channel.environment.command import GLOBAL
 from runtimepy.net.arbiter.info import AppInfo
 from runtimepy.net.html.bootstrap.tabs import TabbedContent
 from runtimepy.net.http.header import RequestHeader
@@ -17,7 +19,9 @@ from runtimepy.net.http.response import ResponseHeader
 from runtimepy.net.server.app.base import WebApplication
 from runtimepy.net.server.html import HtmlApp
 
-DOCUMENTS: dict[str, Html] = {}
+# Composed documents and the global-environment state they were composed
+# with.
+DOCUMENTS: dict[str, tuple[Html, Hashable]] = {}
 T = TypeVar("T")
 
 
@@ -53,11 +57,14 @@ def create_cacheable_app(app: AppInfo, compose: HtmlAppComposer) -> HtmlApp:
             populate = True
 
             compose_name = compose.__name__
+            fingerprint = GLOBAL.fingerprint
 
-            # Use the already-rendered document.
+            # Use the already-composed document (unless environments have
+            # changed since it was composed).
             if config_param(app, "caching", True):
-                if compose_name in DOCUMENTS:
-                    document = DOCUMENTS[compose_name]
+                cached = DOCUMENTS.get(compose_name)
+                if cached is not None and cached[1] == fingerprint:
+                    document = cached[0]
                     populate = False
 
             if populate:
@@ -65,7 +72,7 @@ def create_cacheable_app(app: AppInfo, compose: HtmlAppComposer) -> HtmlApp:
                 document = compose(
                     app, document, request, response, request_data
                 )
-                DOCUMENTS[compose_name] = document
+                DOCUMENTS[compose_name] = (document, fingerprint)
 
         return document
 
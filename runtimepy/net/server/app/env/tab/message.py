@@ -3,7 +3,6 @@ A module implementing a channel-environment tab message-handling interface.
 """
 
 # built-in
-from io import BytesIO
 import logging
 from typing import Any, Callable
 
@@ -11,8 +10,8 @@ from typing import Any, Callable
 from runtimepy.channel import Channel
 from runtimepy.message import JsonMessage
 from runtimepy.net.server.app.env.tab.base import ChannelEnvironmentTabBase
-from runtimepy.net.server.websocket.state import TabState
-from runtimepy.primitives.types.int import Uint16  # , Uint64
+from runtimepy.net.server.websocket.state import BINARY_POINT_KINDS, TabState
+from runtimepy.primitives.types.int import Uint16
 
 TabMessageSender = Callable[[JsonMessage], None]
 
@@ -45,43 +44,42 @@ class ChannelEnvironmentTabMessaging(ChannelEnvironmentTabBase):
                 (self.command.env.value(name, value=new), prim.last_updated_ns)
             )
 
-        # Create an environment and channel id header.
-        binary_header = bytes()
-        if isinstance(chan, Channel):
-            with BytesIO() as stream:
-                prim_type = Uint16
-                assert prim_type.int_bounds is not None
-                assert chan.id <= prim_type.int_bounds.max, name
-                assert self.command.env.id <= prim_type.int_bounds.max, name
-                stream.write(prim_type.encode(self.command.env.id))
-                stream.write(prim_type.encode(chan.id))
-                binary_header = stream.getvalue()
+        state.primitives[name] = prim
+
+        # Channels with raw values are sent as binary points.
+        if (
+            not isinstance(chan, Channel)
+            or chan.is_enum
+            or prim.scaling
+            or prim.kind.name not in BINARY_POINT_KINDS
+        ):
+            state.callbacks[name] = prim.register_callback(enum_callback)
+            return
+
+        env_id = self.command.env.id
+        chan_id = chan.id
+
+        assert Uint16.int_bounds is not None
+        assert chan_id <= Uint16.int_bounds.max, name
+        assert env_id <= Uint16.int_bounds.max, name
+
+        points = state.binary.channel(env_id, chan_id, name, prim.kind)
+        stamps = points.timestamps
+        values = points.values
 
         def callback(
             curr: bool | int | float, new: bool | int | float
         ) -> None:
             """Emit a change event to the stream."""
 
-            # Binary implementation doesn't beat JSON performance yet.
-
             if prim.set_streak:
-                # state.binary.ingest(binary_header)
-                # state.binary.ingest(Uint64.encode(prim.prev_updated_ns))
-                # state.binary.ingest(prim.kind.encode(curr))
-                state.points[name].append((curr, prim.prev_updated_ns))
-
-            # state.binary.ingest(binary_header)
-            # state.binary.ingest(Uint64.encode(prim.last_updated_ns))
-            # state.binary.ingest(prim.kind.encode(new))
-            state.points[name].append((new, prim.last_updated_ns))
+                stamps.append(prim.prev_updated_ns)
+                values.append(curr)
 
-        state.primitives[name] = prim
+            stamps.append(prim.last_updated_ns)
+            values.append(new)
 
-        state.callbacks[name] = prim.register_callback(
-            enum_callback
-            if chan.is_enum or prim.scaling or not binary_header
-            else callback
-        )
+        state.callbacks[name] = prim.register_callback(callback)
 
     def handle_shown_state(
         self,
@@ -157,6 +155,11 @@ class ChannelEnvironmentTabMessaging(ChannelEnvironmentTabBase):
                 level=logging.DEBUG if result else logging.ERROR,
             )
 
+        # Handle plot-state messages.
+        elif kind == "plot":
+            if "width" in data["value"]:
+                state.set_plot_width(int(data["value"]["width"]))
+
         # Handle tab-event messages.
         elif kind.startswith("tab"):
             if "shown" in kind:
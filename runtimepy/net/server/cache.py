@@ -0,0 +1,303 @@
+"""
+A module implementing static-file and rendered-content caches for HTTP
+servers.
+"""
+
+# built-in
+from collections import OrderedDict
+from collections.abc import Hashable
+from hashlib import sha256
+import http
+import mimetypes
+import os
+from pathlib import Path
+from stat import S_ISREG
+from typing import NamedTuple, Optional
+import zlib
+
+# third-party
+from vcorelib import DEFAULT_ENCODING
+
+# internal
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.http.response import ResponseHeader
+from runtimepy.util import read_binary
+
+DEFAULT_CACHE_SIZE = 2**25
+DEFAULT_MAX_FILE_SIZE = 2**21
+DEFAULT_CHUNK_SIZE = 2**16
+DEFAULT_MAX_RESOLVED = 1024
+DEFAULT_MAX_RENDERED = 128
+
+# Media types (other than 'text/*') that are worth compressing.
+COMPRESSIBLE = {
+    "application/javascript",
+    "application/json",
+    "application/xml",
+    "image/svg+xml",
+    "application/toml",
+    "application/yaml",
+}
+
+
+def file_mime(path: Path) -> Optional[str]:
+    """Determine a file's MIME type (including a charset for text)."""
+
+    mime, encoding = mimetypes.guess_type(path, strict=False)
+
+    # We don't handle this yet.
+    assert not encoding, (path, mime, encoding)
+
+    # webhint suggestion
+    if mime and mime.startswith("text") and DEFAULT_ENCODING not in mime:
+        mime += f"; charset={DEFAULT_ENCODING}"
+
+    return mime
+
+
+def compressible(mime: Optional[str]) -> bool:
+    """Determine if content of a given MIME type should be compressed."""
+
+    return mime is not None and (
+        mime.startswith("text") or mime.split(";")[0] in COMPRESSIBLE
+    )
+
+
+def accepts_encoding(request: RequestHeader, encoding: str) -> bool:
+    """Determine if a request accepts a given content coding."""
+
+    for item in request.get("accept-encoding", "").split(","):  # type: ignore
+        name, *params = [x.strip() for x in item.split(";")]
+        if name.lower() in {encoding, "*"}:
+            for param in params:
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        return float(value) > 0.0
+                    except ValueError:
+                        return False
+            return True
+
+    return False
+
+
+def etag_matches(request: RequestHeader, etag: str) -> bool:
+    """
+    Determine if a request's 'If-None-Match' field matches an entity tag
+    (using weak comparison).
+    """
+
+    value = request.get("if-none-match")
+    if value is None:
+        return False
+
+    return value.strip() == "*" or any(
+        x.strip().removeprefix("W/") == etag for x in value.split(",")
+    )
+
+
+class CachedFile(NamedTuple):
+    """A file's cached content and metadata."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    mime: Optional[str]
+    etag: str
+
+    # File contents (if the file wasn't too large to cache).
+    data: Optional[bytes]
+    deflated: Optional[bytes]
+
+    @property
+    def footprint(self) -> int:
+        """Get the number of bytes this entry occupies in a cache."""
+        return len(self.data or b"") + len(self.deflated or b"")
+
+    def current(self, stat: os.stat_result) -> bool:
+        """Determine if this entry is still valid for a file's status."""
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+    def respond(
+        self, response: ResponseHeader, request: Optional[RequestHeader]
+    ) -> Optional[bytes]:
+        """
+        Populate a response from this entry. Returns payload data, or None
+        if the file must be read from the file-system.
+        """
+
+        deflate = (
+            self.deflated is not None
+            and request is not None
+            and accepts_encoding(request, "deflate")
+        )
+
+        # Each representation has its own entity tag.
+        etag = self.etag[:-1] + '-deflate"' if deflate else self.etag
+
+        if self.mime:
+            response["Content-Type"] = self.mime
+        response["ETag"] = etag
+        if self.deflated is not None:
+            response["Vary"] = "Accept-Encoding"
+
+        if request is not None and etag_matches(request, etag):
+            response.status = http.HTTPStatus.NOT_MODIFIED
+            return bytes()
+
+        if deflate:
+            response["Content-Encoding"] = "deflate"
+            return self.deflated
+
+        return self.data
+
+
+class StaticFileCache:
+    """
+    A class implementing a size-bounded, least-recently-used cache of
+    resolved request paths and file contents. Entries are invalidated when
+    a file's modification time or size changes.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+        max_resolved: int = DEFAULT_MAX_RESOLVED,
+    ) -> None:
+        """Initialize this instance."""
+
+        self.max_size = max_size
+        self.max_file_size = max_file_size
+        self.max_resolved = max_resolved
+        self.size = 0
+
+        self.files: OrderedDict[Path, CachedFile] = OrderedDict()
+        self.resolved: OrderedDict[tuple[tuple[Path, ...], str], Path] = (
+            OrderedDict()
+        )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+
+        self.files.clear()
+        self.resolved.clear()
+        self.size = 0
+
+    def resolve(self, paths: list[Path], target: str) -> Optional[Path]:
+        """Look up a previously resolved file for a request path."""
+
+        key = (tuple(paths), target)
+        result = self.resolved.get(key)
+        if result is not None:
+            self.resolved.move_to_end(key)
+        return result
+
+    def remember(self, paths: list[Path], target: str, path: Path) -> None:
+        """Store a resolved file for a request path."""
+
+        self.resolved[(tuple(paths), target)] = path
+
+        while len(self.resolved) > self.max_resolved:
+            self.resolved.popitem(last=False)
+
+    def forget(self, paths: list[Path], target: str) -> None:
+        """Remove a resolved file for a request path."""
+        self.resolved.pop((tuple(paths), target), None)
+
+    def _evict(self) -> None:
+        """Remove least-recently-used entries until within size bounds."""
+
+        while self.size > self.max_size and self.files:
+            self.size -= self.files.popitem(last=False)[1].footprint
+
+    def _remove(self, path: Path) -> None:
+        """Remove a file entry if present."""
+
+        entry = self.files.pop(path, None)
+        if entry is not None:
+            self.size -= entry.footprint
+
+    async def get(self, path: Path) -> Optional[CachedFile]:
+        """
+        Get a (current) cache entry for a file, loading it if necessary.
+        Returns None if the file doesn't exist.
+        """
+
+        try:
+            stat = path.stat()
+        except OSError:
+            stat = None
+
+        if stat is None or not S_ISREG(stat.st_mode):
+            self._remove(path)
+            return None
+
+        entry = self.files.get(path)
+        if entry is not None and entry.current(stat):
+            self.files.move_to_end(path)
+            return entry
+
+        self._remove(path)
+
+        mime = file_mime(path)
+        data = None
+        deflated = None
+
+        if stat.st_size <= self.max_file_size:
+            data = await read_binary(path)
+            etag = f'"{sha256(data).hexdigest()[:32]}"'
+
+            if compressible(mime):
+                candidate = zlib.compress(data, 9)
+                if len(candidate) < len(data):
+                    deflated = candidate
+
+        # Files too large to cache are tagged by modification time and size.
+        else:
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+        entry = CachedFile(
+            path, stat.st_mtime_ns, stat.st_size, mime, etag, data, deflated
+        )
+
+        if entry.footprint:
+            self.files[path] = entry
+            self.size += entry.footprint
+            self._evict()
+
+        return entry
+
+
+class RenderCache:
+    """
+    A class implementing a least-recently-used cache of rendered content
+    (keyed by e.g. source-file modification times).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_RENDERED) -> None:
+        """Initialize this instance."""
+
+        self.max_entries = max_entries
+        self.rendered: OrderedDict[Hashable, bytes] = OrderedDict()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.rendered.clear()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Get previously rendered content."""
+
+        result = self.rendered.get(key)
+        if result is not None:
+            self.rendered.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, data: bytes) -> bytes:
+        """Store rendered content."""
+
+        self.rendered[key] = data
+        while len(self.rendered) > self.max_entries:
+            self.rendered.popitem(last=False)
+
+        return data
@@ -3,7 +3,9 @@ A module implementing HTML interfaces for web applications.
 """
 
 # built-in
+from io import StringIO
 from typing import Awaitable, Callable, Optional, TextIO
+from weakref import WeakKeyDictionary
 
 # third-party
 from svgen.element import Element
@@ -20,6 +22,25 @@ HtmlApp = Callable[
 ]
 HtmlApps = dict[str, HtmlApp]
 
+# Rendered documents (applications may serve the same document repeatedly).
+RENDERED: WeakKeyDictionary[Html, str] = WeakKeyDictionary()
+
+
+def render_html(document: Html) -> str:
+    """
+    Render an HTML document (or get the previous result of rendering it).
+    Documents must not be modified after they're first rendered.
+    """
+
+    result = RENDERED.get(document)
+    if result is None:
+        with StringIO() as stream:
+            document.render(stream)
+            result = stream.getvalue()
+        RENDERED[document] = result
+
+    return result
+
 
 def get_html(
     title: str = HttpConnection.identity,
@@ -70,8 +91,10 @@ async def html_handler(
     # Create the application.
     app = apps.get(request.target.path, default_app)
     if app is not None:
-        (
-            await app(get_html(**kwargs), request, response, request_data)
-        ).render(stream)
+        stream.write(
+            render_html(
+                await app(get_html(**kwargs), request, response, request_data)
+            )
+        )
 
     return app is not None
@@ -5,7 +5,7 @@ A module implementing web server markdown interfaces.
 # built-in
 from io import StringIO
 import mimetypes
-from os import stat_result
+from os import scandir, stat_result
 from pathlib import Path
 from typing import Iterable, cast
 
@@ -100,6 +100,22 @@ def write_markdown_dir(
     writer.empty()
 
 
+def dir_state(path: Path) -> tuple[tuple[str, int, int], ...]:
+    """
+    Get the names, modification times and sizes of a directory's entries
+    (everything a rendered listing depends on).
+    """
+
+    result = []
+
+    with scandir(path) as entries:
+        for entry in entries:
+            stats = entry.stat()
+            result.append((entry.name, stats.st_mtime_ns, stats.st_size))
+
+    return tuple(sorted(result))
+
+
 def markdown_for_dir(
     paths_bases: Iterable[tuple[Path, Path]],
     extra_links: dict[str, Iterable[str]] = None,
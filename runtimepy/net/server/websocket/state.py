@@ -3,13 +3,15 @@ A module implementing a stateful data interface for per-connection tabs.
 """
 
 # built-in
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass
 import logging
-from typing import Optional
+from struct import Struct
+import sys
+from typing import Any, NamedTuple, Optional, Sequence
 
 # third-party
-from vcorelib.io import ByteFifo
 from vcorelib.logging import ListLogger
 
 # internal
@@ -19,10 +21,195 @@ from runtimepy.net.server.websocket.data import (
     RuntimepyDataWebsocketConnection,
 )
 from runtimepy.primitives import AnyPrimitive
+from runtimepy.primitives.byte_order import DEFAULT_BYTE_ORDER
+from runtimepy.primitives.types import AnyPrimitiveType
 
 # (value, nanosecond timestamp)
 Point = tuple[str | int | float | bool, int]
 
+DEFAULT_POINT_CAPACITY = 2**16
+
+# Primitive types the UI's data connection can decode (and the array type
+# used to buffer values of each type). Boolean channels are sent as JSON
+# points so the UI receives boolean (not numeric) values.
+BINARY_POINT_KINDS = {
+    "int8": "b",
+    "int16": "h",
+    "int32": "i",
+    "int64": "q",
+    "uint8": "B",
+    "uint16": "H",
+    "uint32": "I",
+    "uint64": "Q",
+    "float": "f",
+    "double": "d",
+}
+
+# Arrays use native byte order, the data connection uses network byte order.
+SWAP = sys.byteorder != "big"
+
+
+def minmax_indices(values: Sequence[Any], buckets: int) -> list[int]:
+    """
+    Get the indices of points to keep when decimating a sequence of values
+    to (at most) a number of buckets. The minimum and maximum values of each
+    (equally sized) bucket are kept (in order), as is the last value.
+    """
+
+    count = len(values)
+    if count <= buckets * 2:
+        return list(range(count))
+
+    result: list[int] = []
+    for bucket in range(buckets):
+        start = (bucket * count) // buckets
+        segment = values[start : ((bucket + 1) * count) // buckets]
+
+        low = start + segment.index(min(segment))
+        high = start + segment.index(max(segment))
+        result.extend((low, high) if low <= high else (high, low))
+
+    if result[-1] != count - 1:
+        result.append(count - 1)
+
+    return result
+
+
+class ChannelPoints(NamedTuple):
+    """Buffered points for a single channel."""
+
+    name: str
+    header: bytes
+    codec: Struct
+
+    timestamps: array[int]
+    values: array[Any]
+
+    def __len__(self) -> int:
+        """Get the number of buffered points."""
+        return len(self.timestamps)
+
+    def decimate(self, buckets: int) -> None:
+        """Decimate buffered points (preserving extrema)."""
+
+        keep = minmax_indices(self.values, buckets)
+        if len(keep) < len(self.values):
+            self.timestamps[:] = array(
+                self.timestamps.typecode, [self.timestamps[x] for x in keep]
+            )
+            self.values[:] = array(
+                self.values.typecode, [self.values[x] for x in keep]
+            )
+
+    def encode(self, buffer: bytearray, offset: int) -> int:
+        """
+        Write buffered points to a buffer (as contiguous records) and reset.
+        Returns the offset after the last record.
+        """
+
+        count = len(self.timestamps)
+        size = self.codec.size
+        end = offset + count * size
+
+        # Write each byte position of every record at once (strided).
+        for idx, byte in enumerate(self.header):
+            buffer[offset + idx : end : size] = bytes((byte,)) * count
+
+        start = offset + len(self.header)
+        for column in (self.timestamps, self.values):
+            if SWAP:
+                column.byteswap()
+            raw = column.tobytes()
+            width = column.itemsize
+
+            for idx in range(width):
+                buffer[start + idx : end : size] = raw[idx::width]
+
+            start += width
+            del column[:]
+
+        return end
+
+
+class BinaryPoints:
+    """
+    A class implementing preallocated buffers for binary channel points.
+    Points are buffered by channel (as timestamp and value columns) and then
+    encoded as records of an environment identifier, a channel identifier, a
+    nanosecond timestamp and a value (the format the UI's data connection
+    decodes).
+    """
+
+    header = Struct(DEFAULT_BYTE_ORDER.fmt + "HH")
+
+    def __init__(self, capacity: int = DEFAULT_POINT_CAPACITY) -> None:
+        """Initialize this instance."""
+
+        self.buffer = bytearray(capacity)
+
+        # Buffered points by (environment, channel) identifier.
+        self.channels: dict[tuple[int, int], ChannelPoints] = {}
+
+    @property
+    def size(self) -> int:
+        """Get the number of encoded bytes currently buffered."""
+        return sum(len(x) * x.codec.size for x in self.channels.values())
+
+    def channel(
+        self, env_id: int, chan_id: int, name: str, kind: AnyPrimitiveType
+    ) -> ChannelPoints:
+        """Create point buffers for a channel."""
+
+        result = ChannelPoints(
+            name,
+            self.header.pack(env_id, chan_id),
+            Struct(DEFAULT_BYTE_ORDER.fmt + "HHQ" + kind.format),
+            array("Q"),
+            array(BINARY_POINT_KINDS[kind.name]),
+        )
+        self.channels[(env_id, chan_id)] = result
+        return result
+
+    def drain(self, buckets: int = None) -> bytes:
+        """
+        Encode all buffered points (optionally decimating each channel's
+        points) and reset.
+        """
+
+        if buckets is not None:
+            for points in self.channels.values():
+                points.decimate(buckets)
+
+        size = self.size
+        if size > len(self.buffer):
+            self.buffer.extend(bytes(size - len(self.buffer)))
+
+        offset = 0
+        for points in self.channels.values():
+            if points:
+                offset = points.encode(self.buffer, offset)
+
+        with memoryview(self.buffer) as view:
+            return bytes(view[:offset])
+
+    def decode(self, data: bytes) -> dict[str, list[Point]]:
+        """Decode point data (by channel name)."""
+
+        result: dict[str, list[Point]] = defaultdict(list)
+
+        offset = 0
+        while offset < len(data):
+            points = self.channels[self.header.unpack_from(data, offset)]
+            _, _, timestamp_ns, value = points.codec.unpack_from(data, offset)
+            result[points.name].append((value, timestamp_ns))
+            offset += points.codec.size
+
+        return result
+
+    def clear(self) -> None:
+        """Reset this instance."""
+        self.channels.clear()
+
 
 @dataclass
 class TabState:
@@ -39,7 +226,28 @@ class TabState:
 
     _loggers: list[logging.Logger]
 
-    binary: ByteFifo
+    binary: BinaryPoints
+
+    # Decimate each channel's points (per frame) to this many buckets.
+    buckets: Optional[int] = None
+
+    def set_plot_width(self, width: int) -> None:
+        """Set the plot width (in pixels) that points are decimated for."""
+
+        # Use a bucket for each horizontal pixel.
+        self.buckets = width if width > 0 else None
+
+    def decimate(self) -> None:
+        """Decimate each channel's (numeric) points."""
+
+        if self.buckets is None:
+            return
+
+        for name, points in self.points.items():
+            if points and not isinstance(points[0][0], str):
+                keep = minmax_indices([x[0] for x in points], self.buckets)
+                if len(keep) < len(points):
+                    self.points[name] = [points[x] for x in keep]
 
     def frame(
         self,
@@ -57,16 +265,23 @@ class TabState:
         if self.tab_logger:
             result["log_messages"] = self.tab_logger.drain_str()
 
+        self.decimate()
+
+        # Forward binary channel updates (or include them with other updates
+        # if there's no data connection).
+        if self.binary.size:
+            msg = self.binary.drain(buckets=self.buckets)
+            if data_connection is not None:
+                data_connection.send_message(msg)
+            else:
+                for name, points in self.binary.decode(msg).items():
+                    self.points[name].extend(points)
+
         # Handle channel updates.
         if self.points:
             result["points"] = self.points
             self.points = defaultdict(list)
 
-        # Forward binary data (not used yet).
-        msg = self.binary.pop(self.binary.size)
-        if msg and data_connection is not None:
-            data_connection.send_message(msg)  # pragma: nocover
-
         return result
 
     def clear_telemetry(self) -> None:
@@ -80,7 +295,7 @@ class TabState:
 
         # Clear points.
         self.points.clear()
-        self.binary.pop(self.binary.size)
+        self.binary.clear()
 
     def clear_loggers(self) -> None:
         """Clear all logging handlers."""
@@ -113,5 +328,5 @@ class TabState:
             {},
             {},
             [],
-            ByteFifo(),
+            BinaryPoints(),
         )
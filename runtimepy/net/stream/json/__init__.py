@@ -4,11 +4,14 @@ A module implementing a JSON message connection interface.
 
 # built-in
 from argparse import Namespace
-from json import JSONDecodeError, loads
-from typing import Optional
+from typing import BinaryIO, Optional
+
+# third-party
+from vcorelib.io import BinaryMessage
 
 # internal
 from runtimepy.channel.environment.command import FieldOrChannel
+from runtimepy.message.codec import JsonData
 from runtimepy.message.interface import JsonMessageInterface
 from runtimepy.mixins.async_command import AsyncCommandProcessingMixin
 from runtimepy.net.stream.string import StringMessageConnection
@@ -64,20 +67,42 @@ class JsonMessageConnection(
         return result
 
     async def process_message(
-        self, data: str, addr: tuple[str, int] = None
+        self, data: JsonData, addr: tuple[str, int] = None
     ) -> bool:
-        """Process a string message."""
+        """Process a JSON message."""
 
         result = True
 
         try:
-            decoded = loads(data)
+            decoded = self.processor.codec.decode(data)
 
-            if decoded and isinstance(decoded, dict):
-                result = await self.process_json(decoded, addr=addr)
-            else:
-                self.logger.error("Ignoring message '%s'.", data)
-        except JSONDecodeError as exc:
+        # Both the standard library and 'orjson' raise ValueError subclasses.
+        except ValueError as exc:
             self.logger.exception("Couldn't decode '%s': %s", data, exc)
+            return result
+
+        if decoded and isinstance(decoded, dict):
+            result = await self.process_json(decoded, addr=addr)
+        else:
+            self.logger.error("Ignoring message '%s'.", data)
+
+        return result
+
+    async def process_single(
+        self, stream: BinaryIO, addr: tuple[str, int] = None
+    ) -> bool:
+        """Process a single message."""
+        return await self.process_message(stream.read(), addr=addr)
+
+    async def process_binary(
+        self, data: BinaryMessage, addr: tuple[str, int] = None
+    ) -> bool:
+        """Process an incoming message."""
+
+        result = True
+
+        # Decode messages directly (without a per-message stream).
+        for message in self.processor.process(data):
+            result &= await self.process_message(message, addr=addr)
 
         return result
@@ -4,6 +4,7 @@ A module implementing a basic HTTP (multiple RFC's) connection interface.
 
 # built-in
 import asyncio
+from collections import deque
 from copy import copy
 import http
 from json import loads
@@ -16,8 +17,10 @@ from vcorelib.io import BinaryMessage
 # internal
 from runtimepy import PKG_NAME, VERSION
 from runtimepy.net.http import HttpMessageProcessor
+from runtimepy.net.http.common import LAST_CHUNK, encode_chunk
 from runtimepy.net.http.header import RequestHeader
 from runtimepy.net.http.response import AsyncResponse, ResponseHeader
+from runtimepy.net.http.state import HeaderSizeError
 from runtimepy.net.tcp.connection import TcpConnection as _TcpConnection
 
 HttpResult = Optional[BinaryMessage | AsyncResponse]
@@ -63,8 +66,6 @@ class HttpConnection(_TcpConnection):
 
     identity = IDENTITY
 
-    expecting_response: bool
-
     log_alias = "HTTP"
 
     # Handlers registered at the class level so that instances created at
@@ -83,15 +84,27 @@ class HttpConnection(_TcpConnection):
         # Incoming request handling.
         self.processor = HttpMessageProcessor()
 
-        # Outgoing request handling.
+        # Outgoing request handling. Requests may be pipelined, responses
+        # resolve pending requests in order.
         self.request_ready = asyncio.BoundedSemaphore()
-        self.expecting_response = False
-        self.responses: asyncio.Queue[HttpResponse] = asyncio.Queue(maxsize=1)
+        self.pending: deque[asyncio.Future[HttpResponse]] = deque()
 
         self.handlers = copy(self.handlers)
         self.handlers[http.HTTPMethod.GET] = self.get_handler
         self.handlers[http.HTTPMethod.POST] = self.post_handler
 
+    @property
+    def expecting_response(self) -> bool:
+        """Determine if any requests are awaiting responses."""
+        return bool(self.pending)
+
+    def disable_extra(self) -> None:
+        """Additional tasks to perform when disabling."""
+
+        # Requests can no longer be responded to.
+        while self.pending:
+            self.pending.popleft().cancel()
+
     @classmethod
     def get_log_prefix(cls, is_ssl: bool = False) -> str:
         """Get a logging prefix for this instance."""
@@ -146,18 +159,24 @@ class HttpConnection(_TcpConnection):
     async def request(
         self, request: RequestHeader, data: Optional[BinaryMessage] = None
     ) -> HttpResponse:
-        """Make an HTTP request."""
+        """
+        Make an HTTP request. Requests are sent without waiting for previous
+        responses (pipelined).
+        """
 
-        async with self.request_ready:
-            # Set boilerplate header data.
-            request["user-agent"] = self.identity
+        # Set boilerplate header data.
+        request["user-agent"] = self.identity
 
+        result: asyncio.Future[HttpResponse] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+        # Keep request data (and pending responses) in order.
+        async with self.request_ready:
+            self.pending.append(result)
             await self._send(request, data)
-            self.expecting_response = True
-            result = await self.responses.get()
-            self.expecting_response = False
 
-        return result
+        return await result
 
     async def request_json(
         self, request: RequestHeader, data: Optional[BinaryMessage] = None
@@ -173,14 +192,21 @@ class HttpConnection(_TcpConnection):
         header: Union[ResponseHeader, RequestHeader],
         data: HttpResult = None,
     ) -> None:
-        """Send a request or response to a request."""
+        """
+        Send a request or response to a request. Asynchronous responses of
+        unknown size are sent with chunked transfer coding.
+        """
 
         size = None
         if isinstance(data, AsyncResponse):
             size = await data.size()
         elif data is not None:
             size = len(data)
-        if size is not None:
+
+        chunked = isinstance(data, AsyncResponse) and size is None
+        if chunked:
+            header["transfer-encoding"] = "chunked"
+        elif size is not None:
             header["content-length"] = str(size)
 
         self.send_binary(bytes(header))
@@ -188,7 +214,15 @@ class HttpConnection(_TcpConnection):
         if data is not None:
             if isinstance(data, AsyncResponse):
                 async for chunk in data.process():
-                    self.send_binary(chunk)
+                    if not chunked:
+                        self.send_binary(chunk)
+
+                    # Empty chunks would terminate the payload.
+                    elif chunk:
+                        self.send_binary(encode_chunk(chunk))
+
+                if chunked:
+                    self.send_binary(LAST_CHUNK)
             else:
                 self.send_binary(data)
 
@@ -197,13 +231,33 @@ class HttpConnection(_TcpConnection):
     async def process_binary(self, data: BinaryMessage) -> bool:
         """Process a binary frame."""
 
+        try:
+            await self._process_messages(data)
+        except HeaderSizeError as exc:
+            self.logger.error("Closing connection: %s", exc)
+
+            if not self.expecting_response:
+                response = ResponseHeader(
+                    status=http.HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE
+                )
+                await self._send(response)
+
+            return False
+
+        return True
+
+    async def _process_messages(self, data: BinaryMessage) -> None:
+        """Process (and respond to) any complete messages."""
+
+        # Messages in this batch are either all requests or all responses.
+        responses = self.expecting_response
+
         for header, payload in self.processor.ingest(
-            data,
-            RequestHeader if not self.expecting_response else ResponseHeader,
+            data, ResponseHeader if responses else RequestHeader
         ):
             header.log(self.logger, False)
 
-            if not self.expecting_response:
+            if not responses:
                 # Process request.
                 response = ResponseHeader()
                 await self._send(
@@ -213,10 +267,10 @@ class HttpConnection(_TcpConnection):
                     ),
                 )
 
-            # Process the response to a pending request.
+            # Process the response to the oldest pending request.
+            elif not self.pending:
+                self.logger.warning("Dropping unsolicited response.")
             else:
-                await self.responses.put(
-                    (cast(ResponseHeader, header), payload)
-                )
-
-        return True
+                pending = self.pending.popleft()
+                if not pending.done():
+                    pending.set_result((cast(ResponseHeader, header), payload))
@@ -0,0 +1,121 @@
+"""
+A module implementing a pool of HTTP client connections.
+"""
+
+# built-in
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+# third-party
+from vcorelib.io import BinaryMessage
+
+# internal
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.tcp.http import HttpConnection, HttpResponse, to_json
+
+HostKey = tuple[str, int]
+
+
+class HttpConnectionPool:
+    """
+    A class implementing a pool of (keep-alive) client connections, keyed by
+    host. Requests are pipelined on the least-busy connection to a host, and
+    additional connections are only opened when every existing connection
+    has too many pending requests.
+    """
+
+    def __init__(
+        self,
+        kind: type[HttpConnection] = HttpConnection,
+        max_connections: int = 4,
+        max_pending: int = 8,
+    ) -> None:
+        """Initialize this instance."""
+
+        assert max_connections > 0, max_connections
+
+        self.kind = kind
+        self.max_connections = max_connections
+        self.max_pending = max_pending
+
+        self.connections: dict[HostKey, list[HttpConnection]] = {}
+        self.stop_sig = asyncio.Event()
+        self.tasks: list[asyncio.Task[None]] = []
+        self.lock = asyncio.Lock()
+
+    async def connection(self, host: str, port: int) -> HttpConnection:
+        """Get a connection to a host (opening one if necessary)."""
+
+        key = (host, port)
+
+        async with self.lock:
+            conns = [
+                x for x in self.connections.get(key, []) if not x.disabled
+            ]
+            self.connections[key] = conns
+
+            result: Optional[HttpConnection] = min(
+                conns, key=lambda x: len(x.pending), default=None
+            )
+            if result is None or (
+                len(result.pending) >= self.max_pending
+                and len(conns) < self.max_connections
+            ):
+                result = await self.kind.create_connection(
+                    host=host, port=port
+                )
+                self.tasks.append(
+                    asyncio.create_task(result.process(stop_sig=self.stop_sig))
+                )
+                conns.append(result)
+
+        return result
+
+    async def request(
+        self,
+        host: str,
+        port: int,
+        request: RequestHeader,
+        data: Optional[BinaryMessage] = None,
+    ) -> HttpResponse:
+        """Make an HTTP request to a host."""
+
+        if request.get("host") is None:
+            request["host"] = f"{host}:{port}"
+
+        return await (await self.connection(host, port)).request(request, data)
+
+    async def request_json(
+        self,
+        host: str,
+        port: int,
+        request: RequestHeader,
+        data: Optional[BinaryMessage] = None,
+    ) -> Any:
+        """
+        Perform a request and convert the response to a data structure by
+        decoding it as JSON.
+        """
+        return to_json(await self.request(host, port, request, data))
+
+    async def close(self) -> None:
+        """Disable all connections and wait for them to finish processing."""
+
+        self.stop_sig.set()
+        await asyncio.gather(*self.tasks)
+
+        self.tasks.clear()
+        self.connections.clear()
+        self.stop_sig.clear()
+
+    @staticmethod
+    @asynccontextmanager
+    async def managed(**kwargs) -> AsyncIterator["HttpConnectionPool"]:
+        """Create a connection pool as a managed context."""
+
+        pool = HttpConnectionPool(**kwargs)
+        try:
+            yield pool
+        finally:
+            await pool.close()
@@ -9,6 +9,7 @@ from contextlib import suppress as _suppress
 from logging import getLogger as _getLogger
 import socket as _socket
 from typing import Any as _Any
+from typing import Iterable as _Iterable
 from typing import Optional as _Optional
 from typing import TypeVar as _TypeVar
 
@@ -31,6 +32,7 @@ from runtimepy.net.util import IpHostTuplelike
 
 LOG = _getLogger(__name__)
 T = _TypeVar("T", bound="UdpConnection")
+DatagramBatch = list[tuple[BinaryMessage, tuple[str, int]]]
 
 
 class UdpConnection(_Connection, _TransportMixin):
@@ -43,6 +45,11 @@ class UdpConnection(_Connection, _TransportMixin):
     # Simplify talkback implementations.
     latest_rx_address: _Optional[tuple[str, int]]
 
+    # Set this to drain every queued datagram (up to a limit) at once and
+    # handle them with 'process_datagrams'.
+    batch_rx = False
+    batch_rx_max = 64
+
     log_alias = "UDP"
 
     def __init__(
@@ -92,6 +99,15 @@ class UdpConnection(_Connection, _TransportMixin):
     ) -> bool:
         """Process a datagram."""
 
+    async def process_datagrams(self, batch: DatagramBatch) -> bool:
+        """Process a batch of datagrams (when 'batch_rx' is set)."""
+
+        for data, addr in batch:
+            if not await self.process_datagram(data, addr):
+                return False
+
+        return True
+
     def sendto(
         self, data: BinaryMessage, addr: IpHostTuplelike = None
     ) -> None:
@@ -108,6 +124,27 @@ class UdpConnection(_Connection, _TransportMixin):
         except AttributeError as exc:
             self.disable(str(exc))
 
+    def sendto_many(
+        self, frames: _Iterable[BinaryMessage], addr: IpHostTuplelike = None
+    ) -> None:
+        """Send multiple datagrams to a specific address."""
+
+        count = 0
+        size = 0
+
+        try:
+            for data in frames:
+                self._transport.sendto(data, addr=addr)
+                count += 1
+                size += len(data)
+
+        # See 'sendto'.
+        except AttributeError as exc:
+            self.disable(str(exc))
+
+        if count:
+            self.metrics.tx.increment(size, messages=count)
+
     def send_text(self, data: str) -> None:
         """Enqueue a text message to send."""
         self.sendto(data.encode(), addr=self.remote_address)
@@ -199,6 +236,10 @@ class UdpConnection(_Connection, _TransportMixin):
     async def _process_read(self) -> None:
         """Process incoming messages while this connection is active."""
 
+        if self.batch_rx:
+            await self._process_read_batch()
+            return
+
         with _suppress(KeyboardInterrupt):
             while self._enabled:
                 # Attempt to get the next message.
@@ -215,6 +256,28 @@ class UdpConnection(_Connection, _TransportMixin):
                 if not result:
                     self.disable("read processing error")
 
+    async def _process_read_batch(self) -> None:
+        """Process batches of incoming messages while enabled."""
+
+        queue = self._protocol.queue
+
+        with _suppress(KeyboardInterrupt):
+            while self._enabled:
+                # Wait for at least one message, then drain the queue.
+                batch = [await queue.get()]
+                while len(batch) < self.batch_rx_max and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                self.latest_rx_address = batch[-1][1]
+                result = await self.process_datagrams(batch)
+                self.metrics.rx.increment(
+                    sum(len(x[0]) for x in batch), messages=len(batch)
+                )
+
+                # If we failed to read a message, disable.
+                if not result:
+                    self.disable("read processing error")
+
 
 class EchoUdpConnection(UdpConnection, _EchoConnection):
     """An echo connection for UDP."""
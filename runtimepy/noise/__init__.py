@@ -3,12 +3,35 @@ A module implementing a structure that simulates a configurable noise source.
 """
 
 # built-in
+from array import array
+from math import cos, log, sin, sqrt, tau
+from operator import add, mul
 import random
+from typing import cast
 
 # internal
 from runtimepy.control.source import DoubleSource
 
 
+def normal_samples(count: int, sigma: float = 1.0) -> array[float]:
+    """
+    Generate normally distributed samples in bulk (using the Box-Muller
+    transform).
+    """
+
+    rand = random.random
+    pairs = (count + 1) // 2
+
+    radii = [sigma * sqrt(-2.0 * log(1.0 - rand())) for _ in range(pairs)]
+    angles = [tau * rand() for _ in range(pairs)]
+
+    result = array("d", map(mul, radii, map(cos, angles)))
+    result.extend(map(mul, radii, map(sin, angles)))
+    del result[count:]
+
+    return result
+
+
 class GaussianSource(DoubleSource):
     """A simple output-source struct."""
 
@@ -17,3 +40,39 @@ class GaussianSource(DoubleSource):
 
         del index
         return random.gauss()
+
+    def source_block(self, block: array[float]) -> None:
+        """Fill a block with the next values for every output."""
+
+        block[:] = normal_samples(len(block))
+
+
+class RandomWalkSource(DoubleSource):
+    """Outputs that take a normally distributed step every sample."""
+
+    state: list[float]
+    step: float
+
+    def init_source(self) -> None:
+        """Initialize this value source."""
+
+        self.step = cast(float, self.config.get("step", 0.1))
+        self.state = [0.0] * self.length
+
+    def source(self, index: int) -> float:
+        """Provide the next value."""
+
+        self.state[index] += random.gauss(0.0, self.step)
+        return self.state[index]
+
+    def source_block(self, block: array[float]) -> None:
+        """Fill a block with the next values for every output."""
+
+        length = self.length
+        steps = normal_samples(len(block), sigma=self.step)
+
+        state = self.state
+        for offset in range(0, len(block), length):
+            state = list(map(add, state, steps[offset : offset + length]))
+            block[offset : offset + length] = array("d", state)
+        self.state = state
@@ -4,9 +4,12 @@ A module for implementing arrays of arbitrary primitives.
 
 # built-in
 from copy import copy as _copy
-from struct import pack as _pack
-from struct import unpack as _unpack
+from struct import Struct as _Struct
+from typing import Any as _Any
+from typing import Iterable as _Iterable
+from typing import Iterator as _Iterator
 from typing import NamedTuple
+from typing import Optional as _Optional
 from typing import cast as _cast
 
 # third-party
@@ -21,6 +24,7 @@ from runtimepy.primitives.byte_order import (
 )
 from runtimepy.primitives.byte_order import ByteOrder as _ByteOrder
 from runtimepy.primitives.serializable import Serializable
+from runtimepy.primitives.serializable.base import WritableBuffer
 
 
 class ArrayFragmentSpec(NamedTuple):
@@ -56,6 +60,7 @@ class PrimitiveArray(Serializable):
 
         super().__init__(byte_order=byte_order, chain=chain)
         self._format: str = self.byte_order.fmt
+        self._struct: _Optional[_Struct] = None
 
         # Add initial items.
         for item in primitives:
@@ -75,12 +80,21 @@ class PrimitiveArray(Serializable):
 
         self._primitives = []
         self._format = self.byte_order.fmt
+        self._struct = None
         self.size = 0
         self._bytes_to_index = {0: 0}
         self._index_to_bytes = {0: 0}
         self._fragments = []
         self._fragment_specs = []
 
+    @property
+    def struct(self) -> _Struct:
+        """Get a compiled codec for this array's format (cached)."""
+
+        if self._struct is None:
+            self._struct = _Struct(self._format)
+        return self._struct
+
     @property
     def num_fragments(self) -> int:
         """Get the number of fragments belonging to this array."""
@@ -197,6 +211,7 @@ class PrimitiveArray(Serializable):
         end = self.end
         if isinstance(end, PrimitiveArray):
             if end is self:
+                self._struct = None
                 self._primitives.append(primitive)
                 self._format += primitive.kind.format
                 self.size += primitive.size
@@ -232,7 +247,15 @@ class PrimitiveArray(Serializable):
     def __bytes__(self) -> bytes:
         """Get this primitive array as a bytes instance."""
 
-        return _pack(self._format, *(x.value for x in self._primitives))
+        return self.struct.pack(*[x.value for x in self._primitives])
+
+    def pack_into(self, buffer: WritableBuffer, offset: int = 0) -> int:
+        """Write just this array into a buffer at an offset."""
+
+        self.struct.pack_into(
+            buffer, offset, *[x.value for x in self._primitives]
+        )
+        return self.size
 
     def fragment_bytes(self, index: int) -> bytes:
         """Get bytes from a fragment."""
@@ -241,13 +264,36 @@ class PrimitiveArray(Serializable):
     def update(self, data: BinaryMessage, timestamp_ns: int = None) -> int:
         """Update primitive values from a bytes instance."""
 
-        for primitive, item in zip(
-            self._primitives, _unpack(self._format, data)
-        ):
+        return self.update_values(
+            self.struct.unpack(data), timestamp_ns=timestamp_ns
+        )
+
+    def unpack_from(
+        self, buffer: BinaryMessage, offset: int = 0, timestamp_ns: int = None
+    ) -> int:
+        """Update just this array from a buffer at an offset."""
+
+        return self.update_values(
+            self.struct.unpack_from(buffer, offset), timestamp_ns=timestamp_ns
+        )
+
+    def update_values(
+        self, values: _Iterable[_Any], timestamp_ns: int = None
+    ) -> int:
+        """Update primitive values from already-decoded values."""
+
+        for primitive, item in zip(self._primitives, values):
             primitive.set_value(item, timestamp_ns=timestamp_ns)
 
         return self.size
 
+    def iter_unpack(self, data: BinaryMessage) -> _Iterator[tuple[_Any, ...]]:
+        """
+        Decode consecutive instances of this array from a bytes instance
+        (without updating any primitives).
+        """
+        return self.struct.iter_unpack(data)
+
     def update_fragment(
         self, index: int, data: bytes, timestamp_ns: int = None
     ) -> None:
@@ -8,8 +8,11 @@ from copy import copy as _copy
 from math import isclose as _isclose
 from typing import BinaryIO as _BinaryIO
 from typing import Callable as _Callable
+from typing import ClassVar as _ClassVar
 from typing import Generic as _Generic
 from typing import Iterator as _Iterator
+from typing import Mapping as _Mapping
+from typing import Optional as _Optional
 from typing import TypeVar as _TypeVar
 
 # third-party
@@ -37,14 +40,35 @@ IDENT.curr_id = 0
 IDENT.scale = 1
 
 
+CallbackMap = dict[int, tuple[PrimitiveChangeCallaback[T], bool]]
+
+
 class Primitive(_Generic[T]):
-    """A simple class for storing an underlying primitive value."""
+    """
+    A simple class for storing an underlying primitive value. Instances don't
+    have a '__dict__' (sub-classes should declare '__slots__' as well) and
+    callback storage is only allocated once a callback is registered.
+    """
+
+    __slots__ = (
+        "raw",
+        "curr_callback",
+        "_callbacks",
+        "_dispatch",
+        "_once",
+        "time_source",
+        "set_streak",
+        "last_updated_ns",
+        "prev_updated_ns",
+        "scaling",
+        "_hash",
+    )
 
     # Use network byte-order by default.
     byte_order: _ByteOrder = _DEFAULT_BYTE_ORDER
 
     # Nominally set the primitive type at the class level.
-    kind: _AnyPrimitiveType
+    kind: _ClassVar[_AnyPrimitiveType]  # pylint: disable=declare-non-slot
 
     def __hash__(self) -> int:
         """A hash for this instance."""
@@ -60,9 +84,12 @@ class Primitive(_Generic[T]):
 
         self.raw = self.kind.instance()
         self.curr_callback: int = 0
-        self.callbacks: dict[int, tuple[PrimitiveChangeCallaback[T], bool]] = (
-            {}
-        )
+        self._callbacks: _Optional[CallbackMap[T]] = None
+
+        # Dispatch snapshots (re-built when callbacks are added or removed).
+        self._dispatch: tuple[PrimitiveChangeCallaback[T], ...] = ()
+        self._once: tuple[int, ...] = ()
+
         self.time_source = time_source
         self.set_streak: int = 0
         self.last_updated_ns: int = self.time_source()
@@ -112,19 +139,41 @@ class Primitive(_Generic[T]):
     ) -> int:
         """Register a callback and return an identifier for it."""
 
+        if self._callbacks is None:
+            self._callbacks = {}
+
         callback_id = self.curr_callback
         self.curr_callback += 1
-        self.callbacks[callback_id] = callback, once
+        self._callbacks[callback_id] = callback, once
+        self._update_dispatch(self._callbacks)
         return callback_id
 
     def remove_callback(self, callback_id: int) -> bool:
         """Remove a callback if one is registered with this identifier."""
 
-        result = callback_id in self.callbacks
+        callbacks = self._callbacks
+        result = callbacks is not None and callback_id in callbacks
         if result:
-            del self.callbacks[callback_id]
+            assert callbacks is not None
+            del callbacks[callback_id]
+            self._update_dispatch(callbacks)
         return result
 
+    @property
+    def callbacks(
+        self,
+    ) -> _Mapping[int, tuple[PrimitiveChangeCallaback[T], bool]]:
+        """Get currently registered callbacks."""
+        return self._callbacks or {}
+
+    def _update_dispatch(self, callbacks: CallbackMap[T]) -> None:
+        """Re-build callback-dispatch snapshots."""
+
+        self._dispatch = tuple(x for x, _ in callbacks.values())
+        self._once = tuple(
+            ident for ident, (_, once) in callbacks.items() if once
+        )
+
     @_contextmanager
     def callback(
         self, callback: PrimitiveChangeCallaback[T]
@@ -151,15 +200,16 @@ class Primitive(_Generic[T]):
         """Determine if any callbacks should be serviced."""
 
         if curr != new:
-            if self.callbacks:
-                to_remove = []
-                for ident, (callback, once) in self.callbacks.items():
+            dispatch = self._dispatch
+            if dispatch:
+                # Only one-time callbacks that are serviced get removed.
+                once = self._once
+
+                for callback in dispatch:
                     callback(curr, new)
-                    if once:
-                        to_remove.append(ident)
 
                 # Remove one-time callbacks.
-                for item in to_remove:
+                for item in once:
                     self.remove_callback(item)
 
                 self.set_streak = 0
@@ -174,8 +224,9 @@ class Primitive(_Generic[T]):
             timestamp_ns = self.time_source()
         self.last_updated_ns = timestamp_ns
 
-        curr: T = self.raw.value  # type: ignore
-        self.raw.value = value
+        raw = self.raw
+        curr: T = raw.value  # type: ignore
+        raw.value = value
         self._check_callbacks(curr, value)
         self.prev_updated_ns = self.last_updated_ns
 
@@ -14,8 +14,9 @@ from runtimepy.primitives.types.bool import Bool as _Bool
 class BooleanPrimitive(_Primitive[bool]):
     """A simple primitive class for booleans."""
 
+    __slots__ = ()
+
     kind = _Bool
-    value: bool
 
     def __init__(self, value: bool = False, **kwargs) -> None:
         """Initialize this boolean primitive."""
@@ -166,6 +166,8 @@ async def sample_for(
 class PrimitiveIsCloseMixin(Primitive[T]):
     """Adds a wait-for-isclose method."""
 
+    __slots__ = ()
+
     async def wait_for_isclose(
         self,
         value: float,
@@ -22,6 +22,8 @@ from runtimepy.primitives.types.float import Half as _Half
 class BaseFloatPrimitive(PrimitiveIsCloseMixin[float]):
     """A simple primitive class for floating-point numbers."""
 
+    __slots__ = ()
+
     def __init__(
         self, value: float = 0.0, scaling: ChannelScaling = None, **kwargs
     ) -> None:
@@ -56,6 +58,8 @@ class BaseFloatPrimitive(PrimitiveIsCloseMixin[float]):
 class HalfPrimitive(BaseFloatPrimitive):
     """A simple primitive class for half-precision floating-point."""
 
+    __slots__ = ()
+
     kind = _Half
 
 
@@ -65,6 +69,8 @@ Half = HalfPrimitive
 class FloatPrimitive(BaseFloatPrimitive):
     """A simple primitive class for single-precision floating-point."""
 
+    __slots__ = ()
+
     kind = _Float
 
 
@@ -74,6 +80,8 @@ Float = FloatPrimitive
 class DoublePrimitive(BaseFloatPrimitive):
     """A simple primitive class for double-precision floating-point."""
 
+    __slots__ = ()
+
     kind = _Double
 
 
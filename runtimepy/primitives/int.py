@@ -26,6 +26,8 @@ from runtimepy.primitives.types.int import Uint64 as _Uint64
 class BaseIntPrimitive(PrimitiveIsCloseMixin[int]):
     """A simple primitive class for integer primitives."""
 
+    __slots__ = ()
+
     def __init__(
         self, value: int = 0, scaling: ChannelScaling = None, **kwargs
     ) -> None:
@@ -82,6 +84,8 @@ class BaseIntPrimitive(PrimitiveIsCloseMixin[int]):
 class Int8Primitive(BaseIntPrimitive):
     """A signed 8-bit primitive."""
 
+    __slots__ = ()
+
     kind = _Int8
 
 
@@ -91,6 +95,8 @@ Int8 = Int8Primitive
 class Int16Primitive(BaseIntPrimitive):
     """A signed 16-bit primitive."""
 
+    __slots__ = ()
+
     kind = _Int16
 
 
@@ -100,6 +106,8 @@ Int16 = Int16Primitive
 class Int32Primitive(BaseIntPrimitive):
     """A signed 32-bit primitive."""
 
+    __slots__ = ()
+
     kind = _Int32
 
 
@@ -109,6 +117,8 @@ Int32 = Int32Primitive
 class Int64Primitive(BaseIntPrimitive):
     """A signed 64-bit primitive."""
 
+    __slots__ = ()
+
     kind = _Int64
 
 
@@ -118,6 +128,8 @@ Int64 = Int64Primitive
 class Uint8Primitive(BaseIntPrimitive):
     """An unsigned 8-bit primitive."""
 
+    __slots__ = ()
+
     kind = _Uint8
 
 
@@ -127,6 +139,8 @@ Uint8 = Uint8Primitive
 class Uint16Primitive(BaseIntPrimitive):
     """An unsigned 16-bit primitive."""
 
+    __slots__ = ()
+
     kind = _Uint16
 
 
@@ -136,6 +150,8 @@ Uint16 = Uint16Primitive
 class Uint32Primitive(BaseIntPrimitive):
     """An unsigned 32-bit primitive."""
 
+    __slots__ = ()
+
     kind = _Uint32
 
 
@@ -145,6 +161,8 @@ Uint32 = Uint32Primitive
 class Uint64Primitive(BaseIntPrimitive):
     """An unsigned 64-bit primitive."""
 
+    __slots__ = ()
+
     kind = _Uint64
 
 
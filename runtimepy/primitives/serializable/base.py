@@ -5,9 +5,9 @@ A module defining a base interface fore serializable objects.
 # built-in
 from abc import ABC, abstractmethod
 from copy import copy as _copy
-from io import BytesIO as _BytesIO
 from typing import BinaryIO as _BinaryIO
 from typing import TypeVar
+from typing import Union as _Union
 
 # third-party
 from vcorelib import DEFAULT_ENCODING
@@ -20,6 +20,7 @@ from runtimepy.primitives.byte_order import (
 from runtimepy.primitives.byte_order import ByteOrder as _ByteOrder
 
 T = TypeVar("T", bound="Serializable")
+WritableBuffer = _Union[bytearray, memoryview]
 
 
 class Serializable(ABC):
@@ -101,22 +102,38 @@ class Serializable(ABC):
     def __bytes__(self) -> bytes:
         """Get this serializable as a bytes instance."""
 
-    def to_stream(self, stream: _BinaryIO) -> int:
-        """Write this serializable to a stream."""
+    def pack_into(self, buffer: WritableBuffer, offset: int = 0) -> int:
+        """Write just this instance into a buffer at an offset."""
 
-        stream.write(bytes(self))
-        result = self.size
+        data = bytes(self)
+        size = len(data)
+        buffer[offset : offset + size] = data
+        return size
+
+    def chain_pack_into(self, buffer: WritableBuffer, offset: int = 0) -> int:
+        """Write this serializable chain into a buffer at an offset."""
+
+        result = self.pack_into(buffer, offset)
 
         if self.chain is not None:
-            result += self.chain.to_stream(stream)
+            result += self.chain.chain_pack_into(buffer, offset + result)
+
+        return result
+
+    def to_stream(self, stream: _BinaryIO) -> int:
+        """Write this serializable to a stream."""
 
+        buffer = bytearray(self.length())
+        result = self.chain_pack_into(buffer)
+        stream.write(buffer)
         return result
 
     def chain_bytes(self) -> bytes:
         """Get the fully encoded chain."""
-        with _BytesIO() as stream:
-            self.to_stream(stream)
-            return stream.getvalue()
+
+        buffer = bytearray(self.length())
+        self.chain_pack_into(buffer)
+        return bytes(buffer)
 
     def __eq__(self, other) -> bool:
         """Equivalent if full byte chains are equal."""
@@ -159,13 +176,36 @@ class Serializable(ABC):
 
         return result
 
+    def unpack_from(
+        self, buffer: BinaryMessage, offset: int = 0, timestamp_ns: int = None
+    ) -> int:
+        """Update just this instance from a buffer at an offset."""
+
+        return self.update(
+            memoryview(buffer)[offset : offset + self.size],
+            timestamp_ns=timestamp_ns,
+        )
+
+    def chain_unpack_from(
+        self, buffer: BinaryMessage, offset: int = 0, timestamp_ns: int = None
+    ) -> int:
+        """Update this serializable chain from a buffer at an offset."""
+
+        result = self.unpack_from(buffer, offset, timestamp_ns=timestamp_ns)
+
+        if self.chain is not None:
+            result += self.chain.chain_unpack_from(
+                buffer, offset + result, timestamp_ns=timestamp_ns
+            )
+
+        return result
+
     def update_chain(
         self, data: BinaryMessage, timestamp_ns: int = None
     ) -> int:
         """Update this serializable from a bytes instance."""
 
-        with _BytesIO(data) as stream:
-            return self.from_stream(stream, timestamp_ns=timestamp_ns)
+        return self.chain_unpack_from(data, timestamp_ns=timestamp_ns)
 
     def assign(self, chain: T) -> None:
         """Assign a next serializable."""
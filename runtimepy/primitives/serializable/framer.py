@@ -16,11 +16,20 @@ class SerializableFramer:
     """A class implementing a serializable message framer."""
 
     elements: int
-    raw: bytes
+    element_size: int
 
-    def __init__(self, instance: Serializable, mtu: int) -> None:
+    # Frames are packed into (and returned as views of) preallocated buffers.
+    buffers: list[memoryview]
+    index: int
+
+    def __init__(
+        self, instance: Serializable, mtu: int, buffers: int = 1
+    ) -> None:
         """Initiaize this instance."""
 
+        assert buffers > 0, buffers
+        self.num_buffers = buffers
+
         self.instance = instance
         self.set_mtu(mtu)
 
@@ -35,6 +44,13 @@ class SerializableFramer:
         self.length = (mtu - protocol_overhead) // raw_length
         assert self.length > 0
 
+        self.element_size = raw_length
+        self.buffers = [
+            memoryview(bytearray(self.length * raw_length))
+            for _ in range(self.num_buffers)
+        ]
+        self.index = 0
+
         self.reset()
 
         if logger is not None:
@@ -52,22 +68,27 @@ class SerializableFramer:
         """Reset this framer's state"""
 
         self.elements = 0
-        self.raw = bytes()
 
     def capture(
         self, sample: bool = True, flush: bool = False
-    ) -> Optional[bytes]:
+    ) -> Optional[memoryview]:
         """
         Optionally sample this struct and attempt to resolve a full or flushed
-        frame.
+        frame. A returned frame is only valid until the same buffer is
+        re-used (after 'buffers' more frames are resolved).
         """
 
+        buffer = self.buffers[self.index]
+
         if sample:
-            self.raw += bytes(self.instance)
+            self.instance.chain_pack_into(
+                buffer, self.elements * self.element_size
+            )
             self.elements += 1
 
         result = None
-        if self.raw and (flush or self.elements == self.length):
-            result = self.raw
+        if self.elements and (flush or self.elements == self.length):
+            result = buffer[: self.elements * self.element_size]
+            self.index = (self.index + 1) % self.num_buffers
             self.reset()
         return result
@@ -16,7 +16,10 @@ from runtimepy.primitives.byte_order import (
     DEFAULT_BYTE_ORDER as _DEFAULT_BYTE_ORDER,
 )
 from runtimepy.primitives.byte_order import ByteOrder as _ByteOrder
-from runtimepy.primitives.serializable.base import Serializable
+from runtimepy.primitives.serializable.base import (
+    Serializable,
+    WritableBuffer,
+)
 from runtimepy.primitives.serializable.fixed import FixedChunk
 
 T = TypeVar("T", bound="PrefixedChunk")
@@ -76,6 +79,33 @@ class PrefixedChunk(Serializable):
             self.chunk
         )
 
+    def pack_into(self, buffer: WritableBuffer, offset: int = 0) -> int:
+        """Write just this instance into a buffer at an offset."""
+
+        prefix_size = self.prefix.kind.size
+        buffer[offset : offset + prefix_size] = self.prefix.binary(
+            byte_order=self.byte_order
+        )
+        return prefix_size + self.chunk.pack_into(buffer, offset + prefix_size)
+
+    def unpack_from(
+        self, buffer: BinaryMessage, offset: int = 0, timestamp_ns: int = None
+    ) -> int:
+        """Update just this instance from a buffer at an offset."""
+
+        data = memoryview(buffer)
+        prefix_size = self.prefix.kind.size
+        self.prefix.update(
+            data[offset : offset + prefix_size], byte_order=self.byte_order
+        )
+
+        offset += prefix_size
+        self.chunk.update(
+            data[offset : offset + self.prefix.value],
+            timestamp_ns=timestamp_ns,
+        )
+        return self._update_size()
+
     def _from_stream(self, stream: _BinaryIO, timestamp_ns: int = None) -> int:
         """Update just this instance from a stream."""
 
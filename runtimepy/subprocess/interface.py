@@ -5,7 +5,7 @@ A module implementing a runtimepy peer interface.
 # built-in
 from argparse import Namespace
 import asyncio
-from io import BytesIO
+from contextlib import ExitStack
 from json import dumps
 import logging
 from logging import INFO, getLogger
@@ -24,6 +24,7 @@ from runtimepy.channel.environment.command import register_env
 from runtimepy.channel.environment.command.processor import (
     RemoteCommandProcessor,
 )
+from runtimepy.channel.event.shared import SharedValues
 from runtimepy.message import JsonMessage, MessageProcessor
 from runtimepy.message.interface import JsonMessageInterface
 from runtimepy.metrics.channel import ChannelMetrics
@@ -68,6 +69,11 @@ class RuntimepyPeerInterface(
         self.peer_config_event = asyncio.Event()
         self._peer_env_event = asyncio.Event()
 
+        # The peer's channel values (if shared via shared memory).
+        self.shared: Optional[SharedValues] = None
+        self._shared_event = asyncio.Event()
+        self._shared_stack = ExitStack()
+
         # Set these for JsonMessageInterface.
         AsyncCommandProcessingMixin.__init__(self, logger=self.struct.logger)
         self.log_limiter = RateLimiter.from_s(1.0)
@@ -179,6 +185,43 @@ class RuntimepyPeerInterface(
 
         self.basic_handler("config", config_handler)
 
+        async def shared_memory_handler(
+            outbox: JsonMessage, inbox: JsonMessage
+        ) -> None:
+            """Attach to the peer's shared-memory channel values."""
+
+            del outbox
+
+            if self.peer is not None:
+                self.close_shared()
+                self.shared = self._shared_stack.enter_context(
+                    self.peer.env.shared_values(inbox["name"])
+                )
+                self.peer.logger.info(
+                    "Sharing values via '%s'.", self.shared.name
+                )
+                self._shared_event.set()
+
+        self.basic_handler("shared_memory", shared_memory_handler)
+
+    def poll_shared(self) -> int:
+        """
+        Update the peer's environment from shared memory (if values are being
+        shared). Returns the number of values updated.
+        """
+
+        result = 0
+        if self.shared is not None and self.peer is not None:
+            result = self.peer.env.ingest_shared(self.shared)
+        return result
+
+    def close_shared(self) -> None:
+        """Detach from the peer's shared-memory channel values."""
+
+        self._shared_stack.close()
+        self.shared = None
+        self._shared_event.clear()
+
     async def share_config(self, data: JsonMessage) -> None:
         """Exchange configuration data."""
 
@@ -230,9 +273,9 @@ class RuntimepyPeerInterface(
 
             # Parse channel events.
             if self.peer is not None:
-                with BytesIO(data) as stream:
-                    for event in self.peer.env.parse_event_stream(stream):
-                        self.peer.env.ingest(event)
+                env = self.peer.env
+                for event in env.parse_event_data(data):
+                    env.ingest(event)
             else:
                 self.governed_log(
                     self.log_limiter,
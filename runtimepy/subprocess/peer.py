@@ -31,6 +31,18 @@ from runtimepy.subprocess.protocol import RuntimepySubprocessProtocol
 T = TypeVar("T", bound="RuntimepyPeer")
 
 
+def drain_queue(queue: asyncio.Queue[bytes], data: bytes = b"") -> bytes:
+    """Combine data with all data immediately available from a queue."""
+
+    if queue.empty():
+        return data
+
+    chunks = [data]
+    while not queue.empty():
+        chunks.append(queue.get_nowait())
+    return b"".join(chunks)
+
+
 class RuntimepyPeer(RuntimepyPeerInterface):
     """A class implementing an interface for messaging peer subprocesses."""
 
@@ -46,33 +58,56 @@ class RuntimepyPeer(RuntimepyPeerInterface):
         super().__init__(name, config, markdown=markdown)
         self.protocol = protocol
 
-    async def _poll(self) -> None:
-        """Poll input queues."""
+    async def _service_stderr(self, queue: asyncio.Queue[bytes]) -> None:
+        """Handle telemetry from the peer as it arrives."""
 
-        keep_going = True
-        task = None
+        while True:
+            self.handle_stderr(drain_queue(queue, await queue.get()))
 
-        while keep_going:
-            try:
-                if task is None:
-                    task = asyncio.create_task(self.process_command_queue())
-                elif task.done():
-                    task = None
+    async def _service_stdout(self, queue: asyncio.Queue[bytes]) -> None:
+        """Handle messages from the peer as they arrive."""
 
-                keep_going = await self.service_queues()
+        while True:
+            await self.handle_stdout(drain_queue(queue, await queue.get()))
 
-                if keep_going:
-                    await asyncio.sleep(self.poll_period_s)
+    async def _service_shared(self) -> None:
+        """Mirror the peer's shared-memory channel values (once available)."""
 
-            except asyncio.CancelledError:
-                keep_going = False
+        await self._shared_event.wait()
+        while True:
+            self.poll_shared()
+            await asyncio.sleep(self.poll_period_s)
+
+    async def _service(self) -> None:
+        """Service input queues (and outgoing commands) as data arrives."""
+
+        tasks = [
+            asyncio.create_task(self.service_command_queue()),
+            asyncio.create_task(self._service_shared()),
+        ]
+
+        if self.protocol.stderr_queue is not None:
+            tasks.append(
+                asyncio.create_task(self._service_stderr(self.protocol.stderr))
+            )
+        if self.protocol.stdout_queue is not None:
+            tasks.append(
+                asyncio.create_task(self._service_stdout(self.protocol.stdout))
+            )
+
+        try:
+            with suppress(asyncio.CancelledError):
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
 
     @asynccontextmanager
     async def _context(self: T) -> AsyncIterator[T]:
         """A managed context for the peer."""
 
-        # Register task that will poll queues.
-        task = asyncio.create_task(self._poll())
+        # Register task that will service queues.
+        task = asyncio.create_task(self._service())
 
         try:
             with suppress(AssertionError):
@@ -85,6 +120,9 @@ class RuntimepyPeer(RuntimepyPeerInterface):
             task.cancel()
             await task
 
+            self.poll_shared()
+            self.close_shared()
+
     @classmethod
     @asynccontextmanager
     async def shell(
@@ -243,7 +281,7 @@ class RuntimepyPeer(RuntimepyPeerInterface):
         self.stdin_metrics.increment(len(data))
 
     async def service_queues(self) -> bool:
-        """Service data from peer."""
+        """Service any available data from peer."""
 
         keep_going = False
 
@@ -251,14 +289,14 @@ class RuntimepyPeer(RuntimepyPeerInterface):
         if self.protocol.stderr_queue is not None:
             keep_going = True
             queue = self.protocol.stderr
-            while not queue.empty():
-                self.handle_stderr(queue.get_nowait())
+            if not queue.empty():
+                self.handle_stderr(drain_queue(queue))
 
         # Handle messages from stdout.
         if self.protocol.stdout_queue is not None:
             keep_going = True
             queue = self.protocol.stdout
-            while not queue.empty():
-                await self.handle_stdout(queue.get_nowait())
+            if not queue.empty():
+                await self.handle_stdout(drain_queue(queue))
 
         return keep_going
@@ -6,7 +6,6 @@ A module implementing a peer program communication interface.
 import asyncio
 from contextlib import asynccontextmanager, contextmanager, suppress
 import logging
-import os
 import signal
 import sys
 from typing import AsyncIterator, BinaryIO, Iterator, Optional, Type, TypeVar
@@ -36,6 +35,13 @@ class PeerProgram(RuntimepyPeerInterface, PsutilMixin):
 
     struct_type: Type[RuntimeStruct] = RuntimeStruct
 
+    # Maximum number of bytes to read from input at once.
+    read_size: int = 2**16
+
+    # Set this (or the 'shared_memory' configuration key) to stream channel
+    # values via shared memory instead of the stream output.
+    shared_memory = False
+
     got_eof: asyncio.Event
 
     _singleton: Optional["PeerProgram"] = None
@@ -48,12 +54,20 @@ class PeerProgram(RuntimepyPeerInterface, PsutilMixin):
 
     @contextmanager
     def streaming_events(self) -> Iterator[None]:
-        """Stream events to the stream output."""
+        """Stream events to the stream output (or shared memory)."""
+
+        env = self.struct.env
 
-        with self.struct.env.registered(
-            self.stream_output, flush=True, channel=self.stream_metrics
-        ):
-            yield
+        if self.struct.config.get("shared_memory", type(self).shared_memory):
+            with env.shared_values() as shared:
+                with env.registered_shared(shared):
+                    self.send_json({"shared_memory": {"name": shared.name}})
+                    yield
+        else:
+            with env.registered(
+                self.stream_output, flush=True, channel=self.stream_metrics
+            ):
+                yield
 
     def write(self, data: bytes, addr: tuple[str, int] = None) -> None:
         """Write data."""
@@ -92,33 +106,45 @@ class PeerProgram(RuntimepyPeerInterface, PsutilMixin):
 
         self.got_eof.clear()
 
-        # Allow polling stdin.
-        if hasattr(os, "set_blocking"):
-            getattr(os, "set_blocking")(buffer.fileno(), False)
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=self.read_size)
+
+        # Read input via the event loop (falling back to reading in a
+        # thread for e.g. regular files).
+        transport: Optional[asyncio.BaseTransport] = None
+        try:
+            transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), buffer
+            )
+        except (OSError, ValueError, NotImplementedError):
+            pass
 
-        accumulator = 0
+        # Buffered 'read' blocks until a full chunk (or end-of-file) is read,
+        # 'read1' returns whatever is available.
+        read_available = getattr(buffer, "read1", buffer.read)
 
-        with suppress(asyncio.CancelledError):
-            while not self.got_eof.is_set():
-                data: bytes = buffer.read(1)
-                if data is None:
-                    await asyncio.sleep(self.poll_period_s)
-                    continue
+        async def read() -> bytes:
+            """Read whatever input is available."""
 
-                if not data:
-                    break
+            if transport is not None:
+                return await reader.read(self.read_size)
+            return await asyncio.to_thread(read_available, self.read_size)
 
-                accumulator += 1
+        try:
+            with suppress(asyncio.CancelledError):
+                while not self.got_eof.is_set():
+                    data = await read()
+                    if not data:
+                        break
 
-                # Process incoming messages.
-                saw_msg = False
-                for msg in self.processor.messages(data):
-                    await self.process_json(msg)
-                    saw_msg = True
+                    self.stdin_metrics.increment(len(data))
 
-                if saw_msg:
-                    self.stdin_metrics.increment(accumulator)
-                    accumulator = 0
+                    # Process incoming messages.
+                    for msg in self.processor.messages(data):
+                        await self.process_json(msg)
+        finally:
+            if transport is not None:
+                transport.close()
 
         # Signal the end of input processing.
         self.got_eof.set()
@@ -7,29 +7,214 @@ import asyncio as _asyncio
 from contextlib import asynccontextmanager as _asynccontextmanager
 from contextlib import suppress as _suppress
 from typing import AsyncIterator as _AsyncIterator
+from typing import Callable as _Callable
 from typing import Generic as _Generic
 from typing import Iterator as _Iterator
+from typing import Optional as _Optional
 from typing import TypeVar as _TypeVar
 
 # internal
 from runtimepy.task.basic.periodic import PeriodicTask as _PeriodicTask
+from runtimepy.task.basic.schedule import DeadlineSchedule as _DeadlineSchedule
 
 T = _TypeVar("T", bound=_PeriodicTask)
 
+# Periods within this (relative) tolerance of an integer multiple of a rate
+# group's period are considered harmonic.
+HARMONIC_TOLERANCE = 1e-6
+
+
+def due_ticks(start: int, stop: int, phase: int, ticks: int) -> int:
+    """
+    Count the ticks in the range [start, stop) at which a member of a rate
+    group (with a phase offset and number of ticks per iteration) is due.
+    """
+    return (stop - phase - 1) // ticks - (start - phase - 1) // ticks
+
+
+class RateGroup(_Generic[T]):
+    """
+    A group of periodic tasks (with harmonic periods) dispatched from a single
+    timer.
+    """
+
+    def __init__(
+        self, period_s: float, detach: _Callable[[T], None] = None
+    ) -> None:
+        """Initialize this instance."""
+
+        self.period_s = period_s
+        self.schedule = _DeadlineSchedule()
+
+        # Called with members whose period is no longer harmonic with this
+        # group's period (otherwise they're dropped).
+        self.detach = detach
+
+        # Tasks and phase offsets (in ticks).
+        self.members: list[tuple[T, int]] = []
+
+    def accepts(self, period_s: float) -> bool:
+        """Determine if a period is harmonic with this group's period."""
+
+        # Tasks without a period only share a group with each other.
+        if self.period_s <= 0.0 or period_s <= 0.0:
+            return self.period_s <= 0.0 and period_s <= 0.0
+
+        ratio = period_s / self.period_s
+        return (
+            ratio >= 1.0
+            and abs(ratio - round(ratio)) <= ratio * HARMONIC_TOLERANCE
+        )
+
+    def add(self, task: T, phase_s: float = 0.0) -> None:
+        """Add a task to this group."""
+
+        self.members.append(
+            (
+                task,
+                round(phase_s / self.period_s) if self.period_s > 0.0 else 0,
+            )
+        )
+
+    def ticks(self, task: T) -> int:
+        """
+        Get the number of group ticks per iteration of a task (periods are
+        re-evaluated each tick, so run-time changes take effect).
+        """
+
+        period_s = task.period_s.value
+        if self.period_s <= 0.0 or period_s <= 0.0:
+            return 1
+        return max(round(period_s / self.period_s), 1)
+
+    def _detach(self, members: list[tuple[T, int]]) -> list[tuple[T, int]]:
+        """Remove members whose period is no longer harmonic."""
+
+        result = []
+
+        for member in members:
+            task = member[0]
+            if self.accepts(task.period_s.value):
+                result.append(member)
+            else:
+                task.logger.warning(
+                    "Period %ss isn't harmonic with rate group (%ss).",
+                    task.period_s.value,
+                    self.period_s,
+                )
+                if self.detach is not None:
+                    self.detach(task)
+                else:
+                    task.disable()
+
+        return result
+
+    @staticmethod
+    def _disabled(
+        due: list[T], results: list[bool | BaseException]
+    ) -> list[T]:
+        """
+        Get tasks that were disabled by an iteration (disabling tasks that
+        failed).
+        """
+
+        disabled = []
+
+        for task, result in zip(due, results):
+            if result is not True:
+                if isinstance(result, BaseException):
+                    task.logger.exception("Dispatch failed:", exc_info=result)
+                    task.disable()
+                disabled.append(task)
+
+        return disabled
+
+    async def run(
+        self, stop_sig: _asyncio.Event = None, begin: bool = True
+    ) -> None:
+        """Run tasks in this group until they're all disabled."""
+
+        members = self.members
+        if begin:
+            for task, _ in members:
+                task.begin()
+
+        loop = _asyncio.get_running_loop()
+        schedule = self.schedule
+        schedule.start(loop.time())
+        tick = 0
+
+        try:
+            while members:
+                # Handle run-time period changes.
+                if not all(self.accepts(x.period_s.value) for x, _ in members):
+                    members = self._detach(members)
+
+                due = [
+                    task
+                    for task, phase in members
+                    if (tick - phase) % self.ticks(task) == 0
+                ]
+                if due:
+                    results = await _asyncio.gather(
+                        *(x.iterate(stop_sig=stop_sig) for x in due),
+                        return_exceptions=True,
+                    )
+
+                    # Drop tasks that were disabled (or failed).
+                    if not all(x is True for x in results):
+                        disabled = self._disabled(due, results)
+                        members = [x for x in members if x[0] not in disabled]
+
+                # Sleep until the next tick (skipping missed ticks).
+                sleep_time, missed = schedule.advance(
+                    loop.time(), self.period_s
+                )
+                if missed:
+                    for task, phase in members:
+                        task.metrics.overruns.value += due_ticks(
+                            tick + 1,
+                            tick + missed + 1,
+                            phase,
+                            self.ticks(task),
+                        )
+                tick += missed + 1
+
+                await _asyncio.sleep(sleep_time)
+
+                if schedule.woke(loop.time()):
+                    for task, _ in members:
+                        task.update_lateness(schedule)
+
+        except _asyncio.CancelledError:
+            for task, _ in members:
+                task.disable()
+
 
 class PeriodicTaskManager(_Generic[T]):
     """A class for managing periodic tasks as a single group."""
 
-    def __init__(self) -> None:
+    def __init__(self, shared_timer: bool = False) -> None:
         """Initialize this instance."""
+
         self._tasks: dict[str, T] = {}
+        self._phases: dict[str, float] = {}
+
+        # Dispatch tasks with harmonic periods from shared timers (instead of
+        # each task sleeping independently).
+        self.shared_timer = shared_timer
+        self._groups: list[_asyncio.Task[None]] = []
+        self._stop_sig: _Optional[_asyncio.Event] = None
 
-    def register(self, task: T, period_s: float = None) -> bool:
+    def register(
+        self, task: T, period_s: float = None, phase_s: float = 0.0
+    ) -> bool:
         """Register a periodic task."""
 
         result = task.name not in self._tasks
         if result:
             self._tasks[task.name] = task
+            self._phases[task.name] = phase_s
             task.set_period(period_s=period_s)
         return result
 
@@ -42,14 +227,70 @@ class PeriodicTaskManager(_Generic[T]):
         """Get a task by name."""
         return self._tasks[name]
 
+    def rate_groups(self) -> list[RateGroup[T]]:
+        """Group tasks by harmonic periods."""
+
+        groups: list[RateGroup[T]] = []
+
+        for task in sorted(
+            self._tasks.values(), key=lambda x: x.period_s.value
+        ):
+            period_s = task.period_s.value
+
+            group = next((x for x in groups if x.accepts(period_s)), None)
+            if group is None:
+                group = RateGroup(period_s, detach=self._detach)
+                groups.append(group)
+
+            group.add(task, phase_s=self._phases[task.name])
+
+        return groups
+
+    def _detach(self, task: T) -> None:
+        """
+        Continue running a (started) task, whose period changed, from a new
+        rate group.
+        """
+
+        group = RateGroup(task.period_s.value, detach=self._detach)
+        group.add(task)
+        self._groups.append(
+            _asyncio.create_task(
+                group.run(stop_sig=self._stop_sig, begin=False)
+            )
+        )
+
     async def start(self, stop_sig: _asyncio.Event = None) -> None:
         """Ensure tasks are started."""
-        await _asyncio.gather(
-            *(x.task(stop_sig=stop_sig) for x in self._tasks.values())
-        )
+
+        if self.shared_timer:
+            await self.stop()
+            self._stop_sig = stop_sig
+            self._groups = [
+                _asyncio.create_task(x.run(stop_sig=stop_sig))
+                for x in self.rate_groups()
+            ]
+        else:
+            await _asyncio.gather(
+                *(x.task(stop_sig=stop_sig) for x in self._tasks.values())
+            )
 
     async def stop(self) -> None:
         """Ensure tasks are stopped."""
+
+        if self._groups:
+            # Groups may be added (for detached tasks) while stopping.
+            while self._groups:
+                groups = self._groups
+                self._groups = []
+                for group in groups:
+                    group.cancel()
+                await _asyncio.gather(*groups, return_exceptions=True)
+
+            await _asyncio.gather(
+                *(x.stop_extra() for x in self._tasks.values())
+            )
+
         await _asyncio.gather(*(x.stop() for x in self._tasks.values()))
 
     @_asynccontextmanager
@@ -33,6 +33,7 @@ from runtimepy.primitives import Bool as _Bool
 from runtimepy.primitives import Double as _Double
 from runtimepy.primitives import Float as _Float
 from runtimepy.primitives.evaluation import EvalResult as _EvalResult
+from runtimepy.task.basic.schedule import CatchUp, DeadlineSchedule
 from runtimepy.ui.button import ActionButton
 from runtimepy.ui.controls import Controlslike
 
@@ -44,6 +45,9 @@ class PeriodicTask(
 
     auto_finalize = True
 
+    # How to handle missed deadlines.
+    catch_up = CatchUp.SKIP
+
     def __init__(
         self,
         name: str,
@@ -54,10 +58,14 @@ class PeriodicTask(
         period_controls: Controlslike = "period",
         markdown: str = None,
         config: _JsonObject = None,
+        catch_up: str = None,
     ) -> None:
         """Initialize this task."""
 
         self.name = name
+        self.schedule = DeadlineSchedule(
+            CatchUp(catch_up or type(self).catch_up)
+        )
 
         self.set_markdown(markdown=markdown, config=config, package=PKG_NAME)
         self.config: _JsonObject = config or {}
@@ -104,6 +112,7 @@ class PeriodicTask(
 
         self._dispatch_rate = _RateTracker(depth=average_depth)
         self._dispatch_time = _MovingAverage(depth=average_depth)
+        self._iter_time = _Double()
 
     def _init_state(self) -> None:
         """Add channels to this instance's channel environment."""
@@ -155,13 +164,8 @@ class PeriodicTask(
             )
         )
 
-    async def run(
-        self, period_s: float = None, stop_sig: _asyncio.Event = None
-    ) -> None:
-        """
-        Run this task by executing the dispatch method at the specified period
-        until a dispatch iteration fails or the task is otherwise disabled.
-        """
+    def begin(self, period_s: float = None) -> None:
+        """Enable this task (and set its period) before running it."""
 
         assert not self._enabled
         self._enabled.raw.value = True
@@ -172,39 +176,67 @@ class PeriodicTask(
             "Task starting at %s.", _rate_str(self.period_s.value)
         )
 
-        iter_time = _Double()
-
-        while self._enabled:
-            # When paused, don't run the iteration itself.
-            if not self.paused:
-                with self.metrics.measure(
-                    self._dispatch_rate,
-                    self._dispatch_time,
-                    iter_time,
-                    self.period_s.value,
-                ):
-                    self._enabled.raw.value = await _asyncio.shield(
-                        self.dispatch()
-                    )
-
-            # Check this synchronously. This may not be suitable for tasks
-            # with long periods.
-            if self._enabled and stop_sig is not None:
-                self._enabled.raw.value = not stop_sig.is_set()
-
-            if self._enabled:
-                try:
-                    sleep_time = max(self.period_s.value - iter_time.value, 0)
-
-                    # Eventually run feedback control.
-
-                    await _asyncio.sleep(sleep_time)
-                except _asyncio.CancelledError:
-                    self.logger.debug("Task was cancelled.")
-                    self.disable()
+    async def iterate(self, stop_sig: _asyncio.Event = None) -> bool:
+        """
+        Run a single iteration of this task (unless it's paused). Returns
+        whether or not this task is still enabled.
+        """
+
+        # When paused, don't run the iteration itself.
+        if self._enabled and not self.paused:
+            with self.metrics.measure(
+                self._dispatch_rate, self._dispatch_time, self._iter_time
+            ):
+                self._enabled.raw.value = await _asyncio.shield(
+                    self.dispatch()
+                )
+
+        # Check this synchronously. This may not be suitable for tasks
+        # with long periods.
+        if self._enabled and stop_sig is not None:
+            self._enabled.raw.value = not stop_sig.is_set()
+
+        return bool(self._enabled)
+
+    async def run(
+        self, period_s: float = None, stop_sig: _asyncio.Event = None
+    ) -> None:
+        """
+        Run this task by executing the dispatch method at the specified period
+        until a dispatch iteration fails or the task is otherwise disabled.
+        """
+
+        self.begin(period_s=period_s)
+
+        loop = _asyncio.get_running_loop()
+        schedule = self.schedule
+        schedule.start(loop.time())
+
+        while await self.iterate(stop_sig=stop_sig):
+            try:
+                # Sleep until the next (absolute) deadline.
+                sleep_time, missed = schedule.advance(
+                    loop.time(), self.period_s.value
+                )
+                if missed:
+                    self.metrics.overruns.value += missed
+
+                await _asyncio.sleep(sleep_time)
+
+                if schedule.woke(loop.time()):
+                    self.update_lateness(schedule)
+            except _asyncio.CancelledError:
+                self.logger.debug("Task was cancelled.")
+                self.disable()
 
         self.logger.debug("Task completed.")
 
+    def update_lateness(self, schedule: DeadlineSchedule) -> None:
+        """Update wake-up lateness metrics from a schedule."""
+
+        self.metrics.lateness_p50_s.value = schedule.lateness_p50_s
+        self.metrics.lateness_p99_s.value = schedule.lateness_p99_s
+
     async def stop_extra(self) -> None:
         """Extra actions to perform when this task is stopping."""
 
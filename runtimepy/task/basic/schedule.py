@@ -0,0 +1,110 @@
+"""
+A module implementing absolute-deadline scheduling for periodic tasks.
+"""
+
+# built-in
+from array import array
+from enum import StrEnum
+from math import floor
+
+DEFAULT_LATENESS_DEPTH = 256
+
+
+class CatchUp(StrEnum):
+    """Policies for handling missed deadlines."""
+
+    # Skip missed iterations (staying aligned with the original schedule).
+    SKIP = "skip"
+
+    # Run missed iterations back-to-back.
+    BURST = "burst"
+
+    # Run immediately and restart the schedule from the current time.
+    SLIP = "slip"
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Get a percentile (nearest rank) from sorted samples."""
+    return samples[min(floor(fraction * len(samples)), len(samples) - 1)]
+
+
+class DeadlineSchedule:
+    """
+    A class implementing a drift-free schedule of iteration deadlines (on a
+    monotonic clock) and wake-up lateness statistics.
+    """
+
+    def __init__(
+        self,
+        policy: CatchUp = CatchUp.SKIP,
+        depth: int = DEFAULT_LATENESS_DEPTH,
+    ) -> None:
+        """Initialize this instance."""
+
+        assert depth > 0, depth
+
+        self.policy = policy
+        self.deadline = 0.0
+
+        # Lateness samples (updated in place once full).
+        self.lateness = array("d")
+        self.depth = depth
+        self.samples = 0
+        self.lateness_p50_s = 0.0
+        self.lateness_p99_s = 0.0
+
+    def start(self, now: float) -> None:
+        """Start the schedule (the first deadline is immediate)."""
+        self.deadline = now
+
+    def advance(self, now: float, period_s: float) -> tuple[float, int]:
+        """
+        Advance to the next deadline after an iteration completes. Returns the
+        time to sleep until the next deadline and the number of deadlines
+        missed.
+        """
+
+        # Run again immediately (without counting missed deadlines) when
+        # there's no period.
+        if period_s <= 0.0:
+            self.deadline = now
+            return 0.0, 0
+
+        # Deadlines that passed while the current iteration ran.
+        missed = floor((now - self.deadline) / period_s)
+
+        if missed <= 0:
+            self.deadline += period_s
+        elif self.policy is CatchUp.SKIP:
+            self.deadline += (missed + 1) * period_s
+        elif self.policy is CatchUp.BURST:
+            self.deadline += period_s
+            missed = 1
+        else:
+            self.deadline = now
+            missed = 1
+
+        return max(self.deadline - now, 0.0), max(missed, 0)
+
+    def woke(self, now: float) -> bool:
+        """
+        Record wake-up lateness for the current deadline. Returns True if the
+        lateness percentiles were updated.
+        """
+
+        lateness = max(now - self.deadline, 0.0)
+
+        if len(self.lateness) < self.depth:
+            self.lateness.append(lateness)
+        else:
+            self.lateness[self.samples % self.depth] = lateness
+        self.samples += 1
+
+        # Update statistics whenever the sample window is refreshed.
+        result = self.samples % self.depth == 0 or self.samples < self.depth
+        if result:
+            ordered = sorted(self.lateness)
+            self.lateness_p50_s = percentile(ordered, 0.5)
+            self.lateness_p99_s = percentile(ordered, 0.99)
+
+        return result
@@ -13,7 +13,10 @@ from vcorelib.io.bus import BUS
 
 # module under test
 from runtimepy.channel.environment import ChannelEnvironment
-from runtimepy.channel.environment.command import GlobalEnvironment
+from runtimepy.channel.environment.command import (
+    EventOutput,
+    GlobalEnvironment,
+)
 from runtimepy.channel.environment.command.processor import (
     ChannelCommandProcessor,
 )
@@ -69,6 +72,25 @@ def global_test_env() -> Iterator[GlobalEnvironment]:
         yield envs
 
 
+def test_global_environment_fingerprint():
+    """Test that a global environment's fingerprint tracks changes."""
+
+    with global_test_env() as envs:
+        fingerprint = envs.fingerprint
+        assert envs.fingerprint == fingerprint
+        assert len(fingerprint) == len(ENVS)
+
+        envs["a"].env.finalize()
+        assert envs.fingerprint != fingerprint
+        fingerprint = envs.fingerprint
+
+        envs.register("d", sample_env("d"))
+        assert envs.fingerprint != fingerprint
+
+        envs.clear()
+        assert envs.fingerprint == ()
+
+
 @mark.asyncio
 async def test_environment_bus_commands_basic():
     """Test basic commands sent via bus."""
@@ -94,3 +116,102 @@ def test_global_environment_basic():
             events = ParsedEvent.by_channel(new_envs.read_event_stream(name))
             assert len(events["null.uint32"]) == 2
             assert len(events["null.int32"]) == 3
+
+
+def test_global_environment_event_log():
+    """Test reading recorded events by channel."""
+
+    with global_test_env() as envs:
+        with envs.event_telemetry_output() as channels:
+            for env, _ in channels:
+                poke_sample_env(envs[env].env)
+
+        new_envs = GlobalEnvironment.from_root(envs.valid_root)
+
+        for name in ENVS:
+            events = ParsedEvent.by_channel(new_envs.read_event_stream(name))
+
+            with new_envs.event_log(name) as reader:
+                assert set(reader.names) == set(events)
+
+                for chan, expected in events.items():
+                    result = reader.channel(chan)
+                    assert list(result.timestamps) == [
+                        x.timestamp for x in expected
+                    ]
+                    assert list(result.values) == [x.value for x in expected]
+
+                # Slice a time window.
+                expected = events["null.int32"]
+                result = reader.channel(
+                    "null.int32",
+                    start_ns=expected[1].timestamp,
+                    end_ns=expected[-1].timestamp - 1,
+                )
+                assert len(result) == len(expected) - 2
+                assert list(result.values) == [1]
+
+                # Windows that include everything (or nothing).
+                assert len(reader.channel("null.uint32", start_ns=0)) == 2
+                assert not reader.channel("null.uint32", end_ns=0)
+
+
+def test_global_environment_event_index():
+    """Test seeking through recorded events with a time index."""
+
+    with global_test_env() as envs:
+        with envs.event_telemetry_output(
+            output=EventOutput(index_events=3)
+        ) as channels:
+            for env, _ in channels:
+                poke_sample_env(envs[env].env)
+
+        new_envs = GlobalEnvironment.from_root(envs.valid_root)
+
+        for name in ENVS:
+            events = list(new_envs.read_event_stream(name))
+
+            with new_envs.event_log(name) as reader:
+                assert reader.checkpoints
+                assert reader.end is None
+
+                # Every checkpoint refers to a record boundary.
+                assert all(
+                    x.offset <= reader.index() for x in reader.checkpoints
+                )
+
+                # Reconstruct state after every event.
+                for idx, event in enumerate(events):
+                    assert reader.state_at(event.timestamp) == {
+                        x.name: x.value for x in events[: idx + 1]
+                    }
+                assert not reader.state_at(0)
+
+                # Replay time windows.
+                assert list(reader.replay()) == events
+                start = events[len(events) // 2].timestamp
+                assert list(reader.replay(start_ns=start)) == [
+                    x for x in events if x.timestamp >= start
+                ]
+                assert list(reader.replay(end_ns=start)) == [
+                    x for x in events if x.timestamp <= start
+                ]
+
+
+def test_global_environment_compressed():
+    """Test recording and reading compressed event telemetry."""
+
+    with global_test_env() as envs:
+        with envs.event_telemetry_output(
+            output=EventOutput(compression="lzma")
+        ) as channels:
+            for env, _ in channels:
+                poke_sample_env(envs[env].env)
+
+        new_envs = GlobalEnvironment.from_root(envs.valid_root)
+        assert new_envs.meta["event_index"] is None
+
+        for name in ENVS:
+            events = ParsedEvent.by_channel(new_envs.read_event_stream(name))
+            assert len(events["null.uint32"]) == 2
+            assert len(events["null.int32"]) == 3
@@ -2,12 +2,27 @@
 Test data-streaming capabilities of channel registries.
 """
 
+# built-in
+from contextlib import ExitStack
+from io import BytesIO
+
 # third-party
+from pytest import raises
 from vcorelib.paths.context import tempfile
 
 # module under test
 from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.channel.environment.sample import sample_env
+from runtimepy.channel.event.block import EventBlockWriter
+from runtimepy.channel.event.index import EventIndexWriter, read_event_index
+from runtimepy.channel.event.ring import EventRing, event_value_codec
+from runtimepy.channel.event.shared import SEQUENCE
+from runtimepy.channel.registry import ParsedEvent
 from runtimepy.mapping import DEFAULT_PATTERN
+from runtimepy.primitives import Int32
+
+# internal
+from tests.resources import benchmark
 
 
 def test_channel_registry_streams_basic():
@@ -48,3 +63,315 @@ def test_channel_registry_streams_basic():
             assert events[4].value == 2
             assert events[5].name == "c"
             assert events[5].value == 3
+
+
+def test_channel_registry_event_data_chunks():
+    """Test parsing events from stream data split at arbitrary points."""
+
+    env = sample_env()
+    env.finalize()
+
+    field = "a.fields.field1"
+    with BytesIO() as stream:
+        with env.registered(stream, pattern=f"sample_float|{field}"):
+            for idx in range(100):
+                env.set("sample_float", idx / 2.0)
+                env.set(field, "one" if idx % 2 else "three")
+        data = stream.getvalue()
+
+    expected = list(env.parse_event_data(data))
+    assert len(expected) == 200
+    assert not env.channels.event_fifo.size
+
+    for chunk_size in [1, 3, 7, 64]:
+        events: list[ParsedEvent] = []
+        for idx in range(0, len(data), chunk_size):
+            events.extend(env.parse_event_data(data[idx : idx + chunk_size]))
+        assert events == expected
+
+    # Partial events are retained until completed.
+    assert not list(env.parse_event_data(data[:5]))
+    assert env.channels.event_fifo.size == 5
+    assert list(env.parse_event_data(data[5:])) == expected
+    assert not env.channels.event_fifo.size
+
+    # Data isn't lost if parsing stops early.
+    parser = env.parse_event_data(data)
+    assert next(parser) == expected[0]
+    parser.close()
+    assert list(env.parse_event_data(b"")) == expected[1:]
+    assert not env.channels.event_fifo.size
+
+    benchmark("parse event data", lambda: list(env.parse_event_data(data)))
+
+
+def test_channel_registry_event_ring():
+    """Test streaming channel events through a ring buffer."""
+
+    env = sample_env()
+    env.finalize()
+    ring = EventRing(capacity=64)
+
+    field = "a.fields.field1"
+    with env.registered_ring(ring, pattern=f"sample_float|{field}") as names:
+        assert set(names) == {"sample_float", field}
+        assert ring.pending == 2
+
+        env.set("sample_float", 1.5)
+        env.set(field, "one")
+        env.set("sample_float", -1.5)
+
+    # Changes after the context aren't recorded.
+    env.set("sample_float", 2.5)
+    assert ring.pending == 5
+
+    events = list(env.parse_event_ring(ring, limit=3))
+    assert [x.name for x in events] == [field, "sample_float", "sample_float"]
+    assert events[2].value == 1.5
+    assert events[2].timestamp >= events[1].timestamp
+
+    events = list(env.parse_event_ring(ring))
+    assert [x.name for x in events] == [field, "sample_float"]
+    assert events[1].value == -1.5
+
+    # Replaying events reproduces the environment state.
+    env.set(field, "three")
+    env.ingest(events[0])
+    assert env.value(field) == "one"
+    assert ring.pending == 0
+
+    # Overflow drops the oldest events.
+    codec = event_value_codec(Int32.kind)
+    for idx in range(100):
+        ring.append(1, idx, codec, -idx)
+    assert ring.pending == 64
+    assert ring.dropped == 36
+
+    batch = ring.consume(limit=10)
+    assert len(batch) == 10
+    assert list(batch.timestamps) == list(range(36, 46))
+    assert batch.value(0, codec) == -36
+
+    batch = ring.consume()
+    assert len(batch) == 54
+    assert list(batch.timestamps) == list(range(46, 100))
+    assert len(ring.consume()) == 0
+
+
+def test_channel_shared_values():
+    """Test sharing channel values via shared memory."""
+
+    env = sample_env()
+    env.finalize()
+    mirror = ChannelEnvironment.load_json(env.export_json())
+
+    field = "a.fields.field1"
+
+    with ExitStack() as stack:
+        shared = stack.enter_context(env.shared_values())
+        reader = stack.enter_context(mirror.shared_values(shared.name))
+
+        with env.registered_shared(shared) as names:
+            assert "sample_float" in names
+
+            # The initial read includes all values.
+            assert mirror.ingest_shared(reader) == len(names)
+            assert mirror.ingest_shared(reader) == 0
+
+            env.set("sample_float", 1.5)
+            env.set(field, "one")
+            assert reader.changed
+            assert mirror.ingest_shared(reader) > 1
+            assert mirror.value("sample_float") == 1.5
+            assert mirror.value(field) == "one"
+
+            # Writing the same value doesn't produce an update.
+            env.set("sample_float", 1.5)
+            assert mirror.ingest_shared(reader) == 0
+
+            # A write in progress prevents reading.
+            shared.sequence += 1
+            SEQUENCE.pack_into(shared.buf, 0, shared.sequence)
+            assert reader.read(attempts=2) is None
+            assert mirror.ingest_shared(reader) == 0
+            shared.sequence += 1
+            SEQUENCE.pack_into(shared.buf, 0, shared.sequence)
+            assert reader.read() is not None
+
+        # Changes after the context aren't shared.
+        env.set("sample_float", 2.5)
+        assert not reader.changed
+
+        # Layouts must match.
+        with raises(AssertionError):
+            with ChannelEnvironment().shared_values(shared.name):
+                pass
+
+
+def test_channel_shared_values_benchmark():
+    """Compare sharing values via an event stream and shared memory."""
+
+    env = ChannelEnvironment()
+    for idx in range(100):
+        assert env.int_channel(f"a{idx}")
+    env.finalize()
+    raws = [env.channels[f"a{idx}"].raw for idx in range(100)]
+    mirror = ChannelEnvironment.load_json(env.export_json())
+
+    def update() -> None:
+        """Change all channel values."""
+        for raw in raws:
+            raw.value += 1
+
+    with BytesIO() as stream:
+        with env.channels.registered(stream):
+
+            def streamed() -> None:
+                """Write and then parse events."""
+
+                stream.seek(0)
+                stream.truncate()
+                update()
+
+                for event in mirror.parse_event_data(stream.getvalue()):
+                    mirror.ingest(event)
+
+            benchmark("stream 100 values", streamed)
+
+    assert mirror.value("a0") == env.value("a0")
+
+    with env.shared_values() as shared:
+        with env.registered_shared(shared):
+            with mirror.shared_values(shared.name) as reader:
+
+                def shared_update() -> None:
+                    """Write and then read values."""
+
+                    update()
+                    assert mirror.ingest_shared(reader) == 100
+
+                benchmark("share 100 values", shared_update)
+
+    assert mirror.value("a0") == env.value("a0")
+
+
+def test_channel_event_sink_benchmark():
+    """Compare the ring-buffer and stream event sinks."""
+
+    env = ChannelEnvironment()
+    assert env.int_channel("a")
+    raw = env.channels["a"].raw
+
+    def update() -> None:
+        """Change the channel value."""
+        raw.value += 1
+
+    with BytesIO() as stream:
+        with env.channels.registered(stream):
+            benchmark("stream event", update, iterations=10000)
+
+    with BytesIO() as stream:
+        writer = EventBlockWriter(stream)
+        with env.channels.registered(writer):
+            benchmark("block event", update, iterations=10000)
+        writer.write_block()
+
+    ring = EventRing()
+    with env.registered_ring(ring, pattern="a"):
+        benchmark("ring event", update, iterations=10000)
+    assert ring.pending == 10001
+
+
+def test_channel_event_blocks():
+    """Test writing and reading compressed blocks of events."""
+
+    env = ChannelEnvironment()
+    assert env.int_channel("a")
+    assert env.int_channel("b", kind="int16")
+    env.float_channel("c")
+    env.bool_channel("d")
+
+    def poke(count: int) -> None:
+        """Change channel values."""
+
+        for idx in range(count):
+            env["a"] = idx
+            env["b"] = -(idx % 100)
+            env["c"] = idx / 4.0
+            env["d"] = bool(idx % 2)
+
+    with BytesIO() as stream:
+        with env.channels.registered(stream):
+            poke(1000)
+        raw = stream.getvalue()
+
+    stream = BytesIO(raw)
+    expected = list(env.parse_event_stream(stream))
+    assert len(expected) == 4000
+
+    for compression in ["zlib", "lzma"]:
+        # Restore initial values.
+        env["a"] = 0
+        env["b"] = 0
+        env["c"] = 0.0
+        env["d"] = False
+
+        with BytesIO() as stream:
+            writer = EventBlockWriter(
+                stream, compression=compression, events=999
+            )
+            with env.channels.registered(writer):
+                poke(1000)
+
+            # A partial block is pending.
+            assert writer.write_block() > 0
+            assert writer.write_block() == 0
+
+            data = stream.getvalue()
+
+        assert len(data) * 3 < len(raw)
+
+        # Values match the uncompressed stream (timestamps are monotonic).
+        events = list(env.parse_event_blocks(BytesIO(data)))
+        assert [(x.name, x.value) for x in events] == [
+            (x.name, x.value) for x in expected
+        ]
+        assert all(
+            x.timestamp <= y.timestamp for x, y in zip(events, events[1:])
+        )
+
+        # Truncated blocks are ignored.
+        assert not list(env.parse_event_blocks(BytesIO(data[:10])))
+
+
+def test_channel_event_index_rate_limited():
+    """Test that checkpoints only contain values written to the stream."""
+
+    env = ChannelEnvironment()
+    limited = Int32()
+    env.channel("limited", limited, min_period_s=60.0)
+    fast = Int32()
+    env.channel("fast", fast)
+
+    events = BytesIO()
+    data = BytesIO()
+    index = EventIndexWriter(data, events=1)
+
+    with env.channels.registered(events, index=index):
+        # This update is rate limited (not written to the event stream).
+        limited.value = 5
+        fast.value = 1
+
+    entries = read_event_index(data.getvalue(), lambda x: env.channels[x].type)
+    assert entries
+
+    ident = env.channels["limited"].id
+    assert all(x.values[ident] == 0 for x in entries)
+
+    # Checkpoints agree with a full scan of the event stream.
+    scanned = {
+        x.name: x.value
+        for x in env.parse_event_stream(BytesIO(events.getvalue()))
+    }
+    assert scanned["limited"] == 0
+    assert entries[-1].values[env.channels["fast"].id] == scanned["fast"]
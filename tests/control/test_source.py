@@ -0,0 +1,114 @@
+"""
+Test the 'control.source' module.
+"""
+
+# built-in
+from array import array
+from statistics import fmean, stdev
+from typing import Callable, cast
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.control.source import (
+    ChirpSource,
+    DoubleSource,
+    PrimitiveSource,
+    SineBankSource,
+)
+from runtimepy.net.arbiter import AppInfo
+from runtimepy.noise import GaussianSource, RandomWalkSource, normal_samples
+
+# internal
+from tests.resources import benchmark
+
+
+async def create_source(
+    kind: Callable[..., DoubleSource],
+    count: int,
+    horizon: int = 1,
+    **config,
+) -> DoubleSource:
+    """Create a signal source with unity amplitudes."""
+
+    result = kind("source", {"count": count, "horizon": horizon, **config})
+    await result.build(cast(AppInfo, None))
+    for amplitude in result.amplitudes:
+        amplitude.value = 1.0
+    return result
+
+
+def outputs(source: DoubleSource, polls: int) -> list[list[float]]:
+    """Poll a source and collect its outputs."""
+
+    result = []
+    for _ in range(polls):
+        source.poll()
+        result.append([x.value for x in source.outputs])
+    return result
+
+
+@mark.asyncio
+async def test_signal_sources_basic():
+    """Test basic interactions with signal sources."""
+
+    for kind in [SineBankSource, ChirpSource]:
+        # Block generation matches element-wise generation.
+        source = await create_source(kind, 4)
+        block = array("d", bytes(8 * 4 * 3))
+        source.source_block(block)
+        expected = array("d", bytes(8 * 4 * 3))
+        PrimitiveSource.source_block(source, expected)
+        assert block[:4] == expected[:4]
+
+        # Generating future samples doesn't change outputs.
+        single = outputs(await create_source(kind, 4), 10)
+        assert single == outputs(await create_source(kind, 4, horizon=3), 10)
+        assert single[1][0] != single[0][0]
+        assert all(-1.0 <= x <= 1.0 for row in single for x in row)
+
+    for kind in [GaussianSource, RandomWalkSource]:
+        source = await create_source(kind, 4, horizon=4)
+        values = outputs(source, 10)
+        assert len(set(x for row in values for x in row)) == 40
+        assert source.sample == 12
+
+    # Bulk samples are normally distributed.
+    samples = normal_samples(10001, sigma=2.0)
+    assert len(samples) == 10001
+    assert abs(fmean(samples)) < 0.2
+    assert 1.8 < stdev(samples) < 2.2
+
+    # Random walks take steps from their previous values.
+    source = await create_source(RandomWalkSource, 2, step=0.0)
+    assert outputs(source, 2) == [[0.0, 0.0], [0.0, 0.0]]
+    assert source.source(0) == 0.0
+
+
+@mark.asyncio
+async def test_signal_sources_benchmark():
+    """Benchmark polling sources with many outputs."""
+
+    count = 1000
+
+    for kind in [GaussianSource, RandomWalkSource, SineBankSource]:
+        source = await create_source(kind, count, horizon=10)
+        block = array("d", bytes(8 * count))
+
+        def element(
+            source: DoubleSource = source, block: array[float] = block
+        ) -> None:
+            """Generate values one at a time."""
+            PrimitiveSource.source_block(source, block)
+
+        def vector(
+            source: DoubleSource = source, block: array[float] = block
+        ) -> None:
+            """Generate values in bulk."""
+            source.source_block(block)
+
+        name = kind.__name__
+        benchmark(f"{name} element-wise ({count} outputs)", element, 100)
+        benchmark(f"{name} block ({count} outputs)", vector, 100)
+        benchmark(f"{name} poll ({count} outputs)", source.poll, 100)
@@ -2,15 +2,25 @@
 Test the 'control.step' module.
 """
 
+# built-in
+import asyncio
+
+# third-party
+from pytest import raises
+
 # module under test
 from runtimepy.control.step import ToggleStepper, ToggleStepperTask
 from runtimepy.net.arbiter.info import AppInfo
 
+# internal
+from tests.resources import benchmark
+
 
 async def controls_test(app: AppInfo) -> int:
     """Test JSON clients in parallel."""
 
-    toggler = list(app.search_tasks(ToggleStepperTask))[0]
+    toggler = app.tasks["clock_task"]
+    assert isinstance(toggler, ToggleStepperTask)
     toggler.paused.value = False
 
     stepper = list(app.search_structs(ToggleStepper))[0]
@@ -30,4 +40,46 @@ async def controls_test(app: AppInfo) -> int:
 
     assert await toggler.dispatch()
 
+    # Free run for a duration of simulated time.
+    runner = app.tasks["clock_free_run"]
+    runner.paused.value = False
+    counts = stepper.counts.value
+    assert await runner.dispatch()
+    assert runner.paused
+    assert stepper.simulate_time
+    assert stepper.counts.value >= counts + 1000
+    assert stepper.speedup.value > 0.0
+
+    # Free runs must yield to the event loop.
+    with raises(AssertionError):
+        await stepper.free_run(0.1, yield_steps=0)
+
+    stepper.count.value = 100
+    benchmark("Toggle step (100 counts)", stepper.step.toggle, 100)
+    benchmark(
+        "Free-run step (100 counts)", lambda: stepper.poll_many(100), 100
+    )
+
+    # Free runs can be stopped early.
+    checks: list[None] = []
+
+    def keep_running() -> bool:
+        """Determine if a free run should continue."""
+        checks.append(None)
+        return len(checks) < 3
+
+    counts = stepper.counts.value
+    await stepper.free_run(3600.0, yield_steps=10, keep_running=keep_running)
+    assert stepper.counts.value == counts + 20
+
+    # Long free runs stop when their task is disabled.
+    runner.config["free_run_s"] = 3600.0
+    run = asyncio.create_task(runner.dispatch())
+    await asyncio.sleep(0.01)
+    assert runner.disable()
+    assert await asyncio.wait_for(run, 1.0)
+    assert runner.paused
+
+    stepper.simulate_time.toggle()
+
     return 0
@@ -0,0 +1,110 @@
+"""
+Test the 'message.codec' module.
+"""
+
+# built-in
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum, IntEnum
+from pathlib import Path
+
+# module under test
+from runtimepy.message import JsonMessage, MessageProcessor
+from runtimepy.message.codec import (
+    CODECS,
+    DEFAULT_CODEC,
+    STDLIB_CODEC,
+    orjson_codec,
+)
+
+# internal
+from tests.resources import benchmark
+
+
+@dataclass
+class Point:
+    """A sample dataclass."""
+
+    x: int
+
+
+class Color(Enum):
+    """A sample enumeration."""
+
+    RED = "red"
+
+
+class Level(IntEnum):
+    """A sample integer enumeration."""
+
+    HIGH = 2
+
+
+def test_message_codecs_basic():
+    """Test encoding and decoding with all available codecs."""
+
+    assert STDLIB_CODEC.name in CODECS
+    assert DEFAULT_CODEC.name in CODECS
+    assert (orjson_codec() is None) == ("orjson" not in CODECS)
+
+    data = {"a": [1, 2.5, None, True], "b": {"c": "d"}, "e": "é"}
+
+    for codec in CODECS.values():
+        encoded = codec.encode(data)
+        assert isinstance(encoded, bytes)
+        assert b" " not in encoded
+        assert codec.decode(encoded) == data
+        assert codec.decode(bytearray(encoded)) == data
+        assert codec.decode(encoded.decode()) == data
+
+        # Unsupported types are converted to strings.
+        assert codec.encode({"path": Path("a")}) == b'{"path":"a"}'
+
+        # Large integers and non-string keys.
+        assert codec.encode({"a": 2**70}) == b'{"a":1180591620717411303424}'
+        assert codec.encode({1: "a"}) == b'{"1":"a"}'
+
+        # Other types are encoded like the standard-library codec.
+        stamp = datetime(2024, 1, 2, 3, 4, 5)
+        for value in [stamp, Point(1), Level.HIGH, 1.5]:
+            assert codec.encode([value]) == STDLIB_CODEC.encode([value])
+
+    # Known differences (non-finite floats and enumeration members).
+    fast = CODECS.get("orjson")
+    if fast is not None:
+        assert fast.encode([float("nan")]) == b"[null]"
+        assert fast.encode([Color.RED]) == b'["red"]'
+        assert STDLIB_CODEC.encode([Color.RED]) == b'["Color.RED"]'
+
+
+def test_message_processor_codec():
+    """Test framing and parsing JSON messages."""
+
+    processor = MessageProcessor()
+
+    frames = b"".join(
+        processor.frame_json({"index": idx}) for idx in range(10)
+    )
+
+    # Split data arbitrarily.
+    messages: list[JsonMessage] = []
+    for idx in range(0, len(frames), 7):
+        messages.extend(processor.messages(frames[idx : idx + 7]))
+    assert messages == [{"index": idx} for idx in range(10)]
+
+    data = {"ui": {"tab": {"kind": "frame", "points": list(range(100))}}}
+
+    for codec in CODECS.values():
+        processor.codec = codec
+
+        def encode() -> None:
+            """Frame a message."""
+            assert processor.frame_json(data)
+
+        benchmark(f"{codec.name} frame", encode)
+
+        def decode(frame: bytes = processor.frame_json(data)) -> None:
+            """Parse a message."""
+            assert list(processor.messages(frame)) == [data]
+
+        benchmark(f"{codec.name} parse", decode)
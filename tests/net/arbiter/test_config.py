@@ -121,3 +121,25 @@ async def test_connection_arbiter_config_echo():
     await connection_arbiter_config_echo(
         ConnectionArbiter(app=[echo_test_app, echo_message_test_app])
     )
+
+
+async def shared_tasks_test_app(app: AppInfo) -> int:
+    """Test tasks dispatched from shared timers."""
+
+    assert app.task_manager.shared_timer
+
+    for task in app.tasks.values():
+        assert await task.wait_iterations(5.0, count=2)
+
+    return 0
+
+
+@mark.asyncio
+async def test_connection_arbiter_config_shared_tasks():
+    """Test loading tasks that share timers."""
+
+    arbiter = ConnectionArbiter(app=shared_tasks_test_app)
+    await arbiter.load_configs(
+        [resource("connection_arbiter", "shared_tasks.yaml")]
+    )
+    assert await arbiter.app() == 0
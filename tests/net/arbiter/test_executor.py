@@ -0,0 +1,69 @@
+"""
+Test the 'net.arbiter.executor' module.
+"""
+
+# built-in
+import asyncio
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from os import getpid
+import time
+
+# third-party
+from pytest import mark, raises
+
+# module under test
+from runtimepy.net.arbiter.executor import (
+    EXECUTORS,
+    TaskExecutor,
+    run_in_executor,
+    shared_executor,
+    shutdown_executors,
+)
+
+
+def blocking(duration_s: float) -> int:
+    """Block for some duration."""
+
+    time.sleep(duration_s)
+    return getpid()
+
+
+@mark.asyncio
+async def test_run_in_executor_basic():
+    """Test running functions on shared executors."""
+
+    assert shared_executor(TaskExecutor.LOOP) is None
+
+    for kind in TaskExecutor:
+        delay, pid = await run_in_executor(kind, blocking, 0.0)
+        assert delay >= 0.0
+        assert (pid == getpid()) == (kind is not TaskExecutor.PROCESS)
+
+    # Executors are shared.
+    executor = shared_executor(TaskExecutor.THREAD)
+    assert executor is shared_executor(TaskExecutor.THREAD)
+
+    # Blocking work on a thread doesn't stall the event loop.
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    task = asyncio.create_task(
+        run_in_executor(TaskExecutor.THREAD, blocking, 0.1)
+    )
+    await asyncio.sleep(0.01)
+    assert loop.time() - start < 0.1
+    await task
+
+    # Broken executors get replaced.
+    shutdown_executors()
+    assert not EXECUTORS
+    executor = shared_executor(TaskExecutor.PROCESS)
+    assert isinstance(executor, ProcessPoolExecutor)
+    await run_in_executor(TaskExecutor.PROCESS, blocking, 0.0)
+    processes = executor._processes  # pylint: disable=protected-access
+    for process in list(processes.values()):
+        process.kill()
+    with raises(BrokenExecutor):
+        await run_in_executor(TaskExecutor.PROCESS, blocking, 0.0)
+    assert TaskExecutor.PROCESS not in EXECUTORS
+
+    shutdown_executors()
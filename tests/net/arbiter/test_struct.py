@@ -0,0 +1,61 @@
+"""
+Test the 'net.arbiter.struct' module.
+"""
+
+# built-in
+from typing import cast
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.net.arbiter import AppInfo
+from runtimepy.telemetry.sample import SampleTelemetryStruct
+
+
+async def create_struct(name: str) -> SampleTelemetryStruct:
+    """Create a sample timestamped struct."""
+
+    result = SampleTelemetryStruct(name, {})
+    await result.build(cast(AppInfo, None))
+    return result
+
+
+@mark.asyncio
+async def test_timestamped_struct_batch():
+    """Test decoding arrays of struct instances in a single pass."""
+
+    tx = await create_struct("tx")
+    rx = await create_struct("rx")
+
+    frame = bytes()
+    for _ in range(5):
+        tx.poll()
+        frame += bytes(tx.array)
+
+    timestamps: list[int] = []
+    sequence = tx.sequence.value
+
+    batch = rx.process_batch(frame, on_update=timestamps.append)
+    assert batch.instances == 5
+    assert len(batch.columns) == len(list(rx.array.iter_unpack(frame))[0])
+    assert batch.columns[1] == tuple(range(sequence - 4, sequence + 1))
+
+    # Only the last instance is applied by default.
+    assert timestamps == [batch.timestamps[-1]]
+    assert rx.timestamp.value == tx.timestamp.value
+    assert rx.sequence.value == sequence
+
+    # Replay every instance through primitive callbacks.
+    updates: list[int] = []
+    rx.sequence.register_callback(lambda _, new: updates.append(new))
+    timestamps.clear()
+
+    batch = rx.process_batch(frame, replay=True, on_update=timestamps.append)
+    assert timestamps == list(batch.timestamps)
+    assert updates == list(batch.columns[1])
+
+    # Consistent with the instance-at-a-time path.
+    assert list(rx.process_datagram(frame)) == list(batch.timestamps)
+
+    assert rx.process_batch(bytes()).instances == 0
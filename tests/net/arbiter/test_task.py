@@ -0,0 +1,84 @@
+"""
+Test the 'net.arbiter.task' module.
+"""
+
+# built-in
+from typing import Any, Optional
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.net.arbiter import AppInfo, ConnectionArbiter
+from runtimepy.net.arbiter.executor import (
+    EXECUTORS,
+    TaskExecutor,
+    run_in_executor,
+    shutdown_executors,
+)
+from runtimepy.net.arbiter.task import ArbiterTask, ChannelUpdates
+from runtimepy.primitives import Uint32
+
+
+class SquareTask(ArbiterTask):
+    """A task that computes channel values off of the event loop."""
+
+    def _init_state(self) -> None:
+        """Add channels to this instance's channel environment."""
+
+        self.env.channel("x", Uint32(), commandable=True)
+        self.env.channel("y", Uint32())
+
+    def dispatch_inputs(self) -> dict[str, Any]:
+        """Get inputs for a synchronous dispatch."""
+        return {"x": self.env.value("x")}
+
+    @classmethod
+    def dispatch_sync(cls, inputs: dict[str, Any]) -> Optional[ChannelUpdates]:
+        """Dispatch an iteration of this task synchronously."""
+
+        x = inputs["x"]
+        return {"x": x + 1, "y": x * x} if x < 5 else None
+
+
+@mark.asyncio
+async def test_arbiter_task_executors():
+    """Test running synchronous task dispatches on each executor."""
+
+    for kind in TaskExecutor:
+        task = SquareTask(f"square_{kind}", executor=kind)
+        task.env.finalize()
+        assert task.executor is kind
+
+        await task.task(period_s=0.01)
+        assert await task.wait_iterations(5.0, count=6)
+        await task.stop()
+
+        assert task.env.value("x") == 5
+        assert task.env.value("y") == 16
+        assert task.metrics.dispatches.value == 6
+        assert task.metrics.queue_delay_s.value >= 0.0
+
+    # Dispatches that don't update channels keep the task running.
+    task = SquareTask("default")
+    assert task.executor is TaskExecutor.LOOP
+    assert await ArbiterTask.dispatch(task)
+
+    shutdown_executors()
+
+
+async def executor_app(app: AppInfo) -> int:
+    """Run a synchronous call on a shared executor."""
+
+    del app
+    _, result = await run_in_executor(TaskExecutor.THREAD, pow, 2, 3)
+    assert TaskExecutor.THREAD in EXECUTORS
+    return 0 if result == 8 else 1
+
+
+@mark.asyncio
+async def test_arbiter_shutdown_executors():
+    """Test that shared executors are shut down when an arbiter stops."""
+
+    assert await ConnectionArbiter(app=executor_app).app() == 0
+    assert not EXECUTORS
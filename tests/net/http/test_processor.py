@@ -0,0 +1,138 @@
+"""
+Test the 'net.http' module's message processor.
+"""
+
+# built-in
+import http
+from typing import Optional
+
+# third-party
+from pytest import raises
+
+# module under test
+from runtimepy.net.http import HttpMessageProcessor
+from runtimepy.net.http.common import LAST_CHUNK, encode_chunk
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.http.response import ResponseHeader
+from runtimepy.net.http.state import HeaderSizeError
+
+# internal
+from tests.resources import benchmark
+
+
+def sample_requests(count: int) -> bytes:
+    """Create pipelined request data."""
+
+    data = bytearray()
+    for idx in range(count):
+        request = RequestHeader(target=f"/json/{idx}")
+        request["host"] = "localhost:8000"
+        request["user-agent"] = "test"
+        request["accept"] = "application/json"
+        request["connection"] = "keep-alive"
+
+        payload = None
+        if idx % 2:
+            request.method = http.HTTPMethod.POST
+            payload = f"payload {idx}".encode()
+            request["content-length"] = str(len(payload))
+
+        data.extend(bytes(request))
+        if payload:
+            data.extend(payload)
+
+    return bytes(data)
+
+
+def test_http_message_processor_pipelined():
+    """Test processing pipelined requests (whole and fragmented)."""
+
+    data = sample_requests(10)
+
+    for chunk_size in [len(data), 7, 1]:
+        processor = HttpMessageProcessor()
+
+        results: list[tuple[RequestHeader, Optional[bytearray]]] = []
+        for idx in range(0, len(data), chunk_size):
+            results.extend(
+                processor.ingest(data[idx : idx + chunk_size], RequestHeader)
+            )
+
+        assert len(results) == 10
+        for idx, (header, payload) in enumerate(results):
+            assert header.target.path == f"/json/{idx}"
+            assert header["host"] == "localhost:8000"
+
+            if idx % 2:
+                assert header.method is http.HTTPMethod.POST
+                assert payload == f"payload {idx}".encode()
+            else:
+                assert payload is None
+
+    # Bare line feeds and leading empty lines are tolerated.
+    results = list(
+        HttpMessageProcessor().ingest(
+            b"\r\nGET / HTTP/1.1\nHost: a\n\n", RequestHeader
+        )
+    )
+    assert len(results) == 1
+    assert results[0][0]["host"] == "a"
+
+
+def test_http_message_processor_chunked():
+    """Test processing messages with chunked payloads."""
+
+    response = ResponseHeader()
+    response["transfer-encoding"] = "chunked"
+    assert response.chunked
+
+    data = (
+        bytes(response)
+        + encode_chunk(b"hello, ")
+        + b"6;name=value\r\nworld!\r\n"
+        + LAST_CHUNK
+    )
+
+    # Include a trailer section in the second message.
+    data += bytes(response) + encode_chunk(b"abc") + b"0\r\nTrailer: a\r\n\r\n"
+
+    for chunk_size in [len(data), 5, 1]:
+        processor = HttpMessageProcessor()
+
+        results: list[tuple[ResponseHeader, Optional[bytearray]]] = []
+        for idx in range(0, len(data), chunk_size):
+            results.extend(
+                processor.ingest(data[idx : idx + chunk_size], ResponseHeader)
+            )
+
+        assert [x[1] for x in results] == [b"hello, world!", b"abc"]
+        assert not processor.buffer.size
+
+
+def test_http_message_processor_max_header_size():
+    """Test that header sections are limited in size."""
+
+    processor = HttpMessageProcessor(max_header_size=64)
+
+    # A complete header section that's too large.
+    with raises(HeaderSizeError):
+        list(processor.ingest(sample_requests(1), RequestHeader))
+
+    # An incomplete header section that's too large.
+    processor = HttpMessageProcessor(max_header_size=64)
+    assert not list(processor.ingest(b"GET / HTTP/1.1\r\n", RequestHeader))
+    with raises(HeaderSizeError):
+        list(processor.ingest(b"a: b\r\n" * 10, RequestHeader))
+
+
+def test_http_message_processor_benchmark():
+    """Benchmark processing pipelined requests."""
+
+    data = sample_requests(100)
+    processor = HttpMessageProcessor()
+
+    def ingest() -> None:
+        """Process a batch of requests."""
+        assert len(list(processor.ingest(data, RequestHeader))) == 100
+
+    benchmark("100 pipelined requests", ingest, iterations=100)
@@ -80,6 +80,7 @@ async def runtimepy_websocket_client(app: AppInfo) -> None:
         # Trigger some telemetry sending.
         send_ui(client, f"wave{idx}", {"kind": "init"})
         send_ui(client, f"wave{idx}", {"kind": "tab.shown"})
+        send_ui(client, f"wave{idx}", {"kind": "plot", "value": {"width": 8}})
         await asyncio.sleep(0)
 
         app.logger.info("%d", idx)
@@ -132,6 +133,24 @@ async def runtimepy_http_client_server(
     # Add another path to server.
     server.add_path(resource("http"), front=True)
 
+    # Conditional and compressed requests for cached files.
+    request = RequestHeader(target="/sample.json")
+    request["accept-encoding"] = "deflate"
+    response = await client.request(request)
+    request["if-none-match"] = response[0]["etag"]
+    assert (await client.request(request))[0].status == 304
+
+    # Conditional requests for directories with index files (after the
+    # resolved file is forgotten, e.g. by a restart).
+    request = RequestHeader(target="/site")
+    response = await client.request(request)
+    assert response[1]
+    request["if-none-match"] = response[0]["etag"]
+    server.file_cache.clear()
+    response = await client.request(request)
+    assert response[0].status == 304
+    assert not response[1], response[1]
+
     env = "connection_metrics_poller"
     env_path = f"/json/environments/{env}"
 
@@ -0,0 +1,189 @@
+"""
+Test the 'net.server.cache' module.
+"""
+
+# built-in
+import asyncio
+import http
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import zlib
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.http.response import ResponseHeader
+from runtimepy.net.server import package_data_dir
+from runtimepy.net.server.cache import (
+    RenderCache,
+    StaticFileCache,
+    accepts_encoding,
+)
+
+# internal
+from tests.resources import benchmark
+
+
+def test_accepts_encoding():
+    """Test parsing 'Accept-Encoding' field values."""
+
+    request = RequestHeader()
+    assert not accepts_encoding(request, "deflate")
+
+    for value, expected in [
+        ("gzip, deflate, br", True),
+        ("gzip;q=1.0, deflate;q=0.5", True),
+        ("deflate;q=0", False),
+        ("*", True),
+        ("gzip", False),
+        ("deflate;q=abc", False),
+    ]:
+        request["accept-encoding"] = value
+        assert accepts_encoding(request, "deflate") is expected, value
+
+
+@mark.asyncio
+async def test_static_file_cache_basic():
+    """Test caching, compressing and invalidating file contents."""
+
+    cache = StaticFileCache()
+
+    with TemporaryDirectory() as tmpdir:
+        text = Path(tmpdir, "sample.txt")
+        text.write_text("hello, world! " * 100, encoding="utf-8")
+
+        assert await cache.get(text.parent) is None
+        assert await cache.get(text.with_suffix(".asdf")) is None
+
+        entry = await cache.get(text)
+        assert entry is not None
+        assert entry.data == text.read_bytes()
+        assert entry.deflated is not None
+        assert zlib.decompress(entry.deflated) == entry.data
+        assert await cache.get(text) is entry
+        assert cache.size == entry.footprint
+
+        # Identity response.
+        response = ResponseHeader()
+        assert entry.respond(response, RequestHeader()) == entry.data
+        assert response["etag"] == entry.etag
+        assert response["vary"] == "Accept-Encoding"
+        assert response.get("content-encoding") is None
+
+        # Compressed response.
+        request = RequestHeader()
+        request["accept-encoding"] = "gzip, deflate"
+        response = ResponseHeader()
+        assert entry.respond(response, request) == entry.deflated
+        assert response["content-encoding"] == "deflate"
+        etag = response["etag"]
+        assert etag != entry.etag
+
+        # Not-modified responses.
+        request["if-none-match"] = f'"a", W/{etag}'
+        response = ResponseHeader()
+        assert entry.respond(response, request) == b""
+        assert response.status is http.HTTPStatus.NOT_MODIFIED
+
+        # Modifying the file invalidates the entry.
+        text.write_text("hello, world!", encoding="utf-8")
+        stat = text.stat()
+        os.utime(text, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        new_entry = await cache.get(text)
+        assert new_entry is not None
+        assert new_entry.data == b"hello, world!"
+        assert new_entry.etag != entry.etag
+        assert new_entry.deflated is None
+        assert cache.size == new_entry.footprint
+
+        # Removing the file invalidates the entry.
+        text.unlink()
+        assert await cache.get(text) is None
+        assert not cache.files
+        assert cache.size == 0
+
+
+@mark.asyncio
+async def test_static_file_cache_bounds():
+    """Test cache size limits."""
+
+    cache = StaticFileCache(max_size=2**16, max_file_size=2**12)
+
+    with TemporaryDirectory() as tmpdir:
+        paths = []
+        for idx in range(40):
+            path = Path(tmpdir, f"{idx}.bin")
+            path.write_bytes(os.urandom(2**11))
+            paths.append(path)
+
+            cache.remember([], str(path), path)
+            assert await cache.get(path) is not None
+            assert cache.size <= cache.max_size
+
+        # The least-recently-used entries were evicted.
+        assert paths[0] not in cache.files
+        assert paths[-1] in cache.files
+
+        # Large files aren't cached.
+        large = Path(tmpdir, "large.bin")
+        large.write_bytes(bytes(2**13))
+        entry = await cache.get(large)
+        assert entry is not None
+        assert entry.data is None
+        assert entry.respond(ResponseHeader(), None) is None
+        assert large not in cache.files
+
+        assert cache.resolve([], str(paths[0])) == paths[0]
+        cache.forget([], str(paths[0]))
+        assert cache.resolve([], str(paths[0])) is None
+
+        cache.clear()
+        assert not cache.files
+        assert cache.size == 0
+
+
+def test_static_file_cache_benchmark():
+    """Benchmark serving a bundled static file from the cache."""
+
+    cache = StaticFileCache()
+    path = package_data_dir().joinpath("static", "css", "bootstrap.min.css")
+
+    request = RequestHeader()
+    request["accept-encoding"] = "gzip, deflate"
+
+    loop = asyncio.new_event_loop()
+    try:
+
+        def serve() -> None:
+            """Serve the file."""
+
+            entry = loop.run_until_complete(cache.get(path))
+            assert entry is not None
+            assert entry.respond(ResponseHeader(), request)
+
+        benchmark("cached static file", serve)
+    finally:
+        loop.close()
+
+
+def test_render_cache_basic():
+    """Test storing and evicting rendered content."""
+
+    cache = RenderCache(max_entries=2)
+
+    assert cache.get("a") is None
+    assert cache.put("a", b"a") == b"a"
+    cache.put("b", b"b")
+    assert cache.get("a") == b"a"
+
+    # The least-recently-used entry is evicted.
+    cache.put("c", b"c")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"a"
+    assert cache.get("c") == b"c"
+
+    cache.clear()
+    assert cache.get("a") is None
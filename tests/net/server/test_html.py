@@ -0,0 +1,45 @@
+"""
+Test the 'net.server.html' module.
+"""
+
+# built-in
+from io import StringIO
+
+# third-party
+from svgen.element.html import div
+
+# module under test
+from runtimepy.net.server.html import RENDERED, get_html, render_html
+
+# internal
+from tests.resources import benchmark
+
+
+def test_render_html_cached():
+    """Test that rendered documents are cached."""
+
+    document = get_html()
+    for idx in range(1000):
+        div(parent=document.body, text=f"element {idx}")
+
+    with StringIO() as stream:
+        document.render(stream)
+        expected = stream.getvalue()
+
+    result = render_html(document)
+    assert result == expected
+    assert render_html(document) is result
+    assert document in RENDERED
+
+    def render() -> None:
+        """Render a document."""
+        with StringIO() as stream:
+            document.render(stream)
+
+    benchmark("render 1000-element document", render, iterations=10)
+    benchmark("cached 1000-element document", lambda: render_html(document))
+
+    # Entries don't outlive documents.
+    size = len(RENDERED)
+    render_html(get_html())
+    assert len(RENDERED) == size
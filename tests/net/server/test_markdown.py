@@ -2,8 +2,13 @@
 Test the 'net.server.markdown' module.
 """
 
+# built-in
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
 # module under test
-from runtimepy.net.server.markdown import markdown_for_dir
+from runtimepy.net.server.markdown import dir_state, markdown_for_dir
 
 # internal
 from tests.resources import resource
@@ -16,3 +21,28 @@ def test_markdown_for_dir():
     assert markdown_for_dir(dirs)
     assert markdown_for_dir(dirs)
     assert markdown_for_dir(dirs, extra_links={"a": ["a", "b", "c"]})
+
+
+def test_dir_state():
+    """Test that directory state tracks changes to entries."""
+
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        assert not dir_state(path)
+
+        data = path.joinpath("data.bin")
+        data.write_bytes(bytes(10))
+        state = dir_state(path)
+        assert [x[0] for x in state] == ["data.bin"]
+
+        # Growing a file in place (with the same modification time) doesn't
+        # change the directory's modification time.
+        dir_mtime = path.stat().st_mtime_ns
+        stats = data.stat()
+        with data.open("ab") as stream:
+            stream.write(bytes(10))
+        os.utime(data, ns=(stats.st_atime_ns, stats.st_mtime_ns))
+        assert path.stat().st_mtime_ns == dir_mtime
+
+        assert dir_state(path) != state
+        assert dir_state(path)[0][2] == 20
@@ -0,0 +1,201 @@
+"""
+Test the 'net.server.websocket.state' module.
+"""
+
+# built-in
+from json import dumps
+from types import SimpleNamespace
+from typing import Any
+
+# module under test
+from runtimepy.channel.environment import ChannelEnvironment
+from runtimepy.net.server.app.env.tab.message import (
+    ChannelEnvironmentTabMessaging,
+)
+from runtimepy.net.server.websocket.state import (
+    BinaryPoints,
+    TabState,
+    minmax_indices,
+)
+from runtimepy.primitives import Bool, Uint32, create
+
+# internal
+from tests.resources import benchmark
+
+
+def test_binary_points_basic():
+    """Test encoding and decoding binary channel points."""
+
+    points = BinaryPoints(capacity=16)
+    assert not points.drain()
+
+    values: dict[str, list[Any]] = {
+        "a": [1, 2, 3],
+        "b": [-1.5, 2.5],
+        "c": [-1, 1],
+    }
+    kinds = {"a": "uint32", "b": "double", "c": "int8"}
+
+    for chan_id, (name, items) in enumerate(values.items()):
+        channel = points.channel(1, chan_id, name, create(kinds[name]).kind)
+        for idx, value in enumerate(items):
+            channel.timestamps.append(idx)
+            channel.values.append(value)
+
+    size = points.size
+    assert size == 3 * 16 + 2 * 20 + 2 * 13
+
+    # The buffer grows as necessary.
+    data = points.drain()
+    assert len(data) == size
+    assert len(points.buffer) >= size
+    assert points.size == 0
+
+    # Records are contiguous.
+    assert data[:16] == b"\x00\x01\x00\x00" + bytes(8) + b"\x00\x00\x00\x01"
+
+    decoded = points.decode(data)
+    for name, items in values.items():
+        assert decoded[name] == [(x, idx) for idx, x in enumerate(items)]
+
+    # Without a data connection, points are sent with other updates.
+    state = TabState.create()
+    state.binary = points
+    points.channels[(1, 0)].timestamps.append(10)
+    points.channels[(1, 0)].values.append(5)
+    state.points["x"].append((1, 1))
+
+    result = state.frame(0.0)
+    assert result["points"] == {"a": [(5, 10)], "x": [(1, 1)]}
+    assert not state.frame(0.0)
+
+    state.clear_telemetry()
+    assert not points.channels
+
+
+def test_binary_points_benchmark():
+    """Compare binary and JSON point-streaming costs (100k points)."""
+
+    prim = create("double")
+    name = "channel"
+    frames = 10
+    count = 10000
+
+    # JSON path (point tuples and a JSON document per frame).
+    json_points: dict[str, list[tuple[Any, int]]] = {name: []}
+    json_size = 0
+
+    def json_callback(_: Any, new: Any) -> None:
+        """Add a point."""
+        json_points[name].append((new, prim.last_updated_ns))
+
+    # Binary path (columns encoded into a preallocated buffer per frame).
+    points = BinaryPoints()
+    channel = points.channel(1, 2, name, prim.kind)
+    stamps = channel.timestamps
+    values = channel.values
+    binary_size = 0
+
+    def binary_callback(_: Any, new: Any) -> None:
+        """Add a point."""
+        stamps.append(prim.last_updated_ns)
+        values.append(new)
+
+    def stream(json: bool) -> None:
+        """Stream frames of points."""
+
+        nonlocal json_size, binary_size
+
+        # Primitive-update costs are the same for both paths.
+        callback = json_callback if json else binary_callback
+
+        for _ in range(frames):
+            for idx in range(count):
+                callback(None, float(idx))
+
+            if json:
+                json_size += len(dumps(json_points).encode())
+                json_points[name] = []
+            else:
+                binary_size += len(points.drain())
+
+    benchmark("JSON points (100k)", lambda: stream(True), iterations=1)
+    benchmark("binary points (100k)", lambda: stream(False), iterations=1)
+
+    assert binary_size == frames * count * channel.codec.size
+    assert binary_size < json_size
+
+
+def test_minmax_indices():
+    """Test min/max decimation of point values."""
+
+    assert minmax_indices([1, 2, 3], 10) == [0, 1, 2]
+
+    values = [0.0] * 1000
+    values[123] = 100.0
+    values[456] = -100.0
+
+    keep = minmax_indices(values, 10)
+    assert len(keep) <= 2 * 10 + 1
+    assert keep == sorted(keep)
+    assert 123 in keep
+    assert 456 in keep
+    assert keep[-1] == 999
+
+
+def test_tab_state_decimation():
+    """Test that frames decimate points when a plot width is known."""
+
+    state = TabState.create()
+
+    channel = state.binary.channel(1, 0, "a", create("int32").kind)
+    for idx in range(1000):
+        channel.timestamps.append(idx)
+        channel.values.append(1000 if idx == 500 else idx % 7)
+        state.points["b"].append((float(idx), idx))
+        state.points["c"].append(("enum", idx))
+
+    # Decimation is disabled until a plot width is set.
+    state.set_plot_width(0)
+    assert state.buckets is None
+    state.set_plot_width(50)
+
+    points = state.frame(0.0)["points"]
+
+    assert len(points["a"]) <= 101
+    assert (1000, 500) in points["a"]
+    assert points["a"][-1] == (999 % 7, 999)
+
+    assert len(points["b"]) <= 101
+    assert points["b"][0] == (0.0, 0)
+    assert points["b"][-1] == (999.0, 999)
+
+    # Non-numeric points aren't decimated.
+    assert len(points["c"]) == 1000
+
+
+def test_tab_state_bool_points():
+    """Test that boolean channels are sent as boolean (JSON) points."""
+
+    env = ChannelEnvironment()
+    flag = Bool()
+    env.channel("flag", flag)
+    count = Uint32()
+    env.channel("count", count)
+
+    tab: Any = SimpleNamespace(command=SimpleNamespace(env=env))
+    state = TabState.create()
+    # pylint: disable=protected-access
+    setup = ChannelEnvironmentTabMessaging._setup_callback
+    for name in ["flag", "count"]:
+        setup(tab, name, state)
+
+    flag.value = True
+    count.value = 1
+
+    assert [x[0] for x in state.points["flag"]] == [False, True]
+    assert "count" not in state.points
+
+    points = state.frame(0.0)["points"]
+    assert points["flag"][-1][0] is True
+    assert points["count"][-1][0] == 1
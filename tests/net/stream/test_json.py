@@ -0,0 +1,40 @@
+"""
+Test the 'net.stream.json' module.
+"""
+
+# built-in
+from logging import getLogger
+from types import SimpleNamespace
+from typing import Any
+
+# third-party
+from pytest import mark, raises
+
+# module under test
+from runtimepy.message import MessageProcessor
+from runtimepy.net.stream.json import JsonMessageConnection
+
+
+@mark.asyncio
+async def test_json_connection_process_message():
+    """Test that only decoding errors are handled when processing messages."""
+
+    async def process_json(data: dict[str, Any], addr: Any = None) -> bool:
+        """Process a decoded message."""
+
+        del addr
+        raise ValueError(data)
+
+    conn: Any = SimpleNamespace(
+        processor=MessageProcessor(),
+        process_json=process_json,
+        logger=getLogger(__name__),
+    )
+
+    # Decode errors are logged.
+    assert await JsonMessageConnection.process_message(conn, "{hello")
+    assert await JsonMessageConnection.process_message(conn, "[1, 2]")
+
+    # Errors from message handlers aren't.
+    with raises(ValueError):
+        await JsonMessageConnection.process_message(conn, '{"a": 1}')
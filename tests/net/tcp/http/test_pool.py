@@ -0,0 +1,127 @@
+"""
+Test the 'net.tcp.http.pool' module.
+"""
+
+# built-in
+import asyncio
+import json
+from typing import AsyncIterator, Optional
+
+# third-party
+from pytest import mark, raises
+
+# module under test
+from runtimepy.net.http.header import RequestHeader
+from runtimepy.net.http.response import AsyncResponse, ResponseHeader
+from runtimepy.net.tcp.http import HttpConnection, HttpResponse, HttpResult
+from runtimepy.net.tcp.http.pool import HttpConnectionPool
+
+
+class UnknownSizeResponse(AsyncResponse):
+    """A response of unknown size."""
+
+    async def size(self) -> Optional[int]:
+        """Get this response's size."""
+        return None
+
+    async def process(self) -> AsyncIterator[bytes]:
+        """Yield chunks to write asynchronously."""
+
+        for chunk in [b"abc", b"", b"def"]:
+            await asyncio.sleep(0)
+            yield chunk
+
+
+class SampleHttpServer(HttpConnection):
+    """A sample HTTP server connection."""
+
+    async def get_handler(
+        self,
+        response: ResponseHeader,
+        request: RequestHeader,
+        request_data: Optional[bytearray],
+    ) -> HttpResult:
+        """Sample handler."""
+
+        if request.target.path == "/chunked":
+            return UnknownSizeResponse()
+
+        response["content-type"] = "application/json"
+        return json.dumps({"path": request.target.path}).encode()
+
+
+@mark.asyncio
+async def test_http_connection_pool():
+    """Test pipelined and chunked requests through a connection pool."""
+
+    stop_sig = asyncio.Event()
+    tasks: list[asyncio.Task[None]] = []
+
+    def callback(conn: SampleHttpServer) -> None:
+        """Process server connections."""
+        tasks.append(asyncio.create_task(conn.process(stop_sig=stop_sig)))
+
+    async with SampleHttpServer.serve(
+        callback, host="127.0.0.1", port=0
+    ) as server:
+        host, port = server.sockets[0].getsockname()[:2]
+
+        async with HttpConnectionPool.managed(
+            max_connections=2, max_pending=4
+        ) as pool:
+            for _ in range(2):
+                results = await asyncio.gather(
+                    *(
+                        pool.request_json(
+                            host, port, RequestHeader(target=f"/{idx}")
+                        )
+                        for idx in range(20)
+                    )
+                )
+                assert [x["path"] for x in results] == [
+                    f"/{idx}" for idx in range(20)
+                ]
+
+            # Connections are re-used.
+            conns = pool.connections[(host, port)]
+            assert 1 <= len(conns) <= 2
+            assert not any(x.pending for x in conns)
+
+            # Responses of unknown size are chunked.
+            header, payload = await pool.request(
+                host, port, RequestHeader(target="/chunked")
+            )
+            assert header.chunked
+            assert header.get("content-length") is None
+            assert payload == b"abcdef"
+
+        # Pending requests are cancelled when connections are disabled.
+        conn = await HttpConnection.create_connection(host=host, port=port)
+        async with conn.process_then_disable():
+            request = asyncio.create_task(conn.request(RequestHeader()))
+            await asyncio.sleep(0)
+            assert conn.expecting_response
+            conn.disable("test")
+
+        with raises(asyncio.CancelledError):
+            await request
+
+        # Responses without a pending request are dropped.
+        conn = await HttpConnection.create_connection(host=host, port=port)
+        async with conn.process_then_disable():
+            pending: asyncio.Future[HttpResponse] = (
+                asyncio.get_running_loop().create_future()
+            )
+            conn.pending.append(pending)
+            await asyncio.sleep(0)
+
+            response = ResponseHeader()
+            response["content-length"] = "0"
+
+            # pylint: disable=protected-access
+            await conn._process_messages(bytes(response) * 2)
+            assert pending.done()
+            assert not conn.expecting_response
+
+        stop_sig.set()
+        await asyncio.gather(*tasks)
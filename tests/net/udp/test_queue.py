@@ -10,6 +10,7 @@ from pytest import mark
 
 # module under test
 from runtimepy.net.udp import QueueUdpConnection
+from runtimepy.net.udp.connection import DatagramBatch
 
 
 @mark.asyncio
@@ -39,3 +40,51 @@ async def test_udp_queue_basic():
     sig.set()
     for task in tasks:
         await task
+
+
+class BatchQueueUdpConnection(QueueUdpConnection):
+    """A queue connection that processes datagrams in batches."""
+
+    batch_rx = True
+    batch_rx_max = 4
+
+    def init(self) -> None:
+        """Initialize this instance."""
+
+        super().init()
+        self.batches: list[int] = []
+
+    async def process_datagrams(self, batch: DatagramBatch) -> bool:
+        """Process a batch of datagrams."""
+
+        self.batches.append(len(batch))
+        return await super().process_datagrams(batch)
+
+
+@mark.asyncio
+async def test_udp_queue_batch():
+    """Test sending and receiving batches of datagrams."""
+
+    conn1, conn2 = await BatchQueueUdpConnection.create_pair()
+
+    count = 10
+    conn1.sendto_many(
+        (str(idx).encode() for idx in range(count)), addr=conn1.remote_address
+    )
+    assert conn1.metrics.tx.messages.value == count
+    assert conn1.metrics.tx.bytes.value == count
+
+    sig = asyncio.Event()
+    task = asyncio.create_task(conn2.process(stop_sig=sig))
+
+    for idx in range(count):
+        assert bytes((await conn2.datagrams.get())[0]).decode() == str(idx)
+
+    assert sum(conn2.batches) == count
+    assert max(conn2.batches) <= BatchQueueUdpConnection.batch_rx_max
+    assert conn2.metrics.rx.messages.value == count
+    assert conn2.latest_rx_address is not None
+
+    # Clean up.
+    sig.set()
+    await task
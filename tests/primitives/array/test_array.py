@@ -4,6 +4,7 @@ Test the 'primitives.array' module.
 
 # built-in
 from io import BytesIO
+from struct import pack, unpack
 from typing import cast
 
 # module under test
@@ -12,6 +13,10 @@ from runtimepy.primitives.array import PrimitiveArray
 from runtimepy.primitives.bool import Bool
 from runtimepy.primitives.float import Double, Float
 from runtimepy.primitives.int import Int32
+from runtimepy.primitives.serializable import PrefixedChunk
+
+# internal
+from tests.resources import benchmark
 
 
 def test_primitive_array_basic():
@@ -71,21 +76,27 @@ def test_primitive_array_basic():
     assert copied[1]() is False
 
 
+def sample_kinds() -> list[str]:
+    """Get the primitive kinds of the sample array."""
+
+    return [
+        "bool",  # 0
+        "bool",  # 1
+        "int16",  # 2
+        "int16",  # 3
+        "int32",  # 4
+        "int32",  # 5
+        "int64",  # 6
+        "int64",  # 7
+        "float",  # 8
+        "double",  # 9
+    ]
+
+
 def sample_array() -> PrimitiveArray:
     """Create a new, sample array for testing."""
 
-    return PrimitiveArray(
-        create("bool"),  # 0
-        create("bool"),  # 1
-        create("int16"),  # 2
-        create("int16"),  # 3
-        create("int32"),  # 4
-        create("int32"),  # 5
-        create("int64"),  # 6
-        create("int64"),  # 7
-        create("float"),  # 8
-        create("double"),  # 9
-    )
+    return PrimitiveArray(*(create(kind) for kind in sample_kinds()))
 
 
 def test_primitive_array_fragmenting_through_end():
@@ -167,16 +178,72 @@ def test_primitive_array_indexing():
         assert array.index_at_byte(array.size) == 10
 
         array.reset()
-        for item in [
-            "bool",
-            "bool",
-            "int16",
-            "int16",
-            "int32",
-            "int32",
-            "int64",
-            "int64",
-            "float",
-            "double",
-        ]:
+        for item in sample_kinds():
             array.add(create(item))
+
+
+def test_primitive_array_buffers():
+    """Test packing arrays into (and updating them from) buffers."""
+
+    src = sample_array()
+    src.randomize()
+    src.add_to_end(PrefixedChunk.create())
+    src.end.update(b"hello")
+
+    dst = src.copy()
+    dst.randomize()
+    dst.end.update(b"world!")
+    assert dst != src
+
+    # Pack into a buffer at an offset.
+    buffer = bytearray(src.length() + 4)
+    assert src.chain_pack_into(buffer, 4) == src.length()
+    assert bytes(buffer[4:]) == src.chain_bytes()
+
+    assert dst.chain_unpack_from(memoryview(buffer), 4) == src.length()
+    assert dst == src
+
+    # The compiled codec is invalidated when the array changes.
+    array = sample_array()
+    codec = array.struct
+    assert array.struct is codec
+    array.add(create("uint8"))
+    assert array.struct is not codec
+    assert array.struct.size == array.size
+
+
+def test_primitive_array_codec_benchmark():
+    """Compare the compiled-codec paths with the module-level struct calls."""
+
+    array = PrimitiveArray()
+    for _ in range(20):
+        for kind in sample_kinds():
+            array.add(create(kind))
+    assert len(list(array.iter_unpack(bytes(array)))) == 1
+    array.randomize()
+
+    fmt = array.struct.format
+    primitives = [array[idx] for idx in range(200)]
+
+    def old_bytes() -> bytes:
+        """The module-level 'pack' path."""
+        return pack(fmt, *(x.value for x in primitives))
+
+    def old_update() -> None:
+        """The module-level 'unpack' path."""
+        for primitive, item in zip(primitives, unpack(fmt, data)):
+            primitive.set_value(item)
+
+    data = bytes(array)
+    assert old_bytes() == data
+
+    buffer = bytearray(array.size)
+
+    benchmark("old pack", old_bytes)
+    benchmark("new pack", lambda: bytes(array))
+    benchmark("new pack_into", lambda: array.pack_into(buffer))
+    assert buffer == data
+
+    benchmark("old unpack", old_update)
+    benchmark("new unpack", lambda: array.update(data))
+    benchmark("new unpack_from", lambda: array.unpack_from(buffer))
@@ -0,0 +1,52 @@
+"""
+Test the 'primitives.serializable.framer' module.
+"""
+
+# module under test
+from runtimepy.primitives import create
+from runtimepy.primitives.array import PrimitiveArray
+from runtimepy.primitives.serializable.framer import SerializableFramer
+
+
+def test_serializable_framer_basic():
+    """Test basic interactions with a serializable framer."""
+
+    counter = create("uint32")
+    array = PrimitiveArray(counter, create("uint16"))
+    array.add_to_end(PrimitiveArray(create("uint8")))
+    assert array.length() == 7
+
+    framer = SerializableFramer(array, 64, buffers=2)
+    assert framer.length == 9
+
+    frames = []
+    expected = bytes()
+    for idx in range(framer.length):
+        counter.value = idx
+        expected += array.chain_bytes()
+
+        frame = framer.capture()
+        if idx < framer.length - 1:
+            assert frame is None
+        else:
+            assert frame is not None
+            frames.append(frame)
+
+    assert bytes(frames[0]) == expected
+
+    # Flush a partial frame into the other buffer.
+    counter.value = 100
+    frame = framer.capture(flush=True)
+    assert frame is not None
+    assert bytes(frame) == array.chain_bytes()
+    assert bytes(frames[0]) == expected
+
+    # Nothing to flush.
+    assert framer.capture(sample=False, flush=True) is None
+
+    # Changing the MTU re-allocates buffers.
+    assert framer.set_mtu(14) == 2
+    assert framer.capture() is None
+    frame = framer.capture()
+    assert frame is not None
+    assert bytes(frame) == array.chain_bytes() * 2
@@ -0,0 +1,117 @@
+"""
+Test the 'primitives.base' module.
+"""
+
+# built-in
+from logging import getLogger
+import tracemalloc
+from typing import Any
+
+# module under test
+from runtimepy.primitives import Primitives, create
+
+# internal
+from tests.resources import benchmark
+
+
+def test_primitive_callbacks_basic():
+    """Test registering, servicing and removing primitive callbacks."""
+
+    prim = create("uint32")
+
+    calls: list[tuple[Any, Any]] = []
+    once_calls: list[Any] = []
+
+    ident = prim.register_callback(lambda x, y: calls.append((x, y)))
+    prim.register_callback(lambda _, y: once_calls.append(y), once=True)
+
+    prim.value = 1
+    prim.value = 1
+    assert prim.set_streak == 1
+    prim.value = 2
+
+    assert calls == [(0, 1), (1, 2)]
+    assert once_calls == [1]
+    assert len(prim.callbacks) == 1
+
+    # One-time callbacks registered while servicing aren't serviced (or
+    # removed) until the next change.
+    def register(_: Any, __: Any) -> None:
+        """Register another one-time callback."""
+        prim.register_callback(lambda _, y: once_calls.append(y), once=True)
+
+    prim.register_callback(register, once=True)
+    prim.value = 3
+    assert once_calls == [1]
+    assert len(prim.callbacks) == 2
+    prim.value = 4
+    assert once_calls == [1, 4]
+    assert len(prim.callbacks) == 1
+
+    assert prim.remove_callback(ident)
+    assert not prim.remove_callback(ident)
+    prim.value = 5
+    assert calls == [(0, 1), (1, 2), (2, 3), (3, 4)]
+
+
+def set_value_benchmark(name: str, callbacks: int) -> None:
+    """Measure 'set_value' throughput for a kind of primitive."""
+
+    prim = create(name)
+
+    calls = 0
+
+    def callback(_, __) -> None:
+        """A sample callback."""
+        nonlocal calls
+        calls += 1
+
+    for _ in range(callbacks):
+        prim.register_callback(callback)
+
+    # Alternate between two values so that every call is a change.
+    values: list[Any] = [prim.value, not prim.value]
+    index = 0
+
+    def update() -> None:
+        """Change the primitive's value."""
+
+        nonlocal index
+        index ^= 1
+        prim.set_value(values[index])
+
+    benchmark(f"{name} set_value ({callbacks} callbacks)", update)
+    assert calls == callbacks * 1000
+
+
+def test_primitive_set_value_benchmark():
+    """Measure 'set_value' throughput for each kind of primitive."""
+
+    for name in Primitives:
+        for callbacks in [0, 1, 10]:
+            set_value_benchmark(name, callbacks)
+
+
+def test_primitive_compact():
+    """Test that primitives don't carry per-instance dictionaries."""
+
+    for name in Primitives:
+        prim = create(name)
+        assert not hasattr(prim, "__dict__")
+        assert not prim.callbacks
+
+        with prim.callback(lambda _, __: None):
+            assert len(prim.callbacks) == 1
+        assert not prim.callbacks
+
+    count = 10000
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        prims = [create("uint32") for _ in range(count)]
+        size = (tracemalloc.get_traced_memory()[0] - start) // count
+    finally:
+        tracemalloc.stop()
+
+    assert len(prims) == count
+    getLogger(__name__).info("%d bytes per primitive.", size)
@@ -4,12 +4,15 @@ A module for working with test data.
 
 # built-in
 import asyncio
+from logging import getLogger
 from pathlib import Path
-from typing import Awaitable, Optional, TypeVar
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 # third-party
 from vcorelib.asyncio import new_eloop, run_handle_interrupt
 from vcorelib.io import BinaryMessage
+from vcorelib.math import nano_str
 from vcorelib.platform import is_windows
 
 # internal
@@ -146,3 +149,25 @@ def run_async_test(
     # Always use a fresh event loop.
     new_eloop()
     return run_handle_interrupt(asyncio.wait_for(to_run, timeout))
+
+
+def benchmark(
+    name: str, func: Callable[[], Any], iterations: int = 1000
+) -> float:
+    """
+    Call a function repeatedly, log the average duration of each call and
+    return it (in nanoseconds).
+    """
+
+    start = perf_counter_ns()
+    for _ in range(iterations):
+        func()
+    result = (perf_counter_ns() - start) / iterations
+
+    getLogger(__name__).info(
+        "%s: %ss per call (%d iterations).",
+        name,
+        nano_str(int(result)),
+        iterations,
+    )
+    return result
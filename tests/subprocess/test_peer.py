@@ -3,6 +3,7 @@ Test the 'subprocess.peer' module.
 """
 
 # built-in
+import asyncio
 from sys import executable
 
 # third-party
@@ -12,11 +13,26 @@ from vcorelib.io import DEFAULT_INCLUDES_KEY
 # module under test
 from runtimepy.channel.environment.command import clear_env
 from runtimepy.sample.peer import SamplePeer
+from runtimepy.subprocess.peer import drain_queue
 
 # internal
 from tests.subprocess.test_manager import TEST_PROGRAM
 
 
+@mark.asyncio
+async def test_drain_queue():
+    """Test combining data that's available from a queue."""
+
+    queue: asyncio.Queue[bytes] = asyncio.Queue()
+    assert drain_queue(queue) == b""
+    assert drain_queue(queue, b"a") == b"a"
+
+    for item in [b"b", b"", b"c"]:
+        queue.put_nowait(item)
+    assert drain_queue(queue, b"a") == b"abc"
+    assert queue.empty()
+
+
 @mark.asyncio
 async def test_subprocess_peer_basic():
     """Test basic interactions with the subprocess peer interface."""
@@ -0,0 +1,212 @@
+"""
+Test the 'subprocess.program' module.
+"""
+
+# built-in
+import asyncio
+from contextlib import AsyncExitStack
+from io import BufferedReader, BytesIO, RawIOBase
+from logging import getLogger
+import os
+from tempfile import TemporaryFile
+from time import perf_counter_ns
+from typing import AsyncIterator
+
+# third-party
+from pytest import mark
+from vcorelib.math import nano_str
+
+# module under test
+from runtimepy.channel.environment.command import clear_env
+from runtimepy.message import MessageProcessor
+from runtimepy.metrics.channel import ChannelMetrics
+from runtimepy.subprocess.program import PeerProgram
+
+
+def create_program(name: str, output: int) -> PeerProgram:
+    """Create a peer program that writes to a file descriptor."""
+
+    program = PeerProgram(name, {})
+    program.json_output = os.fdopen(output, "wb")
+    program.got_eof = asyncio.Event()
+    program.stream_metrics = ChannelMetrics()
+    return program
+
+
+async def connected_programs(
+    stack: AsyncExitStack,
+) -> AsyncIterator[PeerProgram]:
+    """Create two peer programs that communicate via pipes."""
+
+    first_read, first_write = os.pipe()
+    second_read, second_write = os.pipe()
+
+    for name, read, write in [
+        ("first", first_read, second_write),
+        ("second", second_read, first_write),
+    ]:
+        program = create_program(name, write)
+
+        task = asyncio.create_task(program.io_task(os.fdopen(read, "rb")))
+
+        async def stop(task: asyncio.Task[None]) -> None:
+            """Stop a program's input processing."""
+            task.cancel()
+            await task
+
+        stack.push_async_callback(stop, task)
+        stack.callback(program.json_output.close)
+
+        yield program
+
+
+def log_result(name: str, duration_ns: int, count: int) -> None:
+    """Log a benchmark result."""
+
+    getLogger(__name__).info(
+        "%s: %ss per message (%d messages).",
+        name,
+        nano_str(duration_ns // count),
+        count,
+    )
+
+
+@mark.asyncio
+async def test_peer_program_benchmark():
+    """Measure messaging latency and throughput between peer programs."""
+
+    clear_env()
+
+    async with AsyncExitStack() as stack:
+        first, second = [x async for x in connected_programs(stack)]
+
+        # Round-trip latency.
+        count = 100
+        start = perf_counter_ns()
+        for _ in range(count):
+            assert await first.loopback()
+        log_result("peer round trip", perf_counter_ns() - start, count)
+
+        # Throughput (concurrent requests).
+        start = perf_counter_ns()
+        assert all(
+            await asyncio.gather(*(first.loopback() for _ in range(count)))
+        )
+        log_result("peer throughput", perf_counter_ns() - start, count)
+
+        assert second.stdin_metrics.bytes.value > 0
+
+    clear_env()
+
+
+@mark.asyncio
+async def test_peer_program_shared_memory():
+    """Test sharing a peer program's channel values via shared memory."""
+
+    clear_env()
+
+    async with AsyncExitStack() as stack:
+        first, second = [x async for x in connected_programs(stack)]
+        await first.share_environment()
+        assert first.peer is not None
+
+        second.struct.config["shared_memory"] = True
+        with second.streaming_events():
+            await first.wait_json()
+            assert first.shared is not None
+            assert first.poll_shared() > 0
+
+            second.struct.env.set("cpu_percent", 1.5)
+            assert first.poll_shared() == 1
+            assert first.peer.env.value("cpu_percent") == 1.5
+
+        first.close_shared()
+        assert first.shared is None
+        assert first.poll_shared() == 0
+
+    clear_env()
+
+
+@mark.asyncio
+async def test_peer_program_file_input():
+    """Test processing input from a regular file."""
+
+    clear_env()
+
+    read, write = os.pipe()
+    program = create_program("file", write)
+
+    with BytesIO() as encoded:
+        MessageProcessor().encode_json(encoded, {"loopback": {"a": 1}})
+        data = encoded.getvalue()
+
+    with TemporaryFile() as stream:
+        stream.write(data)
+        stream.seek(0)
+
+        await program.io_task(stream)
+
+    assert program.got_eof.is_set()
+    assert program.stdin_metrics.bytes.value == len(data)
+
+    program.json_output.close()
+    with os.fdopen(read, "rb") as output:
+        assert output.read()
+
+    clear_env()
+
+
+class PipeInput(RawIOBase):
+    """A pipe-backed stream that can't be read via the event loop."""
+
+    def __init__(self, fd: int) -> None:
+        """Initialize this instance."""
+        self.fd = fd
+
+    def readable(self) -> bool:
+        """Determine if this stream is readable."""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Read into a buffer."""
+
+        data = os.read(self.fd, len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+@mark.asyncio
+async def test_peer_program_stream_input():
+    """Test processing input from a stream (without end-of-file)."""
+
+    clear_env()
+
+    read, write = os.pipe()
+    program = create_program("stream", write)
+
+    input_read, input_write = os.pipe()
+    task = asyncio.create_task(
+        program.io_task(BufferedReader(PipeInput(input_read)))
+    )
+
+    with BytesIO() as encoded:
+        MessageProcessor().encode_json(encoded, {"loopback": {"a": 1}})
+        os.write(input_write, encoded.getvalue())
+
+    # A response is sent before input is closed.
+    try:
+        response = await asyncio.wait_for(
+            asyncio.to_thread(os.read, read, 1024), 5.0
+        )
+    finally:
+        os.close(input_write)
+        await task
+        program.json_output.close()
+
+    assert response
+    assert program.got_eof.is_set()
+
+    os.close(read)
+    os.close(input_read)
+
+    clear_env()
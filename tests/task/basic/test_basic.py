@@ -28,6 +28,11 @@ async def test_periodic_task_overrun():
     assert await task.wait_for_disable(0)
     assert task.metrics.overruns.value > 0
 
+    # Long stalls (many missed deadlines) don't wrap the counter.
+    task.metrics.overruns.value = 2**16 - 1
+    task.metrics.overruns.value += 5
+    assert task.metrics.overruns.value == 2**16 + 4
+
 
 @mark.asyncio
 async def test_periodic_task_basic():
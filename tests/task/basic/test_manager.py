@@ -6,13 +6,14 @@ Test the 'runtimepy.task.basic.manager' module.
 import asyncio
 
 # third-party
-from pytest import mark
+from pytest import approx, mark
 
 # module under test
-from runtimepy.task import PeriodicTaskManager
+from runtimepy.task import PeriodicTask, PeriodicTaskManager
+from runtimepy.task.basic.manager import due_ticks
 
 # internal
-from tests.resources import SampleTask
+from tests.resources import OverrunTask, SampleTask
 
 
 class Manager(PeriodicTaskManager[SampleTask]):
@@ -33,3 +34,187 @@ async def test_periodic_task_manager_basic():
 
     async with manager.running():
         await asyncio.sleep(base_period * 2)
+
+
+class CountTask(PeriodicTask):
+    """A task that counts its own iterations."""
+
+    ticks: list[float]
+    limit = 0
+
+    def _init_state(self) -> None:
+        """Add channels to this instance's channel environment."""
+        self.ticks = []
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+
+        self.ticks.append(asyncio.get_running_loop().time())
+        return not self.limit or len(self.ticks) < self.limit
+
+
+def test_rate_group_basic():
+    """Test harmonic grouping of periodic tasks."""
+
+    assert due_ticks(1, 3, 0, 1) == 2
+    assert due_ticks(1, 9, 0, 4) == 2
+    assert due_ticks(1, 9, 1, 4) == 2
+    assert due_ticks(2, 5, 1, 4) == 0
+
+    manager: PeriodicTaskManager[CountTask] = PeriodicTaskManager()
+    for name, period_s in [
+        ("a", 0.02),
+        ("b", 0.01),
+        ("c", 0.04),
+        ("d", 0.015),
+        ("e", 0.045),
+    ]:
+        assert manager.register(CountTask(name), period_s=period_s)
+
+    groups = manager.rate_groups()
+    assert [x.period_s for x in groups] == approx([0.01, 0.015])
+    assert [[y[0].name for y in x.members] for x in groups] == [
+        ["b", "a", "c"],
+        ["d", "e"],
+    ]
+    assert [groups[0].ticks(x[0]) for x in groups[0].members] == [1, 2, 4]
+    assert groups[1].ticks(manager["e"]) == 3
+
+
+@mark.asyncio
+async def test_periodic_task_manager_shared_timer():
+    """Test dispatching periodic tasks from shared timers."""
+
+    base_period = 0.01
+
+    manager: PeriodicTaskManager[CountTask] = PeriodicTaskManager(
+        shared_timer=True
+    )
+
+    assert manager.register(CountTask("fast"), period_s=base_period)
+    assert manager.register(
+        CountTask("slow"), period_s=base_period * 4, phase_s=base_period * 2
+    )
+
+    limited = CountTask("limited")
+    limited.limit = 2
+    assert manager.register(limited, period_s=base_period * 2)
+
+    async with manager.running():
+        await asyncio.sleep(base_period * 20)
+
+        # Each group has a single timer.
+        assert len(manager._groups) == 1  # pylint: disable=protected-access
+
+    fast = manager["fast"].ticks
+    slow = manager["slow"].ticks
+    assert len(fast) >= 10
+    assert len(slow) >= 2
+
+    # The slow task is offset by its phase and dispatched with the fast task.
+    assert slow[0] - fast[0] >= base_period * 1.5
+    assert all(min(abs(x - y) for y in fast) < base_period / 2 for x in slow)
+
+    # Tasks that disable themselves are dropped from their group.
+    assert len(limited.ticks) == 2
+
+    for task in manager.tasks:
+        assert not await task.wait_iterations(0.0)
+
+
+@mark.asyncio
+async def test_periodic_task_manager_shared_overruns():
+    """Test that shared-timer tasks count missed deadlines."""
+
+    manager: PeriodicTaskManager[PeriodicTask] = PeriodicTaskManager(
+        shared_timer=True
+    )
+
+    task = OverrunTask("overrun")
+    assert manager.register(task, period_s=0.01)
+
+    async with manager.running():
+        await asyncio.sleep(0.1)
+
+    assert task.metrics.overruns.value > 0
+
+
+class FailTask(CountTask):
+    """A task that raises an exception."""
+
+    async def dispatch(self) -> bool:
+        """Dispatch an iteration of this task."""
+
+        await super().dispatch()
+        raise RuntimeError("Dispatch failed!")
+
+
+@mark.asyncio
+async def test_periodic_task_manager_shared_failures():
+    """Test that a failing task doesn't stop the rest of its group."""
+
+    manager: PeriodicTaskManager[CountTask] = PeriodicTaskManager(
+        shared_timer=True
+    )
+
+    healthy = CountTask("healthy")
+    failing = FailTask("failing")
+    assert manager.register(healthy, period_s=0.01)
+    assert manager.register(failing, period_s=0.01)
+
+    async with manager.running():
+        assert await healthy.wait_iterations(1.0, count=5)
+        assert not await failing.wait_iterations(0.0)
+
+        # pylint: disable=protected-access
+        assert not manager._groups[0].done()
+
+    assert len(failing.ticks) == 1
+    assert not await healthy.wait_iterations(0.0)
+
+
+@mark.asyncio
+async def test_periodic_task_manager_shared_period_change():
+    """Test run-time period changes that are no longer harmonic."""
+
+    manager: PeriodicTaskManager[CountTask] = PeriodicTaskManager(
+        shared_timer=True
+    )
+
+    base = CountTask("base")
+    task = CountTask("task")
+    assert manager.register(base, period_s=0.02)
+    assert manager.register(task, period_s=0.04)
+
+    async with manager.running():
+        assert await task.wait_iterations(1.0)
+
+        # pylint: disable=protected-access
+        assert len(manager._groups) == 1
+
+        # The task is moved to a new group (instead of being rounded to the
+        # original group's period).
+        task.period_s.value = 0.005
+        assert await task.wait_iterations(1.0)
+        assert len(manager._groups) == 2
+
+        start = len(task.ticks)
+        await asyncio.sleep(0.1)
+        assert len(task.ticks) - start > 10
+
+        # Tasks can also run without a period.
+        task.period_s.value = 0.0
+        assert await task.wait_iterations(1.0, count=10)
+        assert len(manager._groups) == 3
+
+        assert await base.wait_iterations(1.0)
+
+    for item in manager.tasks:
+        assert not await item.wait_iterations(0.0)
+
+    # Tasks without a period are only grouped with each other.
+    groups = manager.rate_groups()
+    assert [x.period_s for x in groups] == approx([0.0, 0.02])
+    assert groups[0].accepts(0.0)
+    assert not groups[1].accepts(0.0)
+    assert groups[1].ticks(task) == 1
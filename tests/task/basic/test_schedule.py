@@ -0,0 +1,117 @@
+"""
+Test the 'task.basic.schedule' module.
+"""
+
+# built-in
+import asyncio
+from logging import getLogger
+
+# third-party
+from pytest import mark
+
+# module under test
+from runtimepy.task.basic.schedule import CatchUp, DeadlineSchedule
+
+# internal
+from tests.resources import SampleTask
+
+
+def test_deadline_schedule_policies():
+    """Test advancing deadlines with each catch-up policy."""
+
+    for policy in CatchUp:
+        schedule = DeadlineSchedule(policy)
+        schedule.start(10.0)
+
+        # On-time iterations don't drift.
+        assert schedule.advance(10.25, 1.0) == (0.75, 0)
+        assert schedule.woke(11.1)
+        assert schedule.advance(11.5, 1.0) == (0.5, 0)
+        assert schedule.deadline == 12.0
+
+        # Miss the next two deadlines.
+        sleep_s, missed = schedule.advance(14.5, 1.0)
+
+        if policy is CatchUp.SKIP:
+            assert (sleep_s, missed) == (0.5, 2)
+            assert schedule.deadline == 15.0
+        elif policy is CatchUp.BURST:
+            assert (sleep_s, missed) == (0.0, 1)
+            assert schedule.deadline == 13.0
+            assert schedule.advance(14.625, 1.0) == (0.0, 1)
+            assert schedule.advance(14.75, 1.0) == (0.25, 0)
+        else:
+            assert (sleep_s, missed) == (0.0, 1)
+            assert schedule.deadline == 14.5
+            assert schedule.advance(14.625, 1.0) == (0.875, 0)
+
+    # Tasks without a period run back-to-back.
+    schedule = DeadlineSchedule()
+    schedule.start(1.0)
+    assert schedule.advance(2.5, 0.0) == (0.0, 0)
+    assert schedule.deadline == 2.5
+    assert schedule.advance(3.0, 1.0) == (0.5, 0)
+
+
+def test_deadline_schedule_lateness():
+    """Test wake-up lateness statistics."""
+
+    schedule = DeadlineSchedule(depth=100)
+    schedule.start(0.0)
+
+    for idx in range(1000):
+        schedule.advance(schedule.deadline, 1.0)
+        updated = schedule.woke(schedule.deadline + (idx % 100) / 1024)
+        assert updated == ((idx + 1) % 100 == 0 or idx < 99)
+
+    assert schedule.lateness_p50_s == 50 / 1024
+    assert schedule.lateness_p99_s == 99 / 1024
+
+    # Early wake-ups count as on-time.
+    schedule.woke(schedule.deadline - 1.0)
+    assert schedule.lateness[0] == 0.0
+
+
+@mark.asyncio
+async def test_periodic_task_deadlines():
+    """Test that a periodic task runs at its configured rate."""
+
+    period_s = 0.002
+    duration_s = 0.5
+
+    task = SampleTask("sample", catch_up="skip")
+    await task.task(period_s=period_s)
+    await asyncio.sleep(duration_s)
+    await task.stop()
+
+    metrics = task.metrics
+    expected = duration_s / period_s
+
+    getLogger(__name__).info(
+        "%d dispatches (%d expected), %d overruns, "
+        "lateness p50: %.1fus, p99: %.1fus.",
+        metrics.dispatches.value,
+        expected,
+        metrics.overruns.value,
+        metrics.lateness_p50_s.value * 1e6,
+        metrics.lateness_p99_s.value * 1e6,
+    )
+
+    # Missed deadlines are skipped (and counted).
+    assert metrics.dispatches.value + metrics.overruns.value >= expected * 0.9
+    assert metrics.lateness_p99_s.value >= metrics.lateness_p50_s.value
+
+
+@mark.asyncio
+async def test_periodic_task_zero_period():
+    """Test that a periodic task keeps running if its period is zeroed."""
+
+    task = SampleTask("sample")
+    await task.task(period_s=0.01)
+    assert await task.wait_iterations(1.0)
+
+    # The UI's period control allows zero.
+    task.period_s.value = 0.0
+    assert await task.wait_iterations(1.0, count=10)
+    await task.stop()
+    assert not task.metrics.overruns.value